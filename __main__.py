@@ -0,0 +1,6 @@
+"""Run the Blauberg Vento command line client: python -m blauberg_vento"""
+import sys
+
+from .cli import main
+
+sys.exit(main())
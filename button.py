@@ -6,44 +6,25 @@ from homeassistant.components.button import ButtonEntity
 from datetime import datetime
 
 from .const import DOMAIN
+from .entity import BlaubergVentoEntity, device_info_for
 
 
-class BlaubergVentoSyncTimeButton(ButtonEntity):
+class BlaubergVentoSyncTimeButton(BlaubergVentoEntity, ButtonEntity):
     """Button to sync Home Assistant time with the fan's internal RTC."""
 
-    def __init__(self, api, device_info):
-        self._api = api
+    def __init__(self, coordinator, device_info):
+        super().__init__(coordinator, device_info_for(device_info["device_id"]))
         self._attr_name = "Sync Time"
         self._attr_unique_id = f"{device_info['device_id']}_sync_time"
         self._attr_icon = "mdi:clock-check-outline"
         self._attr_entity_category = EntityCategory.CONFIG
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_info["device_id"])},
-        }
 
     async def async_press(self) -> None:
         """Handle the button press."""
         now = datetime.now()
-        # Format data for your fan API
-        hour = now.hour
-        minute = now.minute
-        second = now.second
-        day = now.day
-        day_of_week = now.isoweekday()
-        month = now.month
-        year = now.year
 
         try:
-            await self.hass.async_add_executor_job(
-                self._api.set_date_and_time,
-                year,
-                month,
-                day,
-                day_of_week,
-                hour,
-                minute,
-                second,
-            )
+            await self.coordinator.async_run(self._api.sync_time, now)
 
             self._attr_icon = "mdi:clock-check"  # optionally change icon after press
 
@@ -58,18 +39,15 @@ class BlaubergVentoSyncTimeButton(ButtonEntity):
             self.async_write_ha_state()
 
 
-class BlaubergVentoResetAlarmButton(ButtonEntity):
+class BlaubergVentoResetAlarmButton(BlaubergVentoEntity, ButtonEntity):
     """Button to reset fan's alarm"""
 
-    def __init__(self, api, device_info):
-        self._api = api
+    def __init__(self, coordinator, device_info):
+        super().__init__(coordinator, device_info_for(device_info["device_id"]))
         self._attr_name = "Reset Alarm"
         self._attr_unique_id = f"{device_info['device_id']}_reset_alarm"
         self._attr_icon = "mdi:alert-circle-check-outline"
         self._attr_entity_category = EntityCategory.CONFIG
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_info["device_id"])},
-        }
 
     async def async_press(self) -> None:
         """Handle the button press."""
@@ -77,7 +55,7 @@ class BlaubergVentoResetAlarmButton(ButtonEntity):
         try:
             self._attr_icon = "mdi:progress-wrench"
 
-            await self.hass.async_add_executor_job(self._api.reset_alarm_status)
+            await self.coordinator.async_run(self._api.reset_alarm_status)
 
             self._attr_icon = (
                 "mdi:alert-circle-check-outline"  # optionally change icon after press
@@ -90,18 +68,15 @@ class BlaubergVentoResetAlarmButton(ButtonEntity):
             self.async_write_ha_state()
 
 
-class BlaubergVentoResetFilterReplacementResetButton(ButtonEntity):
+class BlaubergVentoResetFilterReplacementResetButton(BlaubergVentoEntity, ButtonEntity):
     """Button to reset fan's alarm"""
 
-    def __init__(self, api, device_info):
-        self._api = api
+    def __init__(self, coordinator, device_info):
+        super().__init__(coordinator, device_info_for(device_info["device_id"]))
         self._attr_name = "Reset filter replacement"
         self._attr_unique_id = f"{device_info['device_id']}_reset_filter_replacement"
         self._attr_icon = "mdi:restore"
         self._attr_entity_category = EntityCategory.CONFIG
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_info["device_id"])},
-        }
 
     async def async_press(self) -> None:
         """Handle the button press."""
@@ -109,7 +84,9 @@ class BlaubergVentoResetFilterReplacementResetButton(ButtonEntity):
         try:
             self._attr_icon = "mdi:restore"
 
-            await self.hass.async_add_executor_job(self._api.reset_filter_replacement)
+            await self.coordinator.async_run(self._api.reset_filter_replacement)
+            # Read the new countdown with the next (debounced) poll
+            await self.coordinator.async_request_refresh()
 
             self._attr_icon = "mdi:restore"
 
@@ -120,23 +97,40 @@ class BlaubergVentoResetFilterReplacementResetButton(ButtonEntity):
             self.async_write_ha_state()
 
 
+class BlaubergVentoSpeedStepButton(BlaubergVentoEntity, ButtonEntity):
+    """Button to step fan speed up or down in one atomic round trip"""
+
+    def __init__(self, coordinator, device_info, up: bool):
+        super().__init__(coordinator, device_info_for(device_info["device_id"]))
+        self._up = up
+        direction = "up" if up else "down"
+        self._attr_name = f"Speed {direction}"
+        self._attr_unique_id = f"{device_info['device_id']}_speed_{direction}"
+        self._attr_icon = "mdi:fan-plus" if up else "mdi:fan-minus"
+
+    async def async_press(self) -> None:
+        """Handle the button press."""
+        await self.coordinator.async_run(self._api.step_speed, self._up)
+        # The reply carries the new speed - push it to the fan entity
+        self.coordinator.async_update_listeners()
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ):
     """Set up Blauberg Vento sensors."""
-    api = hass.data[DOMAIN][entry.entry_id]
+    coordinator = hass.data[DOMAIN][entry.entry_id]
     device_id = entry.data.get("device_id", "unknown")
 
     # Add your device ID sensor (and others in the future)
     async_add_entities(
         [
-            BlaubergVentoSyncTimeButton(api, {"device_id": device_id}),
-            BlaubergVentoResetAlarmButton(api, {"device_id": device_id}),
-            BlaubergVentoResetFilterReplacementResetButton(
-                api, {"device_id": device_id}
-            ),
+            BlaubergVentoSyncTimeButton(coordinator, {"device_id": device_id}),
+            BlaubergVentoResetAlarmButton(coordinator, {"device_id": device_id}),
+            BlaubergVentoResetFilterReplacementResetButton(coordinator, {"device_id": device_id}),
+            BlaubergVentoSpeedStepButton(coordinator, {"device_id": device_id}, True),
+            BlaubergVentoSpeedStepButton(coordinator, {"device_id": device_id}, False),
         ],
-        True,
     )
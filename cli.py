@@ -0,0 +1,236 @@
+"""
+Command line client for Blauberg Vento units.
+
+    python -m blauberg_vento scan
+    python -m blauberg_vento read HOST 0x0001 0x0025
+    python -m blauberg_vento write HOST fan_speed_treshold=2 0x00B7=1
+    python -m blauberg_vento dump HOST
+    python -m blauberg_vento monitor HOST [HOST ...] --interval 5 [--changes] [--metrics-port 9797]
+
+Every command prints JSON; scan and monitor stream one JSON object per line.
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import json
+import sys
+import threading
+import time
+
+from .const import DEFAULT_DEVICE_ID, DEFAULT_PORT, DEFAULT_PASSWORD
+from .fan_api import BlaubergVentoApi, BlaubergVentoError
+from .exporter import OpenMetricsExporter
+from .registers import COMMON_REGISTERS
+
+# Registers polled by `monitor` unless --params is given
+MONITOR_REFRESH_CLASSES = ("status", "diagnostic")
+
+
+def _param_id(value: str, functions=COMMON_REGISTERS) -> int:
+    """Parameter ID from decimal, hex ("0x0025") or register name."""
+    for register in functions.values():
+        if register.name == value:
+            return register.param_id
+    try:
+        return int(value, 0)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"unknown parameter {value}") from None
+
+
+def _value(value: str):
+    """Ints where possible, otherwise the string for the register's encoder."""
+    try:
+        return int(value, 0)
+    except ValueError:
+        return value
+
+
+def _named(values: dict, functions) -> dict:
+    """{param_id: value} -> {register name or hex ID: JSON friendly value}"""
+    named = {}
+    for param, value in sorted(values.items()):
+        register = functions.get(param)
+        key = register.name if register is not None else f"0x{param:04X}"
+        named[key] = value.hex(" ") if isinstance(value, bytes) else value
+    return named
+
+
+_PRINT_LOCK = threading.Lock()
+
+
+def _print(obj):
+    line = json.dumps(obj) + "\n"
+    with _PRINT_LOCK:
+        sys.stdout.write(line)
+        sys.stdout.flush()
+
+
+def _api(args, host, identify=True) -> BlaubergVentoApi:
+    api = BlaubergVentoApi(
+        host,
+        port=args.port,
+        name=host,
+        device_id=args.device_id,
+        password=args.password,
+    )
+    api.timeout = args.timeout
+    if identify:
+        _identify(api)
+    return api
+
+
+def _identify(api):
+    """Learn the real device ID and unit type first, some units insist on it."""
+    if api.device_id == DEFAULT_DEVICE_ID:
+        api.read_parameters([api.FUNCTION_DEVICE_ID, api.FUNCTION_UNIT_TYPE])
+
+
+def cmd_scan(args):
+    for unit in BlaubergVentoApi.discover(
+        args.broadcast, port=args.port, password=args.password, timeout=args.timeout
+    ):
+        _print(unit)
+
+
+def cmd_read(args):
+    api = _api(args, args.host)
+    _print(_named(api.read_parameters(args.params), api.functions))
+
+
+def cmd_write(args):
+    api = _api(args, args.host)
+    values = {}
+    for item in args.values:
+        param, _, value = item.partition("=")
+        values[_param_id(param, api.functions)] = _value(value)
+    _print(_named(api.write_parameters(values), api.functions))
+
+
+def cmd_dump(args):
+    api = _api(args, args.host)
+    _print(_named(api.read_all_registers(), api.functions))
+
+
+def cmd_monitor(args):
+    # Identified on their first poll, so one dead host doesn't hold up the others
+    apis = [_api(args, host, identify=False) for host in args.hosts]
+
+    def _params(api):
+        if args.params:
+            return args.params
+        return [
+            param
+            for param, register in api.functions.items()
+            if register.refresh in MONITOR_REFRESH_CLASSES
+        ]
+
+    def _poll(api):
+        started = time.monotonic()
+        snapshot = {"ts": round(time.time(), 3), "host": api.host, "device_id": api.device_id}
+        try:
+            _identify(api)
+            # Every cycle asks the unit, never the read-through cache
+            snapshot["values"] = _named(api.read_parameters(_params(api), max_age=0), api.functions)
+        except (TimeoutError, OSError) as err:
+            snapshot["error"] = str(err) or type(err).__name__
+        # Learned on the first successful poll
+        snapshot["device_id"] = api.device_id
+        snapshot["latency_ms"] = round((time.monotonic() - started) * 1000, 1)
+        return snapshot
+
+    if args.changes:
+        # Print only what changed, straight from each response
+        for api in apis:
+            def _changed(values, api=api):
+                _print({
+                    "ts": round(time.time(), 3),
+                    "host": api.host,
+                    "device_id": api.device_id,
+                    "changes": _named(values, api.functions),
+                })
+
+            api.subscribe(_params(api), _changed, coalesce=True)
+
+    exporter = None
+    if args.metrics_port:
+        # Scrapes render the snapshots this loop already fetched
+        exporter = OpenMetricsExporter(apis, port=args.metrics_port)
+        exporter.start()
+
+    try:
+        _monitor_loop(args, apis, _poll)
+    finally:
+        if exporter is not None:
+            exporter.stop()
+
+
+def _monitor_loop(args, apis, poll):
+    cycle = 0
+    with ThreadPoolExecutor(max_workers=args.parallel) as executor:
+        while args.count is None or cycle < args.count:
+            started = time.monotonic()
+            for snapshot in executor.map(poll, apis):
+                if not args.changes or "error" in snapshot:
+                    _print(snapshot)
+            cycle += 1
+            if args.count is not None and cycle >= args.count:
+                break
+            time.sleep(max(0.0, args.interval - (time.monotonic() - started)))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m blauberg_vento", description="Blauberg Vento client")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--device-id", default=DEFAULT_DEVICE_ID)
+    parser.add_argument("--password", default=DEFAULT_PASSWORD)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    # Options of the commands that talk to one unit at a time
+    device = argparse.ArgumentParser(add_help=False)
+    device.add_argument(
+        "--timeout", type=float, default=BlaubergVentoApi.REQUEST_TIMEOUT, help="seconds to wait for a reply"
+    )
+
+    scan = commands.add_parser("scan", help="discover units with a broadcast search")
+    scan.add_argument("--broadcast", default="255.255.255.255")
+    scan.add_argument("--timeout", type=float, default=2.0)
+    scan.set_defaults(func=cmd_scan)
+
+    read = commands.add_parser("read", parents=[device], help="read parameters")
+    read.add_argument("host")
+    read.add_argument("params", nargs="+", type=_param_id)
+    read.set_defaults(func=cmd_read)
+
+    write = commands.add_parser("write", parents=[device], help="write parameters (PARAM=VALUE)")
+    write.add_argument("host")
+    write.add_argument("values", nargs="+")
+    write.set_defaults(func=cmd_write)
+
+    dump = commands.add_parser("dump", parents=[device], help="read the full register map")
+    dump.add_argument("host")
+    dump.set_defaults(func=cmd_dump)
+
+    monitor = commands.add_parser("monitor", parents=[device], help="poll hosts and stream JSON lines")
+    monitor.add_argument("hosts", nargs="+")
+    monitor.add_argument("--params", nargs="+", type=_param_id)
+    monitor.add_argument("--interval", type=float, default=5.0)
+    monitor.add_argument("--count", type=int, default=None)
+    monitor.add_argument("--parallel", type=int, default=8)
+    monitor.add_argument("--changes", action="store_true", help="print only values that changed")
+    monitor.add_argument("--metrics-port", type=int, default=None, help="also serve OpenMetrics on this port")
+    monitor.set_defaults(func=cmd_monitor)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        args.func(args)
+    except (TimeoutError, OSError, ValueError, TypeError, OverflowError, BlaubergVentoError) as err:
+        # Unreachable unit, a value that doesn't encode, or a write the unit rejected
+        _print({"error": str(err) or type(err).__name__})
+        return 1
+    except KeyboardInterrupt:
+        pass
+    return 0
@@ -3,14 +3,42 @@ _LOGGER = logging.getLogger(__name__)
 
 import voluptuous as vol
 from homeassistant import config_entries
-from .const import DOMAIN, DEFAULT_PORT, DEFAULT_DEVICE_ID, DEFAULT_PASSWORD
+from homeassistant.core import callback
+from .const import (
+    DOMAIN,
+    DEFAULT_PORT,
+    DEFAULT_DEVICE_ID,
+    DEFAULT_PASSWORD,
+    CONF_HUMIDITY_BOOST,
+    CONF_BOOST_THRESHOLD,
+    CONF_BOOST_HYSTERESIS,
+    CONF_BOOST_SPEED,
+    CONF_BOOST_MIN_ON_TIME,
+    CONF_BOOST_COOLDOWN,
+    DEFAULT_BOOST_THRESHOLD,
+    DEFAULT_BOOST_HYSTERESIS,
+    DEFAULT_BOOST_SPEED,
+    DEFAULT_BOOST_MIN_ON_TIME,
+    DEFAULT_BOOST_COOLDOWN,
+    CONF_RTC_SYNC_THRESHOLD,
+    DEFAULT_RTC_SYNC_THRESHOLD,
+    CONF_MANUAL_SPEED,
+    CONF_RAMP_INTERVAL,
+    CONF_RAMP_STEP,
+)
 from .fan_api import BlaubergVentoApi
+from .ramp import DEFAULT_RAMP_INTERVAL, DEFAULT_RAMP_STEP
 
 class BlaubergVentoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Blauberg Vento fans."""
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        return BlaubergVentoOptionsFlow(config_entry)
+
     async def async_step_user(self, user_input=None):
         errors = {}
 
@@ -23,11 +51,13 @@ class BlaubergVentoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 password=user_input["password"],
             )
             try:
-                await self.hass.async_add_executor_job(api.get_device_info)
-                await self.hass.async_add_executor_job(api.get_firmware_version)
+                # One frame with identity, firmware and network settings
+                await self.hass.async_add_executor_job(api.probe)
             except Exception as e:
                 _LOGGER.warning("Connection failed: %s", e)
                 errors["base"] = "cannot_connect"
+            finally:
+                api.close()
 
             # --- Connection validation logic ---
             if api.device_id == DEFAULT_DEVICE_ID and user_input["device_id"] == DEFAULT_DEVICE_ID:
@@ -50,6 +80,7 @@ class BlaubergVentoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self._abort_if_unique_id_configured()
             user_input["device_id"] = api.device_id
             user_input["device_model_id"] = api.device_model_id
+            user_input["probe"] = api.export_raw(api.PROBE_PARAMS)
             _LOGGER.debug("User added Blauberg Vento device: %s", user_input)
 
             return self.async_create_entry(title=user_input["name"], data=user_input)
@@ -70,4 +101,33 @@ class BlaubergVentoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             vol.Optional("port", default=defaults.get("port", DEFAULT_PORT)): int,
             vol.Optional("device_id", default=defaults.get("device_id", DEFAULT_DEVICE_ID)): str,
             vol.Optional("password", default=defaults.get("password", DEFAULT_PASSWORD)): str,
-        })
\ No newline at end of file
+        })
+
+class BlaubergVentoOptionsFlow(config_entries.OptionsFlow):
+    """Handle Blauberg Vento options (humidity boost loop, RTC sync, manual speed)."""
+
+    def __init__(self, config_entry):
+        self._config_entry = config_entry
+
+    async def async_step_init(self, user_input=None):
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self._config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema({
+                vol.Optional(CONF_HUMIDITY_BOOST, default=options.get(CONF_HUMIDITY_BOOST, False)): bool,
+                vol.Optional(CONF_BOOST_THRESHOLD, default=options.get(CONF_BOOST_THRESHOLD, DEFAULT_BOOST_THRESHOLD)): vol.All(int, vol.Range(min=40, max=99)),
+                vol.Optional(CONF_BOOST_HYSTERESIS, default=options.get(CONF_BOOST_HYSTERESIS, DEFAULT_BOOST_HYSTERESIS)): vol.All(int, vol.Range(min=0, max=30)),
+                vol.Optional(CONF_BOOST_SPEED, default=options.get(CONF_BOOST_SPEED, DEFAULT_BOOST_SPEED)): vol.All(int, vol.Range(min=1, max=3)),
+                vol.Optional(CONF_BOOST_MIN_ON_TIME, default=options.get(CONF_BOOST_MIN_ON_TIME, DEFAULT_BOOST_MIN_ON_TIME)): vol.All(int, vol.Range(min=0)),
+                vol.Optional(CONF_BOOST_COOLDOWN, default=options.get(CONF_BOOST_COOLDOWN, DEFAULT_BOOST_COOLDOWN)): vol.All(int, vol.Range(min=0)),
+                # Seconds of predicted RTC drift before the clock is synced automatically, 0 disables
+                vol.Optional(CONF_RTC_SYNC_THRESHOLD, default=options.get(CONF_RTC_SYNC_THRESHOLD, DEFAULT_RTC_SYNC_THRESHOLD)): vol.All(int, vol.Range(min=0)),
+                # Continuous speed through the manual speed register, ramped with at most one write per interval
+                vol.Optional(CONF_MANUAL_SPEED, default=options.get(CONF_MANUAL_SPEED, False)): bool,
+                vol.Optional(CONF_RAMP_INTERVAL, default=options.get(CONF_RAMP_INTERVAL, DEFAULT_RAMP_INTERVAL)): vol.All(vol.Coerce(float), vol.Range(min=0.2, max=60)),
+                vol.Optional(CONF_RAMP_STEP, default=options.get(CONF_RAMP_STEP, DEFAULT_RAMP_STEP)): vol.All(int, vol.Range(min=1, max=255)),
+            }),
+        )
@@ -4,9 +4,43 @@ DEFAULT_DEVICE_ID = "DEFAULT_DEVICEID"
 DEFAULT_PORT = 4000
 DEFAULT_PASSWORD = "1111"
 
+DEFAULT_SCAN_INTERVAL = 30
+
+DATA_SCHEDULER = f"{DOMAIN}_scheduler"
+DATA_EXPORTER = f"{DOMAIN}_exporter"
+CONF_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+CONF_EXPORTER_PORT = "exporter_port"
+
 MODEL_MAP = {
     3: "VENTO Expert A50-1 W V.2",
     4: "VENTO Expert Duo A30-1 W V.2",
     5: "VENTO Expert A30 W V.2",
     27: "Vento inHome WiFi",
 }
+
+CONF_HUMIDITY_BOOST = "humidity_boost"
+CONF_BOOST_THRESHOLD = "boost_threshold"
+CONF_BOOST_HYSTERESIS = "boost_hysteresis"
+CONF_BOOST_SPEED = "boost_speed"
+CONF_BOOST_MIN_ON_TIME = "boost_min_on_time"
+CONF_BOOST_COOLDOWN = "boost_cooldown"
+
+DEFAULT_BOOST_THRESHOLD = 70
+DEFAULT_BOOST_HYSTERESIS = 5
+DEFAULT_BOOST_SPEED = 3
+DEFAULT_BOOST_MIN_ON_TIME = 300
+DEFAULT_BOOST_COOLDOWN = 600
+
+CONF_MANUAL_SPEED = "manual_speed"
+CONF_RAMP_INTERVAL = "ramp_interval"
+CONF_RAMP_STEP = "ramp_step"
+
+CONF_RTC_SYNC_THRESHOLD = "rtc_sync_threshold"
+DEFAULT_RTC_SYNC_THRESHOLD = 60
+
+SERVICE_SET_GROUP = "set_group"
+SERVICE_READ_PARAMETERS = "read_parameters"
+SERVICE_WRITE_PARAMETERS = "write_parameters"
+SERVICE_SET_SCHEDULE = "set_schedule"
+GROUP_MAX_PARALLEL = 8
@@ -0,0 +1,199 @@
+"""Polling coordinator for a Blauberg Vento unit."""
+from __future__ import annotations
+
+import time
+
+from homeassistant.core import HomeAssistant, Event, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import DOMAIN, DEFAULT_RTC_SYNC_THRESHOLD
+from .fan_api import BlaubergVentoApi
+
+import logging
+_LOGGER = logging.getLogger(__name__)
+
+# Refresh classes polled every cycle when an entity needs them.
+POLLED_REFRESH_CLASSES = ("status", "diagnostic", "config")
+
+# Share of the scan interval a poll may take before low-priority registers are deferred
+POLL_BUDGET = 0.8
+
+# Minimum time between broadcast searches for a unit that stopped answering
+RELOCATE_INTERVAL = 300
+
+
+class BlaubergVentoCoordinator(DataUpdateCoordinator):
+    """
+    Poll one unit for exactly the registers its enabled entities need.
+
+    Every entity registers with a context - the set of register IDs it reads.
+    Disabled entities are never added, so they never register, and their
+    registers drop out of the frame on the next cycle.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: BlaubergVentoApi,
+        entry_id: str,
+        scheduler,
+        rtc_sync_threshold=DEFAULT_RTC_SYNC_THRESHOLD,
+    ):
+        # No update_interval - polls are started by the fleet scheduler
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN} {api.name}",
+        )
+        self.api = api
+        self._entry_id = entry_id
+        self._scheduler = scheduler
+        self._rtc_sync_threshold = rtc_sync_threshold
+        self.last_poll_duration = None
+        self.relocations = 0
+        # Entry options this coordinator was set up with
+        self.options = {}
+        self._last_relocate = None
+
+    @property
+    def entry_id(self) -> str:
+        return self._entry_id
+
+    @property
+    def overruns(self) -> int:
+        """Polls skipped because the previous one was still running."""
+        return self.api.stats["overruns"]
+
+    @property
+    def deferrals(self) -> int:
+        """Registers left for a later cycle because the poll budget ran out."""
+        return self.api.stats["deferred"]
+
+    async def async_run(self, job, *args):
+        """Run a blocking API call within the fleet-wide request cap."""
+        return await self._scheduler.async_run(job, *args)
+
+    def poll_parameters(self) -> set:
+        """Registers to read this cycle, computed from the subscribed entities."""
+        api = self.api
+        wanted = set()
+        for context in self.async_contexts():
+            if context:
+                wanted.update(context)
+
+        if api.humidity_boost is not None:
+            wanted.update((
+                api.FUNCTION_CURRENT_HUMIDITY,
+                api.FUNCTION_DEVICE_ON,
+                api.FUNCTION_FAN_SPEED_TRESHOLD,
+                api.FUNCTION_OPERATION_MODE,
+            ))
+
+        # The RTC is served from the drift model; only sample it now and then,
+        # or to keep the drift model fed for automatic syncing.
+        rtc_due = api.rtc_model.needs_sample()
+        if rtc_due and self._rtc_sync_threshold:
+            wanted.update((api.FUNCTION_RTC_TIME, api.FUNCTION_RTC_DATE))
+
+        functions = api.functions
+        params = set()
+        for param in wanted:
+            register = functions.get(param)
+            if register is None:
+                continue
+            if register.refresh in POLLED_REFRESH_CLASSES:
+                params.add(param)
+            elif register.refresh == "rtc" and rtc_due:
+                params.add(param)
+            elif register.refresh == "static" and getattr(api, register.property_name or "", None) is None:
+                # Static values are read once.
+                params.add(param)
+
+        return params
+
+    async def _async_update_data(self):
+        params = self.poll_parameters()
+        if not params:
+            return {}
+
+        # Budget counts from now, so time spent waiting for a request slot is included
+        deadline = time.monotonic() + self._scheduler.interval * POLL_BUDGET
+
+        try:
+            values = await self.async_run(self.api.poll, params, deadline)
+        except (TimeoutError, OSError) as err:
+            if not await self._async_relocate():
+                raise UpdateFailed(f"Error communicating with {self.api.name}: {err}") from err
+            try:
+                values = await self.async_run(self.api.poll, params, deadline)
+            except (TimeoutError, OSError) as err:
+                raise UpdateFailed(f"Error communicating with {self.api.name}: {err}") from err
+
+        await self._async_sync_rtc_if_drifted()
+        return values
+
+    async def _async_relocate(self) -> bool:
+        """
+        Once the unit has failed enough polls in a row to open its breaker, look
+        for its device ID on the network (DHCP may have given it a new address).
+        Moves the API and the config entry to the new address. Returns True if
+        the unit was found elsewhere.
+        """
+        if self.api.health.available:
+            return False
+
+        now = time.monotonic()
+        if self._last_relocate is not None and now - self._last_relocate < RELOCATE_INTERVAL:
+            return False
+        self._last_relocate = now
+
+        try:
+            host = await self.async_run(self.api.relocate)
+        except OSError as err:
+            _LOGGER.debug("Search for %s failed: %s", self.api.name, err)
+            return False
+        if host is None:
+            return False
+
+        self.relocations += 1
+        entry = self.hass.config_entries.async_get_entry(self._entry_id)
+        if entry is not None:
+            self.hass.config_entries.async_update_entry(
+                entry,
+                data={**entry.data, "host": host, "probe": self.api.export_raw(self.api.PROBE_PARAMS)},
+            )
+        return True
+
+    async def _async_sync_rtc_if_drifted(self):
+        """Set the device clock once the predicted offset passes the threshold."""
+        if not self._rtc_sync_threshold:
+            return
+
+        offset = self.api.rtc_model.offset()
+        if offset is None or abs(offset) < self._rtc_sync_threshold:
+            return
+
+        _LOGGER.info(
+            "RTC of %s is off by %.0f s, syncing with local time", self.api.name, offset
+        )
+        try:
+            await self.async_run(self.api.sync_time)
+        except OSError as err:
+            _LOGGER.warning("RTC sync of %s failed: %s", self.api.name, err)
+
+    @callback
+    def async_setup_registry_listener(self):
+        """Refresh when one of this entry's entities is enabled or disabled."""
+
+        @callback
+        def _registry_updated(event: Event) -> None:
+            if event.data.get("action") != "update":
+                return
+            if "disabled_by" not in event.data.get("changes", {}):
+                return
+            entity = er.async_get(self.hass).async_get(event.data["entity_id"])
+            if entity is not None and entity.config_entry_id == self._entry_id:
+                self.hass.async_create_task(self.async_request_refresh())
+
+        return self.hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, _registry_updated)
@@ -2,30 +2,50 @@
 from __future__ import annotations
 from typing import Any
 
+from homeassistant.components.diagnostics import REDACTED, async_redact_data
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 
 from .const import DOMAIN
 
+TO_REDACT = {"host", "device_network_ip", "identifiers", "unique_id"}
+
+# Registers redacted from the register dump and the packet trace
+REDACT_REGISTERS = {
+    "device_id",
+    "wifi_ssid",
+    "network_settings_ip",
+    "network_settings_subnet",
+    "network_settings_gateway",
+    "network_ip",
+}
+
+
+def _json_value(value):
+    return value.hex(" ") if isinstance(value, bytes) else value
+
+
+def _redact_frame(frame: str | None) -> str | None:
+    """Hide device ID and password in the header of a traced frame."""
+    if frame is None:
+        return None
+    raw = bytes.fromhex(frame)
+    try:
+        # FD FD, type, ID size, device ID, password size, password
+        header_end = 5 + raw[3] + raw[4 + raw[3]]
+    except IndexError:
+        return REDACTED
+    return " ".join(part for part in (raw[:4].hex(" "), REDACTED, raw[header_end:].hex(" ")) if part)
+
 
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
 
-    api = hass.data[DOMAIN][entry.entry_id]
-
-    # Get device and entity registries
-    device_registry = dr.async_get(hass)
-    entity_registry = er.async_get(hass)
-
-    # Find the device linked to this entry
-    devices = [
-        device
-        for device in device_registry.devices.values()
-        if entry.entry_id in device.config_entries
-    ]
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    api = coordinator.api
+    functions = api.functions
 
     data = {
         "config_entry": {
@@ -37,28 +57,74 @@ async def async_get_config_entry_diagnostics(
         "devices": [],
     }
 
-    for device in devices:
+    # Registry indexes - no scan over every device and entity in the install
+    device_registry = dr.async_get(hass)
+    entity_registry = er.async_get(hass)
+
+    for device in dr.async_entries_for_config_entry(device_registry, entry.entry_id):
         info = {
             "name": device.name,
             "manufacturer": device.manufacturer,
             "model": device.model,
             "identifiers": list(device.identifiers),
-            "device_network_ip": api._device_network_ip
+            "device_network_ip": getattr(api, "_device_network_ip", None),
         }
 
-        # Collect linked entities (optional)
-        entities = [
+        info["entities"] = [
             {
                 "entity_id": entity.entity_id,
                 "name": entity.name,
                 "unique_id": entity.unique_id,
                 "device_class": entity.device_class,
+                "disabled_by": entity.disabled_by,
             }
-            for entity in entity_registry.entities.values()
-            if entity.device_id == device.id
+            for entity in er.async_entries_for_device(
+                entity_registry, device.id, include_disabled_entities=True
+            )
         ]
-        info["entities"] = entities
 
         data["devices"].append(info)
 
-    return data
+    # Fresh dump of the full register map, in one executor job
+    try:
+        values = await coordinator.async_run(api.read_all_registers)
+    except (TimeoutError, OSError) as err:
+        data["registers"] = {"error": str(err) or type(err).__name__}
+        data["capabilities"] = None
+    else:
+        data["registers"] = {
+            f"0x{param:04X}": {
+                "name": functions[param].name if param in functions else None,
+                "value": _json_value(value),
+            }
+            for param, value in sorted(values.items())
+        }
+        # Registers of the model's map the unit answered as unsupported
+        data["capabilities"] = {
+            register.name: values.get(param) is not None
+            for param, register in sorted(functions.items())
+            if param in values
+        }
+
+    data["protocol"] = {
+        "device_model_id": api.device_model_id,
+        "stats": dict(api.stats),
+        "health": api.health.state,
+        "consecutive_failures": api.health.consecutive_failures,
+        "overruns": coordinator.overruns,
+        "deferrals": coordinator.deferrals,
+        "last_deferred": [f"0x{param:04X}" for param in api.last_deferred],
+        "relocations": coordinator.relocations,
+        "last_poll_duration": coordinator.last_poll_duration,
+    }
+
+    # Last frames exchanged with the unit (including the dump above), with their decoded values
+    data["trace"] = [
+        {**entry, "frame": _redact_frame(entry["frame"])} for entry in api.trace.dump()
+    ]
+
+    # Register values are keyed by hex ID, both in the dump and in the trace
+    to_redact = TO_REDACT | {
+        f"0x{param:04X}" for param, register in functions.items() if register.name in REDACT_REGISTERS
+    }
+    return async_redact_data(data, to_redact)
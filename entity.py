@@ -0,0 +1,32 @@
+"""Base entity for Blauberg Vento."""
+from __future__ import annotations
+
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+
+
+def device_info_for(device_id: str) -> DeviceInfo:
+    """Device info linking entities to the unit; build once per entry and share it."""
+    return DeviceInfo(identifiers={(DOMAIN, device_id)})
+
+
+class BlaubergVentoEntity(CoordinatorEntity):
+    """
+    Entity attached to a Blauberg Vento unit.
+
+    `registers` is the set of register IDs the entity reads; the coordinator
+    polls the union of these over all enabled entities.
+    """
+
+    def __init__(self, coordinator, device_info: DeviceInfo, registers=()):
+        super().__init__(coordinator, context=frozenset(registers))
+        self._api = coordinator.api
+        self._attr_device_info = device_info
+
+    @property
+    def available(self) -> bool:
+        # Device health, not the last poll, decides - a single timeout
+        # (degraded) keeps showing the last known state.
+        return self._api.available
@@ -0,0 +1,154 @@
+"""
+OpenMetrics exporter for Blauberg Vento units.
+
+Metrics are rendered from the values the poller has already cached on each
+BlaubergVentoApi - a scrape never talks to a device.
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+
+import logging
+_LOGGER = logging.getLogger(__name__)
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# (metric, help, value function)
+GAUGES = (
+    ("blauberg_vento_humidity_percent", "Relative humidity", lambda api: getattr(api, "_current_humidity", None)),
+    ("blauberg_vento_battery_volts", "RTC battery voltage", lambda api: _scaled(getattr(api, "_battery_voltage", None), 1000)),
+    ("blauberg_vento_filter_remaining_hours", "Time until filter replacement", lambda api: getattr(api, "_filter_replacement_countdown", None)),
+    ("blauberg_vento_filter_replacement", "Filter needs replacement (1) or not (0)", lambda api: getattr(api, "_filter_replacement", None)),
+    ("blauberg_vento_alarm_status", "Alarm status: 0 OK, 1 alarm, 2 warning", lambda api: getattr(api, "_alarm_status", None)),
+    ("blauberg_vento_on", "Unit on (1) or in stand-by (0)", lambda api: getattr(api, "_device_on", None)),
+    ("blauberg_vento_speed", "Speed: 1-3, 255 manual", lambda api: getattr(api, "_fan_speed_treshold", None)),
+    ("blauberg_vento_up", "Unit reachable (circuit breaker not open)", lambda api: int(api.available)),
+)
+
+
+def _scaled(value, divisor):
+    if value is None:
+        return None
+    return value / divisor
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(api, **extra) -> str:
+    labels = {"device_id": api.device_id, "name": api.name, **extra}
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def render_openmetrics(apis) -> str:
+    """Render the latest cached state of every API as OpenMetrics text."""
+    apis = list(apis)
+    lines = []
+
+    def family(name, metric_type, help_text, samples):
+        lines.append(f"# TYPE {name} {metric_type}")
+        lines.append(f"# HELP {name} {help_text}")
+        lines.extend(samples)
+
+    for name, help_text, value_fn in GAUGES:
+        samples = []
+        for api in apis:
+            value = value_fn(api)
+            if value is not None:
+                samples.append(f"{name}{_labels(api)} {value}")
+        family(name, "gauge", help_text, samples)
+
+    samples = []
+    for api in apis:
+        for fan, attr in (("1", "_fan1_speed"), ("2", "_fan2_speed")):
+            value = getattr(api, attr, None)
+            if value is not None:
+                samples.append(f"blauberg_vento_fan_speed_rpm{_labels(api, fan=fan)} {value}")
+    family("blauberg_vento_fan_speed_rpm", "gauge", "Fan speed", samples)
+
+    samples = []
+    for api in apis:
+        minutes = getattr(api, "_machine_hours", None)
+        if minutes is not None:
+            samples.append(f"blauberg_vento_machine_hours_total{_labels(api)} {minutes / 60}")
+    family("blauberg_vento_machine_hours", "counter", "Operating hours", samples)
+
+    for name, key, help_text in (
+        ("blauberg_vento_requests", "requests", "Requests sent"),
+        ("blauberg_vento_timeouts", "timeouts", "Requests without a response"),
+        ("blauberg_vento_errors", "errors", "Requests failed with a socket error"),
+        ("blauberg_vento_poll_overruns", "overruns", "Polls skipped because the previous one overran"),
+        ("blauberg_vento_deferred_registers", "deferred", "Registers deferred to a later poll by the latency budget"),
+        ("blauberg_vento_discarded_datagrams", "discarded", "Datagrams dropped as corrupt or not a reply to the outstanding request"),
+    ):
+        family(
+            name,
+            "counter",
+            help_text,
+            [f"{name}_total{_labels(api)} {api.stats[key]}" for api in apis],
+        )
+
+    samples = []
+    for api in apis:
+        samples.append(f"blauberg_vento_rtt_seconds_count{_labels(api)} {api.stats['rtt_count']}")
+        samples.append(f"blauberg_vento_rtt_seconds_sum{_labels(api)} {api.stats['rtt_sum']}")
+    family("blauberg_vento_rtt_seconds", "summary", "Request round trip time", samples)
+
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+class OpenMetricsExporter(object):
+    """
+    Minimal HTTP server exposing /metrics in a background thread.
+    Scrapes render the APIs last handed over with set_apis(); the server
+    thread only ever reads that immutable snapshot.
+    """
+
+    def __init__(self, apis=(), host="0.0.0.0", port=9797):
+        self._apis = tuple(apis)
+        self._host = host
+        self._port = port
+        self._server = None
+        self._thread = None
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1] if self._server else self._port
+
+    def set_apis(self, apis):
+        """Replace the APIs rendered by scrapes."""
+        self._apis = tuple(apis)
+
+    def start(self):
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = render_openmetrics(exporter._apis).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                _LOGGER.debug("%s - %s", self.address_string(), format % args)
+
+        self._server = ThreadingHTTPServer((self._host, self._port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="blauberg_vento_exporter", daemon=True
+        )
+        self._thread.start()
+        _LOGGER.info("OpenMetrics exporter listening on %s:%s", self._host, self.port)
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
@@ -7,11 +7,13 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .fan_api import BlaubergVentoApi
+from .entity import BlaubergVentoEntity
 
 
 from homeassistant.components.diagnostics import DiagnosticsData
 
-from .const import DOMAIN, DEFAULT_DEVICE_ID
+from .const import DOMAIN, DEFAULT_DEVICE_ID, CONF_MANUAL_SPEED, CONF_RAMP_INTERVAL, CONF_RAMP_STEP
+from .ramp import SpeedRamp, DEFAULT_RAMP_INTERVAL, DEFAULT_RAMP_STEP
 
 from homeassistant.components.fan import (
     FanEntity,
@@ -32,17 +34,25 @@ ORDERED_NAMED_FAN_SPEEDS = ["low", "medium", "high"]#, "manual"
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ):
-    api = hass.data[DOMAIN][entry.entry_id]
+    coordinator = hass.data[DOMAIN][entry.entry_id]
     async_add_entities(
         [
-            BlaubergVentoFan(api),
-        ], True)
+            BlaubergVentoFan(coordinator),
+        ])
 
-class BlaubergVentoFan(FanEntity):
+class BlaubergVentoFan(BlaubergVentoEntity, FanEntity):
 
-    def __init__(self, api):
+    REGISTERS = (
+        BlaubergVentoApi.FUNCTION_DEVICE_ON,
+        BlaubergVentoApi.FUNCTION_FAN_SPEED_TRESHOLD,
+        BlaubergVentoApi.FUNCTION_OPERATION_MODE,
+        BlaubergVentoApi.FUNCTION_MANUAL_SPEED,
+    )
+
+    def __init__(self, coordinator):
+        api = coordinator.api
         _LOGGER.debug("Initializing BlaubergVentoFan for %s", api._host)
-        self._api = api
+        super().__init__(coordinator, None, self.REGISTERS)
         self._name = api.name
         self._attr_name = api.name
         self._attr_unique_id = api.device_id or api._host
@@ -52,29 +62,29 @@ class BlaubergVentoFan(FanEntity):
         self._attr_speed_count = len(self._api.available_speed_tresholds) -1
         self._attr_percentage = None
 
+        # Continuous speed through the manual speed register (integration option)
+        options = coordinator.options
+        self._manual = options.get(CONF_MANUAL_SPEED, False)
+        self._ramp = None
+        if self._manual:
+            self._attr_speed_count = 100
+            self._ramp = SpeedRamp(
+                self._async_write_manual_speed,
+                coordinator.hass.async_create_background_task,
+                interval=options.get(CONF_RAMP_INTERVAL, DEFAULT_RAMP_INTERVAL),
+                step=options.get(CONF_RAMP_STEP, DEFAULT_RAMP_STEP),
+            )
+
 # Initialize attributes so HA knows what to expect
 #    self._attr_percentage = 0
 #    self._attr_preset_mode = self._api.available_modes[0] if self._api.available_modes else None
 #    self._attr_preset_modes = self._api.available_modes or ["ventilation", "heat recovery", "supply"]
 #    self._attr_speed_count = len(self._api.available_speed_tresholds) - 1
 
-    async def async_update(self):
-        """Fetch the latest fan data."""
-        await self.hass.async_add_executor_job(self._api.update_status)
-        await self.hass.async_add_executor_job(self._api.get_diagnostic_info)
-        await self.hass.async_add_executor_job(self._api.get_config_info)
-        # Assign unique ID once the real device ID is known
-        if not self._attr_unique_id and self._api.device_id != DEFAULT_DEVICE_ID:
-            self._attr_unique_id = f"blauberg_vento_{self._api.device_id}"
-
     @property
     def name(self):
         return self._name
 
-    @property
-    def should_poll(self):
-        return True
-
     @property
     def device_info(self):
         """Return device information for the Blauberg Vento fan."""
@@ -87,10 +97,10 @@ class BlaubergVentoFan(FanEntity):
             "sw_version": getattr(self._api, "device_firmware", "unknown"),
         }
 
-    @property
-    def available(self):
-        speed_treshold = self._api.speed_treshold
-        return bool(speed_treshold != "manual")
+    async def async_will_remove_from_hass(self) -> None:
+        if self._ramp is not None:
+            self._ramp.cancel()
+        await super().async_will_remove_from_hass()
 
     @property
     def is_on(self):
@@ -108,16 +118,29 @@ class BlaubergVentoFan(FanEntity):
         **kwargs
     ) -> None:
         """Turn on the fan."""
-        await self.hass.async_add_executor_job(self._api.turn_on)
+        if percentage is not None:
+            await self.async_set_percentage(percentage)
+            return
 
-        self._attr_is_on = True
-        self.async_write_ha_state()
+        if self._ramp is not None:
+            # Resume at the last manual speed, not at the turn_on() preset speed
+            speed = self._ramp.target if self._ramp.running else getattr(self._api, "_manual_speed", None)
+            self._ramp.cancel()
+            if speed is None:
+                speed = self._api.MANUAL_SPEED_RANGE[1]
+            await self.coordinator.async_run(self._api.set_manual_speed, speed)
+        else:
+            await self.coordinator.async_run(self._api.turn_on)
+
+        # State comes from the verified write-then-read echo
+        self.coordinator.async_update_listeners()
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn off the fan."""
-        await self.hass.async_add_executor_job(self._api.turn_off)
-        self._attr_is_on = False
-        self.async_write_ha_state()
+        if self._ramp is not None:
+            self._ramp.cancel()
+        await self.coordinator.async_run(self._api.turn_off)
+        self.coordinator.async_update_listeners()
 
     @property
     def percentage(self):
@@ -126,10 +149,28 @@ class BlaubergVentoFan(FanEntity):
         if speed is None:
             return 0
 
-        if speed == 255:
-            return 100
+        if speed == self._api.FAN_SPEED_MANUAL:
+            manual_speed = getattr(self._api, "_manual_speed", None)
+            if manual_speed is None:
+                return None
+            return round(manual_speed * 100 / self._api.MANUAL_SPEED_RANGE[1])
 
-        return (speed/self.speed_count)*100
+        return (speed / self._api.FAN_SPEED_RANGE[1]) * 100
+
+    def _manual_speed_now(self) -> int | None:
+        """Present speed on the 0-255 manual scale, for the ramp to start from."""
+        speed = getattr(self._api, "_fan_speed_treshold", None)
+        if speed == self._api.FAN_SPEED_MANUAL:
+            return getattr(self._api, "_manual_speed", None)
+        if speed is None or not getattr(self._api, "_device_on", 0):
+            return None
+        return round(speed / self._api.FAN_SPEED_RANGE[1] * self._api.MANUAL_SPEED_RANGE[1])
+
+    async def _async_write_manual_speed(self, speed: int) -> None:
+        """One ramp step."""
+        if await self.coordinator.async_run(self._api.set_manual_speed, speed) != 0:
+            raise TimeoutError(f"No response from {self._api.name}")
+        self.coordinator.async_update_listeners()
 
     async def async_set_percentage(self, percentage: int) -> None:
         """
@@ -139,9 +180,15 @@ class BlaubergVentoFan(FanEntity):
 
         if percentage == 0:
             # 0% → turn off
-            await self.hass.async_add_executor_job(self._api.turn_off)
-            self._attr_is_on = False
-            self._attr_percentage = 0
+            if self._ramp is not None:
+                self._ramp.cancel()
+            await self.coordinator.async_run(self._api.turn_off)
+        elif self._ramp is not None:
+            # 1–100% → manual speed 0–255, ramped with rate-limited writes
+            self._ramp.set_target(
+                round(percentage * self._api.MANUAL_SPEED_RANGE[1] / 100),
+                self._manual_speed_now(),
+            )
         else:
             # Convert 0–100% → device speed step (e.g., 1–3)
             speed_treshold = math.ceil(
@@ -149,12 +196,28 @@ class BlaubergVentoFan(FanEntity):
             )
 
             # Turn on and set the speed
-            await self.hass.async_add_executor_job(self._api.turn_on, speed_treshold)
-            self._attr_is_on = True
-            self._attr_percentage = percentage
+            await self.coordinator.async_run(self._api.turn_on, speed_treshold)
 
         # Notify HA of the new state
-        self.async_write_ha_state()
+        self.coordinator.async_update_listeners()
+
+    async def async_increase_speed(self, percentage_step: int | None = None) -> None:
+        """Increase the speed by one step using the device's increment command."""
+        if self._manual or (percentage_step is not None and percentage_step != 100 // self.speed_count):
+            await super().async_increase_speed(percentage_step)
+            return
+
+        await self.coordinator.async_run(self._api.step_speed, True)
+        self.coordinator.async_update_listeners()
+
+    async def async_decrease_speed(self, percentage_step: int | None = None) -> None:
+        """Decrease the speed by one step using the device's decrement command."""
+        if self._manual or (percentage_step is not None and percentage_step != 100 // self.speed_count):
+            await super().async_decrease_speed(percentage_step)
+            return
+
+        await self.coordinator.async_run(self._api.step_speed, False)
+        self.coordinator.async_update_listeners()
 
     @property
     def preset_mode(self):
@@ -169,12 +232,10 @@ class BlaubergVentoFan(FanEntity):
             _LOGGER.warning("Unknown preset mode: %s", preset_mode)
             return
 
-        current_speed_treshold = self._api._fan_speed_treshold
+        current_speed_treshold = getattr(self._api, "_fan_speed_treshold", None)
 
         # Send command to the device
-        await self.hass.async_add_executor_job(self._api.turn_on, current_speed_treshold, mode_key)
+        await self.coordinator.async_run(self._api.turn_on, current_speed_treshold, mode_key)
 
-        # Update internal state
-        self._attr_preset_mode = preset_mode
-        self.async_write_ha_state()
+        self.coordinator.async_update_listeners()
 
@@ -2,11 +2,93 @@
 
 import socket
 import sys
+import threading
+import time
+from collections.abc import Mapping
+from datetime import datetime
 from .const import DEFAULT_DEVICE_ID, MODEL_MAP
+from .registers import COMMON_REGISTERS, register_map, property_map, bytes_from_hex
+from .rtc import RtcDriftModel
+from .health import DeviceHealth
+from .packet_trace import PacketTrace, TX, RX, DISCARDED
+from . import schedule
 
 import logging
 _LOGGER = logging.getLogger(__name__)
 
+
+class BlaubergVentoError(Exception):
+    """Base error of the Blauberg Vento library."""
+
+
+class BlaubergVentoUnavailableError(BlaubergVentoError, TimeoutError):
+    """Request not sent - the device's circuit breaker is open."""
+
+
+class BlaubergVentoWriteError(BlaubergVentoError):
+    """The device did not take a written value (its echo still differs after retries)."""
+
+    def __init__(self, message, mismatched=None):
+        super().__init__(message)
+        # {param_id: (sent bytes, echoed bytes or None if unsupported)}
+        self.mismatched = mismatched or {}
+
+
+_MISSING = object()
+
+
+class _Flight(object):
+    """A read in progress that other readers of the same parameters wait for."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.error = None
+
+
+class _Subscription(object):
+    """A change callback registered with BlaubergVentoApi.subscribe()."""
+
+    __slots__ = ("callback", "coalesce")
+
+    def __init__(self, callback, coalesce):
+        self.callback = callback
+        self.coalesce = coalesce
+
+    def notify(self, *args):
+        try:
+            self.callback(*args)
+        except Exception:  # noqa: BLE001 - one subscriber must not break the others
+            _LOGGER.exception("Error in Blauberg Vento change callback")
+
+
+class LazyValues(Mapping):
+    """
+    {param_id: value} view of one response. Holds the raw value bytes and
+    decodes a value only when it is looked up (see BlaubergVentoApi.decode).
+    """
+
+    def __init__(self, api, raw: dict):
+        self._api = api
+        self._raw = raw
+
+    def __getitem__(self, param):
+        return self._api.decode(param, self._raw[param])
+
+    def __iter__(self):
+        return iter(self._raw)
+
+    def __len__(self):
+        return len(self._raw)
+
+    @property
+    def raw(self) -> dict:
+        """{param_id: raw value bytes} of the response, None for unsupported."""
+        return self._raw
+
+    def __repr__(self):
+        return f"LazyValues({dict(self)!r})"
+
+
 class BlaubergVentoApi(object):
 
     PACKET_BEGIN: bytes = bytes.fromhex("FDFD")
@@ -20,34 +102,14 @@ class BlaubergVentoApi(object):
     COMMAND_DECREMENT = 0x05
     CONTROLLER_RESPONSE = 0x06
 
-    FUNCTIONS = {
-        0x0001: {"type": "uint", "length": 1, "property_name": "_device_on"},
-        0x0002: {"type": "uint", "length": 1, "property_name": "_fan_speed_treshold"},
-        0x0024: {"type": "uint", "length": 2, "property_name": "_battery_voltage"},
-        0x0025: {"type": "uint", "length": 1, "property_name": "_current_humidity"},
-        0x006F: {"type": "time", "length": 3, "property_name": "_rtc_time"},
-        0x0070: {"type": "date", "length": 4, "property_name": "_rtc_date"},
-        0x004A: {"type": "uint", "length": 2, "property_name": "_fan1_speed"},
-        0x004B: {"type": "uint", "length": 2, "property_name": "_fan2_speed"},
-        0x0064: {"type": "time_remaining", "length": 4, "property_name": "_filter_replacement_countdown"},#according to documentation the length should be 3 but actual value is 4-byte.
-        0x0065: {"type": "uint", "length": 1, "property_name": ""},
-        0x007C: {"type": "ascii", "length": 16, "property_name": "_device_id"},
-        0x007E: {"type": "machine_hours", "length": 4, "property_name": "_machine_hours"},
-        0x0080: {"type": "uint", "length": 1, "property_name": ""},
-        0x0083: {"type": "uint", "length": 1, "property_name": "_alarm_status"},
-        0x0086: {"type": "fw_version", "length": 6, "property_name": "_device_firmware"},
-        0x0088: {"type": "uint", "length": 1, "property_name": "_filter_replacement"},
-        0x009B: {"type": "uint", "length": 1, "property_name": "_device_network_settings_dhcp"},
-        0x009C: {"type": "ipv4", "length": 4, "property_name": "_device_network_settings_ip"},
-        0x009D: {"type": "ipv4", "length": 4, "property_name": "_device_network_settings_subnet"},
-        0x009E: {"type": "ipv4", "length": 4, "property_name": "_device_network_settings_gateway"},
-        0x00A3: {"type": "ipv4", "length": 4, "property_name": "_device_network_ip"},
-        0x00B7: {"type": "uint", "length": 1, "property_name": "_operation_mode"},
-        0x00B9: {"type": "uint", "length": 2, "property_name": "_device_model_id"},
-    }
+    MAX_PACKET_SIZE = 256
+
+    # Registers shared by all units; per-model maps are available via `functions`.
+    FUNCTIONS = COMMON_REGISTERS
 
     FUNCTION_DEVICE_ON = 0x0001
     FUNCTION_FAN_SPEED_TRESHOLD = 0x0002
+    FUNCTION_MANUAL_SPEED = 0x0044
     FUNCTION_BATTERY_VOLTAGE = 0x0024
     FUNCTION_CURRENT_HUMIDITY = 0x0025
     FUNCTION_RTC_TIME = 0x006F
@@ -70,6 +132,38 @@ class BlaubergVentoApi(object):
     FUNCTION_OPERATION_MODE = 0x00B7
     FUNCTION_UNIT_TYPE = 0x00B9
 
+    # Identity, firmware and network settings - read in one frame by probe()
+    PROBE_PARAMS = (
+        FUNCTION_DEVICE_ID,
+        FUNCTION_UNIT_TYPE,
+        FUNCTION_FW_VERSION,
+        FUNCTION_NET_SETTINGS__DHCP,
+        FUNCTION_NET_SETTINGS__DEVICE_IP,
+        FUNCTION_NET_SETTINGS__SUBNET,
+        FUNCTION_NET_SETTINGS_GATEWAY,
+        FUNCTION_NET_DEVICE_IP,
+    )
+    PROBE_TIMEOUT = 0.5
+    PROBE_ATTEMPTS = 2
+
+    REQUEST_TIMEOUT = 15
+
+    # Retransmissions of parameters whose write-then-read echo differs
+    WRITE_RETRIES = 2
+    # Registers whose echo is not expected to match (triggers, running clock)
+    UNVERIFIED_REFRESH_CLASSES = ("command", "rtc")
+
+    # Read first in every poll, whatever the budget
+    PRIORITY_REFRESH_CLASSES = ("status",)
+    # Assumed round trip of a frame before any has been measured
+    DEFAULT_FRAME_ESTIMATE = 0.25
+
+    # Seconds a read value is served from the cache instead of the device
+    CACHE_TTL = 2.0
+
+    # Decoded as soon as they arrive, everything else on first access
+    EAGER_PARAMS = (FUNCTION_DEVICE_ID, FUNCTION_UNIT_TYPE)
+
     FAN_SPEEDS = {
         1: "low",
         2: "medium",
@@ -77,6 +171,8 @@ class BlaubergVentoApi(object):
         255: "manual",
     }
     FAN_SPEED_RANGE = (1, 3)
+    FAN_SPEED_MANUAL = 255
+    MANUAL_SPEED_RANGE = (0, 255)
 
     FAN_MODES = {
         0: "ventilation",
@@ -91,6 +187,7 @@ class BlaubergVentoApi(object):
         name="Blauberg Vento Fan",
         device_id=DEFAULT_DEVICE_ID,
         password="1111",
+        cache_ttl=CACHE_TTL,
     ):
         self._name = name
         self._host = host
@@ -99,18 +196,76 @@ class BlaubergVentoApi(object):
         self._device_model_id = None
         self._device_model = "Unknown Model"
         self._password = password
+        self.timeout = self.REQUEST_TIMEOUT
 
         self._device_network_ip = None
 
+        # Last raw value bytes per parameter and {param_id: (raw, value)} decode cache
+        self._raw = {}
+        self._decoded = {}
+
+        # Read-through cache: monotonic time each parameter was last read, reads
+        # in flight per parameter, and a generation bumped by every write
+        self.cache_ttl = cache_ttl
+        self._cache_lock = threading.Lock()
+        self._fetched = {}
+        self._in_flight = {}
+        self._generation = 0
+
+        # Change subscriptions: {param_id or None (all): (_Subscription, ...)}
+        self._subscribers = {}
+
+        self.humidity_boost = None
+        # Cached weekly schedule (schedule.ScheduleTable), read on first use
+        self.schedule = None
+        self.rtc_model = RtcDriftModel()
+        self.health = DeviceHealth(name=name)
+        self.trace = PacketTrace(name=name)
+
+        # Protocol counters (exporter, diagnostics)
+        self.stats = {
+            "requests": 0,
+            "timeouts": 0,
+            "errors": 0,
+            "rtt_sum": 0.0,
+            "rtt_count": 0,
+            "last_rtt": None,
+            "overruns": 0,
+            "deferred": 0,
+            "discarded": 0,
+        }
+        # Parameters the last budgeted poll had to leave for a later cycle
+        self.last_deferred = []
+
+        # One connected socket per unit, one request on it at a time. Reply
+        # matching in receive() relies on a single outstanding request.
+        # connect() and close() take the lock too, so the socket is never
+        # replaced or closed under a request in flight.
+        self.socket = None
+        self._io_lock = threading.RLock()
+        # First parameter ID of the outstanding request, see _first_param()
+        self._outstanding = None
+
     def connect(self):
-        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        self.socket.settimeout(15)
-        self.socket.connect((self._host, self._port))
-        return self.socket
+        with self._io_lock:
+            self.close()
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.settimeout(self.timeout)
+            sock.connect((self._host, self._port))
+            self.socket = sock
+            return sock
+
+    def close(self):
+        """Close the socket; waits for a request in flight to finish."""
+        with self._io_lock:
+            if self.socket is not None:
+                self.socket.close()
+                self.socket = None
 
     def _ensure_socket(self):
-        if not hasattr(self, "socket") or self.socket is None:
-            self.connect()
+        if self.socket is None:
+            return self.connect()
+        return self.socket
 
     def authenticationHeader(self):
         return (
@@ -121,23 +276,28 @@ class BlaubergVentoApi(object):
             + self._password.encode("ascii")
         )
 
-    def send(self, command: int, function: int, data: bytes = b""):
+    def build_packet(self, command: int, function: int, data: bytes = b"") -> bytes:
         payload = command.to_bytes(1, "little")
         if function is not None:
             payload += function.to_bytes(2, "little")
         payload += data
 
-        packet = (
+        return (
             self.PACKET_BEGIN
             + self.authenticationHeader()
             + payload
             + self.checksum(self.authenticationHeader() + payload)
         )
 
-        _LOGGER.debug("Sent packet: %s", packet.hex(" "))
+    def send(self, command: int, function: int, data: bytes = b""):
+        packet = self.build_packet(command, function, data)
+        self.trace.record(TX, packet)
 
-        self.socket = self.connect()
-        return self.socket.send(packet)
+        sock = self._ensure_socket()
+        # Data block starts after FD FD, the auth header and the command byte
+        data_start = len(self.PACKET_BEGIN) + len(self.authenticationHeader()) + 1
+        self._outstanding = self._first_param(packet[data_start:-2])
+        return sock.send(packet)
 
     def checksum(self, data):
         # Sum all bytes from TYPE to end of DATA
@@ -148,39 +308,423 @@ class BlaubergVentoApi(object):
 
         return checksum_low + checksum_high
 
-    def receive(self) -> bytes | None:
+    def receive(self, timeout=None) -> bytes | None:
+        """
+        Wait up to timeout (default self.timeout) for the reply to the
+        outstanding request.
+
+        Every wakeup drains all datagrams queued on the socket. Those that fail
+        _is_reply() - corrupt, from another unit, or a late reply to an earlier
+        request that timed out - are counted in stats["discarded"] and dropped
+        instead of being taken for this request's reply.
+        """
+        sock = self.socket
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
         try:
-            return self.socket.recv(98)
-        except socket.timeout:
-            return None
-        except Exception as e:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                sock.settimeout(remaining)
+                try:
+                    datagrams = [sock.recv(self.MAX_PACKET_SIZE)]
+                except socket.timeout:
+                    return None
+
+                sock.settimeout(0)
+                try:
+                    while True:
+                        datagrams.append(sock.recv(self.MAX_PACKET_SIZE))
+                except BlockingIOError:
+                    pass
+
+                reply = None
+                for datagram in datagrams:
+                    if reply is None and self._is_reply(datagram):
+                        reply = datagram
+                    else:
+                        self.stats["discarded"] += 1
+                        self.trace.record(DISCARDED, datagram)
+                if reply is not None:
+                    return reply
+        except OSError as e:
             _LOGGER.warning("Socket error: %s", e)
+            # E.g. ICMP port unreachable, start over with a fresh socket
+            self.close()
             return None
+        finally:
+            if self.socket is sock:
+                sock.settimeout(self.timeout)
 
-    def send_command_and_process_response(self, command: int, function: int, data: bytes = b""):
-        try:
-            self.send(command, function, data)
-            response = self.receive()
+    @staticmethod
+    def _first_param(block: bytes) -> int | None:
+        """ID of the first parameter in a data block, skipping page and size markers."""
+        page = 0x00
+        i = 0
+        while i < len(block):
+            b = block[i]
+            if b == 0xFF:
+                page = block[i + 1] if i + 1 < len(block) else 0
+                i += 2
+            elif b == 0xFE:
+                i += 2
+            elif b == 0xFD:
+                i += 1
+            elif b == 0xFC:
+                return None
+            else:
+                return (page << 8) | b
+        return None
+
+    def _is_reply(self, datagram: bytes) -> bool:
+        """
+        Cheap checks before a datagram is parsed: frame marker, checksum,
+        device ID (unless still the default one, then any unit may answer),
+        response command, and the first parameter of the outstanding request.
+        The unit answers parameters in request order, so a late reply to
+        another request starts with a different one.
+        """
+        if len(datagram) < len(self.PACKET_BEGIN) + 5 or not datagram.startswith(self.PACKET_BEGIN):
+            return False
+        if self.checksum(datagram[2:-2]) != datagram[-2:]:
+            return False
+
+        device_id_len = datagram[3]
+        if 4 + device_id_len >= len(datagram):
+            return False
+        if self._device_id != DEFAULT_DEVICE_ID and datagram[4:4 + device_id_len] != self._device_id.encode("ascii"):
+            return False
+        command_pos = 5 + device_id_len + datagram[4 + device_id_len]
+        if command_pos >= len(datagram) - 2 or datagram[command_pos] != self.CONTROLLER_RESPONSE:
+            return False
+
+        return self._outstanding is None or self._first_param(datagram[command_pos + 1:-2]) == self._outstanding
+
+    def request(self, command: int, function: int, data: bytes = b"", parser=None, timeout=None) -> dict | None:
+        """
+        Send a single frame and parse the reply.
+        Returns {param_id: value} decoded from the response (or the result of
+        parser(response) if given) or None if the device did not respond.
+        Raises BlaubergVentoUnavailableError without sending anything while the
+        device's circuit breaker is open (see DeviceHealth).
+
+        timeout overrides self.timeout for this request only. Such short,
+        probing requests are not counted as failures in the device's health.
+        """
+        if not self.health.allow_request():
+            raise BlaubergVentoUnavailableError(f"{self._name} ({self._host}) is unavailable")
 
-            _LOGGER.debug("Response: %s", response)
+        if command == self.COMMAND_READ:
+            generation = self._generation
+        else:
+            # A write may change any value (e.g. a reset) - expire the whole cache
+            with self._cache_lock:
+                self._generation += 1
+                self._fetched.clear()
+            generation = self._generation
+
+        stats = self.stats
+        stats["requests"] += 1
+        try:
+            with self._io_lock:
+                started = time.monotonic()
+                self.send(command, function, data)
+                response = self.receive(timeout)
 
             if response:
-                self.parse_response(response)
-                return 0
+                rtt = time.monotonic() - started
+                stats["last_rtt"] = rtt
+                stats["rtt_sum"] += rtt
+                stats["rtt_count"] += 1
+                self.health.record_success()
+                if parser is not None:
+                    self.trace.record(RX, response)
+                    return parser(response)
+                values = self.parse_response(response)
+                self.trace.record(RX, response, values)
+                with self._cache_lock:
+                    # Skip if a write went out meanwhile, the reply may predate it
+                    if generation == self._generation:
+                        now = time.monotonic()
+                        for param in values:
+                            self._fetched[param] = now
+                return values
             else:
+                stats["timeouts"] += 1
+                self.trace.record(RX, None)
+                if timeout is None:
+                    self.health.record_failure()
+                return None
+        except OSError:
+            stats["errors"] += 1
+            if timeout is None:
+                self.health.record_failure()
+            self.close()
+            raise
+
+    def send_command_and_process_response(self, command: int, function: int, data: bytes = b""):
+        try:
+            if self.request(command, function, data) is None:
                 return 1
+        except BlaubergVentoUnavailableError:
+            return 1
+        return 0
+
+    def _encode_read_block(self, param_ids) -> bytes:
+        """Encode parameter IDs as a read data block, adding 0xFF page markers where needed."""
+        block = b""
+        page = 0x00
+        for param in sorted(param_ids):
+            if (param >> 8) != page:
+                page = param >> 8
+                block += bytes([0xFF, page])
+            block += bytes([param & 0xFF])
+        return block
+
+    def _frame_overhead(self) -> int:
+        # FD FD + auth header + function byte + checksum
+        return len(self.PACKET_BEGIN) + len(self.authenticationHeader()) + 1 + 2
+
+    def _pack_frames(self, param_sizes: dict) -> list:
+        """
+        Split {param_id: value_size} into as few groups as possible so that
+        neither the request nor the reply exceeds MAX_PACKET_SIZE.
+        """
+        budget = self.MAX_PACKET_SIZE - self._frame_overhead()
+        frames = []
+        current = []
+        used = 0
+        page = 0x00
+
+        for param in sorted(param_sizes):
+            size = param_sizes[param]
+            cost = 1 + size + (2 if size != 1 else 0)
+            page_cost = 2 if (param >> 8) != page else 0
+
+            if current and used + cost + page_cost > budget:
+                frames.append(current)
+                current = []
+                used = 0
+                page = 0x00
+
+            if (param >> 8) != page:
+                page = param >> 8
+                cost += 2
+
+            current.append(param)
+            used += cost
+
+        if current:
+            frames.append(current)
+
+        return frames
+
+    def read_parameters(self, param_ids, max_age=None) -> dict:
+        """
+        Read an arbitrary list of parameters using as few frames as possible.
+        Values read within max_age seconds (default cache_ttl) are served from
+        the cache, and parameters another thread is already reading join that
+        request instead of sending a duplicate.
+        Returns {param_id: value}. Unsupported parameters map to None.
+        Raises TimeoutError if the device does not respond.
+        """
+        if max_age is None:
+            max_age = self.cache_ttl
+        wanted = set(param_ids)
+
+        with self._cache_lock:
+            now = time.monotonic()
+            joined = set()
+            missing = []
+            for param in wanted:
+                fetched = self._fetched.get(param)
+                if fetched is not None and now - fetched <= max_age:
+                    continue
+                flight = self._in_flight.get(param)
+                if flight is not None:
+                    joined.add(flight)
+                else:
+                    missing.append(param)
+
+            flight = _Flight() if missing else None
+            for param in missing:
+                self._in_flight[param] = flight
+
+        if flight is not None:
+            try:
+                self._fetch(missing)
+            except BaseException as err:
+                flight.error = err
+                raise
+            finally:
+                with self._cache_lock:
+                    for param in missing:
+                        if self._in_flight.get(param) is flight:
+                            del self._in_flight[param]
+                flight.done.set()
+
+        for other in joined:
+            # The reading thread always finishes within its socket timeouts
+            other.done.wait()
+            if other.error is not None:
+                raise TimeoutError(f"No response from {self._host}") from other.error
+
+        raw = self._raw
+        return LazyValues(self, {param: raw[param] for param in wanted if param in raw})
+
+    def _param_sizes(self, param_ids) -> dict:
+        """{param_id: expected value size} for frame packing, 4 for unknown sizes."""
+        functions = self.functions
+        sizes = {}
+        for param in param_ids:
+            register = functions.get(param)
+            sizes[param] = register.length if register is not None and register.length else 4
+        return sizes
+
+    def _fetch(self, param_ids):
+        """Read parameters from the device, packed into as few frames as possible."""
+        for frame in self._pack_frames(self._param_sizes(param_ids)):
+            if self.request(self.COMMAND_READ, None, self._encode_read_block(frame)) is None:
+                raise TimeoutError(f"No response from {self._host}")
+
+    def read_all_registers(self) -> dict:
+        """
+        Read every readable register of the unit's map in as few frames as possible.
+        Returns {param_id: value}; registers the unit does not support map to None.
+        """
+        return self.read_parameters(
+            (param for param, register in self.functions.items() if register.refresh != "command"),
+            max_age=0,
+        )
+
+    def probe(self, timeout=PROBE_TIMEOUT, attempts=PROBE_ATTEMPTS) -> dict:
+        """
+        Read device ID, unit type, firmware and network settings in a single
+        frame, with a short timeout and a quick retry so a wrong address fails
+        fast. Returns {param_id: value}; raises TimeoutError without a reply.
+        """
+        block = self._encode_read_block(self.PROBE_PARAMS)
+        for _ in range(attempts):
+            values = self.request(self.COMMAND_READ, None, block, timeout=timeout)
+            if values is not None:
+                return values
+
+        raise TimeoutError(f"No response from {self._host}")
+
+    def write_parameters(self, values: dict) -> dict:
+        """
+        Write {param_id: value} using as few write-then-read frames as possible.
+        Values are encoded as in write_many().
+        Returns the values echoed back by the device.
+        Raises TimeoutError if the device does not respond.
+        """
+        encoded = {param: self.encode_value(param, value) for param, value in values.items()}
+        sizes = {param: len(value) for param, value in encoded.items()}
+
+        echoed = {}
+        for frame in self._pack_frames(sizes):
+            echoed.update(self.write_many({param: encoded[param] for param in frame}).raw)
+
+        return LazyValues(self, echoed)
+
+    @classmethod
+    def discover(
+        cls,
+        broadcast_address="255.255.255.255",
+        port=4000,
+        password="1111",
+        timeout=2.0,
+        device_id=None,
+    ) -> list:
+        """
+        Broadcast a device search and collect the replies.
+        Returns [{"host", "device_id", "unit_type", "model"}]. If device_id is
+        given, returns as soon as that unit has answered.
+        """
+        probe = cls(broadcast_address, port=port, password=password)
+        packet = probe.build_packet(
+            cls.COMMAND_READ,
+            None,
+            probe._encode_read_block([cls.FUNCTION_DEVICE_ID, cls.FUNCTION_UNIT_TYPE]),
+        )
+
+        found = []
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+            sock.sendto(packet, (broadcast_address, port))
+
+            deadline = time.monotonic() + timeout
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                sock.settimeout(remaining)
+                try:
+                    response, address = sock.recvfrom(cls.MAX_PACKET_SIZE)
+                except socket.timeout:
+                    break
+
+                unit = cls(address[0], port=port, password=password)
+                try:
+                    values = unit.parse_response(response)
+                except (ValueError, IndexError):
+                    continue
+
+                found_id = values.get(cls.FUNCTION_DEVICE_ID)
+                if not found_id:
+                    continue
+
+                found.append({
+                    "host": address[0],
+                    "device_id": found_id,
+                    "unit_type": values.get(cls.FUNCTION_UNIT_TYPE),
+                    "model": unit.device_model,
+                })
+                if device_id is not None and found_id == device_id:
+                    break
         finally:
-            if hasattr(self, "socket"):
-                self.socket.close()
+            sock.close()
+
+        return found
+
+    def relocate(self, broadcast_address="255.255.255.255", timeout=2.0) -> str | None:
+        """
+        Search for this unit's device ID by broadcast, e.g. after its DHCP lease
+        changed. Moves the API to the new address and returns it, or None if the
+        unit did not answer or is still at the same address.
+        """
+        if self._device_id == DEFAULT_DEVICE_ID:
+            return None
+
+        for unit in self.discover(
+            broadcast_address,
+            port=self._port,
+            password=self._password,
+            timeout=timeout,
+            device_id=self._device_id,
+        ):
+            if unit["device_id"] != self._device_id or unit["host"] == self._host:
+                continue
+
+            _LOGGER.info("%s moved from %s to %s", self._name, self._host, unit["host"])
+            self._host = unit["host"]
+            self.close()
+            # The address settings are stale now, read them again when needed
+            for param in (self.FUNCTION_NET_DEVICE_IP, self.FUNCTION_NET_SETTINGS__DEVICE_IP):
+                self._forget(param)
+            self.health.record_success()
+            return self._host
+
+        return None
 
     def get_device_info(self):
         self.send_command_and_process_response(self.COMMAND_READ, self.FUNCTION_DEVICE_ID)
 
     def get_firmware_version(self):
         """Query and cache firmware version from device."""
-        if hasattr(self, "_firmware_version"):
-            print("*** CACHED: Get Firmware Version ***")
-            return self._firmware_version  # already cached
+        if hasattr(self, "_device_firmware"):
+            return self._device_firmware  # already cached
 
         try:
             self.send_command_and_process_response(self.COMMAND_READ, self.FUNCTION_FW_VERSION)
@@ -188,130 +732,343 @@ class BlaubergVentoApi(object):
             _LOGGER.warning("Failed to get firmware version: %s", e)
             return None
 
-        return getattr(self, "_firmware_version", "unknown")
-
-    @staticmethod
-    def _decode_firmware_version(data: bytes) -> str:
-        if len(data) < 6:
-            return "Unknown"
-        major = data[0]
-        minor = data[1]
-        day = data[2]
-        month = data[3]
-        year = int.from_bytes(data[4:6], byteorder="little")
-        return f"{major}.{minor} ({year:04d}-{month:02d}-{day:02d})"
-
-    def get_network_info(self):
-        """
-        Request network information (DHCP mode, IP, subnet, gateway)
-        in a single combined frame.
-        """
-
-        functions = [
-            self.FUNCTION_NET_SETTINGS__DHCP,
-            self.FUNCTION_NET_SETTINGS__DEVICE_IP,
-            self.FUNCTION_NET_SETTINGS__SUBNET,
-            self.FUNCTION_NET_SETTINGS_GATEWAY,
-            self.FUNCTION_NET_DEVICE_IP,
-        ]
-
-        # Build concatenated data: each function as 2-byte little endian
-        data = b"".join(f.to_bytes(2, "little") for f in functions)
-        self.send_command_and_process_response(self.COMMAND_READ, 0x0000, data)
-
-    def get_diagnostic_info(self):
-        """Request diagnostic info"""
-        functions = [
-            self.FUNCTION_BATTERY_VOLTAGE,
-            self.FUNCTION_MACHINE_HOURS,
-            self.FUNCTION_FILTER_REPLACEMENT,
-            self.FUNCTION_FILTER_REPLACEMENT_COUNTDOWN,
-            self.FUNCTION_FAN1_SPEED
-        ]
-
-        if self.device_model_id != 27:
-            functions.append(self.FUNCTION_FAN2_SPEED)
-
-        # Build concatenated data: each function as 2-byte little endian
-        data = b"".join(f.to_bytes(2, "little") for f in functions)
-        self.send_command_and_process_response(self.COMMAND_READ, 0x0000, data)
+        return getattr(self, "_device_firmware", "unknown")
 
     def reset_filter_replacement(self):
-        """Resets filter replacement countdown."""
-
-        self.send_command_and_process_response(self.COMMAND_WRITE, self.FUNCTION_FILTER_REPLACEMENT_COUNTDOWN_RESET, bytes.fromhex("00"))
-        self.get_diagnostic_info()
-
-    def update_status(self):
-        """Update device status - on/off, fan speed, alarm etc."""
-        functions = [
-            self.FUNCTION_DEVICE_ON,
-            self.FUNCTION_FAN_SPEED_TRESHOLD,
-            self.FUNCTION_OPERATION_MODE,
-            self.FUNCTION_ALARM_STATUS,
-            self.FUNCTION_CURRENT_HUMIDITY
-        ]
+        """
+        Resets filter replacement countdown. The write expires the read cache,
+        the next poll picks up the new countdown.
+        """
+        self.write_many({self.FUNCTION_FILTER_REPLACEMENT_COUNTDOWN_RESET: 0})
 
-        # Build concatenated data: each function as 2-byte little endian
-        data = b"".join(f.to_bytes(2, "little") for f in functions)
-        self.send_command_and_process_response(self.COMMAND_READ, 0x0000, data)
+    def poll(self, param_ids, deadline=None) -> dict:
+        """
+        Read the given parameters (one or more frames) and run the humidity boost
+        loop on the fresh sample. Returns {param_id: value}.
+        Never served from the cache, but joins a read of the same parameters
+        that is already in flight.
+
+        With a deadline (time.monotonic()) that the packed frames are not
+        expected to meet, priority registers (on/off, speed, mode, humidity,
+        alarm) are read first and always. The remaining frames, those holding
+        the stalest values first, are only sent while the estimated round trip
+        still fits; the rest is deferred to a later poll and listed in
+        last_deferred.
+        """
+        frames = self._pack_frames(self._param_sizes(param_ids))
+        if deadline is None or time.monotonic() + len(frames) * self._frame_estimate() <= deadline:
+            # Budget is plentiful - one packed read, as few frames as possible
+            self.last_deferred = []
+            return self._after_poll(self.read_parameters(param_ids, max_age=0))
+
+        functions = self.functions
+        priority = []
+        rest = []
+        for param in param_ids:
+            register = functions.get(param)
+            if register is not None and register.refresh in self.PRIORITY_REFRESH_CLASSES:
+                priority.append(param)
+            else:
+                rest.append(param)
+
+        raw = {}
+        if priority:
+            raw.update(self.read_parameters(priority, max_age=0).raw)
+
+        deferred = []
+        if rest:
+            fetched = self._fetched
+            frames = sorted(
+                self._pack_frames(self._param_sizes(rest)),
+                key=lambda frame: min(fetched.get(param, 0.0) for param in frame),
+            )
+            for index, frame in enumerate(frames):
+                if deadline is not None and time.monotonic() + self._frame_estimate() > deadline:
+                    deferred = [param for frame in frames[index:] for param in frame]
+                    break
+                raw.update(self.read_parameters(frame, max_age=0).raw)
+
+        self.last_deferred = deferred
+        if deferred:
+            self.stats["deferred"] += len(deferred)
+            _LOGGER.debug("%s: poll budget spent, deferring %d registers", self._name, len(deferred))
+
+        return self._after_poll(LazyValues(self, raw))
+
+    def _after_poll(self, values: LazyValues) -> LazyValues:
+        """Feed the RTC drift model and the humidity boost loop from a fresh poll."""
+        if self.FUNCTION_RTC_TIME in values and self.FUNCTION_RTC_DATE in values:
+            device_time = self.rtc_datetime
+            if device_time is not None:
+                self.rtc_model.add_sample(device_time)
+
+        if self.humidity_boost is not None and self.FUNCTION_CURRENT_HUMIDITY in values:
+            self.humidity_boost.evaluate(self)
+
+        return values
+
+    def _frame_estimate(self) -> float:
+        """Expected time of one more frame: twice the average round trip so far."""
+        stats = self.stats
+        if not stats["rtt_count"]:
+            return self.DEFAULT_FRAME_ESTIMATE
+        return 2 * stats["rtt_sum"] / stats["rtt_count"]
 
     def reset_alarm_status(self):
         """Resets alarm status."""
-        self.send_command_and_process_response(self.COMMAND_WRITE, self.FUNCTION_ALARM_RESET, bytes.fromhex("01"))
-
-    def get_config_info(self):
-        """Update device status - on/off, fan speed, alarm etc."""
-        functions = [
-            self.FUNCTION_RTC_TIME,
-            self.FUNCTION_RTC_DATE,
-        ]
-
-        # Build concatenated data: each function as 2-byte little endian
-        data = b"".join(f.to_bytes(2, "little") for f in functions)
-        self.send_command_and_process_response(self.COMMAND_READ, 0x0000, data)
+        self.write_many({self.FUNCTION_ALARM_RESET: 1})
 
     def set_date_and_time(self, year, month, day, dayOfWeek, hours, minutes, seconds):
         """Update device RTC clock."""
 
-        year_byte = year - 2000
-        time_bytes = bytes([seconds, minutes, hours])
-        date_bytes = bytes([day, dayOfWeek, month, year_byte])
+        try:
+            self.write_many({
+                self.FUNCTION_RTC_TIME: (hours, minutes, seconds),
+                # raw bytes to keep the caller's day of week
+                self.FUNCTION_RTC_DATE: bytes([day, dayOfWeek, month, year - 2000]),
+            })
+        except TimeoutError:
+            return 1
+
+        # The clock has been set - previous drift samples no longer apply
+        self.rtc_model.reset()
+        return 0
+
+    def sync_time(self, now: datetime = None):
+        """Set the device RTC to the local time."""
+        if now is None:
+            now = datetime.now()
+        return self.set_date_and_time(
+            now.year, now.month, now.day, now.isoweekday(), now.hour, now.minute, now.second
+        )
 
-        block_time = bytes([0xFE, 0x03]) + self.FUNCTION_RTC_TIME.to_bytes(1, 'big') + time_bytes
-        block_date = bytes([0xFE, 0x03]) + self.FUNCTION_RTC_DATE.to_bytes(1, 'big') + date_bytes
+    def _encode_write_block(self, values: dict) -> bytes:
+        """
+        Encode {param_id: value_bytes} as a write data block.
+        Adds 0xFF page markers for parameters above 0xFF and 0xFE size markers
+        for values longer than one byte.
+        """
+        block = b""
+        page = 0x00
+        for param, value in sorted(values.items()):
+            if (param >> 8) != page:
+                page = param >> 8
+                block += bytes([0xFF, page])
+            if len(value) != 1:
+                block += bytes([0xFE, len(value)])
+            block += bytes([param & 0xFF]) + value
+        return block
+
+    def encode_value(self, param: int, value) -> bytes:
+        """
+        Encode a value for the given parameter using the register map.
+        bytes are sent as-is; for unknown parameters ints are one byte and
+        strings are hex (with or without 0x).
+        Raises ValueError, TypeError or OverflowError for values that don't fit.
+        """
+        if isinstance(value, (bytes, bytearray)):
+            return bytes(value)
 
-        payload = block_time + block_date
+        register = self.functions.get(param)
+        if register is not None and register.encoder is not None:
+            return register.encoder(value)
 
-        self.send_command_and_process_response(self.COMMAND_WRITETHANREAD, 0x0000, payload)
+        if isinstance(value, str):
+            return bytes_from_hex(value)
+        return int(value).to_bytes(1, "little")
 
-    def turn_on(self, speed_treshold=1, operation_mode=1):
-        """Turn device on / wake up fron stand-by."""
+    def write_many(self, values: dict, command: int = COMMAND_WRITETHANREAD) -> dict:
+        """
+        Write {param_id: value} in a single frame.
+        Values are encoded by register type (see encode_value), page and size
+        markers are inserted automatically.
+
+        With write-then-read the echo of every known register is compared with
+        what was sent; parameters that differ are retransmitted on their own,
+        up to WRITE_RETRIES times.
+
+        Returns the values echoed back by the device.
+        Raises ValueError if the values don't fit one frame, TimeoutError
+        if the device does not respond and BlaubergVentoWriteError if
+        values still differ after the retries.
+        """
+        encoded = {param: self.encode_value(param, value) for param, value in values.items()}
+        block = self._encode_write_block(encoded)
+
+        if self._frame_overhead() + len(block) > self.MAX_PACKET_SIZE:
+            raise ValueError("Too many parameters for a single frame, use write_parameters()")
+
+        echoed = {}
+        pending = encoded
+        for attempt in range(self.WRITE_RETRIES + 1):
+            result = self.request(command, None, block)
+            if result is None:
+                raise TimeoutError(f"No response from {self._host}")
+            if command != self.COMMAND_WRITETHANREAD:
+                return result
+
+            echoed.update(result.raw)
+            pending = self._mismatched(pending, echoed)
+            if not pending:
+                return LazyValues(self, echoed)
+            if any(echoed.get(param) is None for param in pending):
+                # Unsupported parameter - retransmitting won't help
+                break
+
+            _LOGGER.debug(
+                "%s did not take 0x%s, retransmitting (attempt %d)",
+                self._name, ", 0x".join(f"{param:04X}" for param in pending), attempt + 1,
+            )
+            block = self._encode_write_block(pending)
+
+        raise BlaubergVentoWriteError(
+            f"{self._name} did not accept "
+            + ", ".join(f"0x{param:04X}" for param in sorted(pending)),
+            mismatched={param: (value, echoed.get(param)) for param, value in pending.items()},
+        )
+
+    def _mismatched(self, sent: dict, echoed: dict) -> dict:
+        """Sent {param_id: bytes} whose echo differs, for registers that echo what was written."""
+        functions = self.functions
+        mismatched = {}
+        for param, value in sent.items():
+            register = functions.get(param)
+            if register is None or register.refresh in self.UNVERIFIED_REFRESH_CLASSES:
+                continue
+            if echoed.get(param) != value:
+                mismatched[param] = value
+        return mismatched
+
+    def _schedule_frames(self, blocks: list) -> list:
+        """Group encoded schedule slots so that no reply exceeds MAX_PACKET_SIZE."""
+        per_frame = (self.MAX_PACKET_SIZE - self._frame_overhead()) // schedule.SLOT_SIZE_ON_WIRE
+        return [b"".join(blocks[i:i + per_frame]) for i in range(0, len(blocks), per_frame)]
+
+    def _parse_schedule(self, response: bytes) -> list:
+        """Schedule slots of a response as [(day, period, speed, hour, minute)]."""
+        slots = []
+        for func_block in self.parse_functions(self.extract_payload(response)):
+            for _, param, value in self.parsebytes(func_block, {}):
+                if param != schedule.SCHEDULE_PARAM:
+                    continue
+                if value is None:
+                    raise BlaubergVentoError(f"{self._name} does not support schedules")
+                slots.append(schedule.decode_slot(value))
+        return slots
+
+    def read_schedule(self) -> schedule.ScheduleTable:
+        """
+        Read the whole weekly schedule (7 days x 4 periods) in as few frames as
+        possible and cache it in self.schedule.
+        Raises TimeoutError if the device does not respond.
+        """
+        table = schedule.ScheduleTable()
+        self._read_slots(table, schedule.slots())
+        self.schedule = table
+        return table
+
+    def _read_slots(self, table: schedule.ScheduleTable, slots):
+        """Read the given (day, period) slots from the device into table."""
+        blocks = [schedule.encode_slot_request(day, period) for day, period in sorted(slots)]
+        for frame in self._schedule_frames(blocks):
+            values = self.request(self.COMMAND_READ, None, frame, parser=self._parse_schedule)
+            if values is None:
+                raise TimeoutError(f"No response from {self._host}")
+            for day, period, speed, hour, minute in values:
+                table.set(day, period, speed, hour, minute)
+
+    def set_schedule(self, slots: dict) -> int:
+        """
+        Set schedule slots {(day, period): (speed, end hour, end minute)}.
+        The given slots are read back first (the vendor app or the unit's panel
+        may have changed them since the table was cached); only those that
+        differ are written, batched into as few write-then-read frames as
+        possible. Returns the number of slots written. Raises TimeoutError if
+        the device does not respond.
+        """
+        if self.schedule is None:
+            self.read_schedule()
+        else:
+            self._read_slots(self.schedule, slots)
+
+        target = self.schedule.copy()
+        for (day, period), (speed, hour, minute) in slots.items():
+            target.set(day, period, speed, hour, minute)
+
+        changed = self.schedule.changed_slots(target)
+        blocks = [schedule.encode_slot(day, period, *target.get(day, period)) for day, period in changed]
+        for frame in self._schedule_frames(blocks):
+            echoed = self.request(self.COMMAND_WRITETHANREAD, None, frame, parser=self._parse_schedule)
+            if echoed is None:
+                # State of the unit unknown now, read it again next time
+                self.schedule = None
+                raise TimeoutError(f"No response from {self._host}")
+            for day, period, speed, hour, minute in echoed:
+                self.schedule.set(day, period, speed, hour, minute)
+
+        return len(changed)
+
+    def set_state(self, power=None, speed_treshold=None, operation_mode=None, manual_speed=None):
+        """
+        Set power, speed and/or operation mode in a single write-then-read frame.
+        manual_speed (0-255) switches the unit to manual speed mode.
+        Returns 0 on success, 1 if the device did not respond.
+        """
+        values = {}
+        if power is not None:
+            values[self.FUNCTION_DEVICE_ON] = 1 if power else 0
+        if manual_speed is not None:
+            values[self.FUNCTION_FAN_SPEED_TRESHOLD] = self.FAN_SPEED_MANUAL
+            values[self.FUNCTION_MANUAL_SPEED] = manual_speed
+        elif speed_treshold is not None:
+            values[self.FUNCTION_FAN_SPEED_TRESHOLD] = speed_treshold
+        if operation_mode is not None:
+            values[self.FUNCTION_OPERATION_MODE] = operation_mode
+
+        if not values:
+            return 0
+
+        try:
+            self.write_many(values)
+        except TimeoutError:
+            return 1
+        return 0
 
-        speed_byte = int(speed_treshold).to_bytes(1, "big")
-        mode_byte = int(operation_mode).to_bytes(1, "big")
+    def step_speed(self, up: bool = True) -> int | None:
+        """
+        Step the speed threshold one up or down with the device's native
+        increment/decrement command. The device applies the step itself, so
+        there is no read-modify-write race; the reply carries the new speed.
+        Returns the new speed threshold. Raises TimeoutError if the device does not respond.
+        """
+        command = self.COMMAND_INCREMENT if up else self.COMMAND_DECREMENT
+        result = self.request(
+            command, None, self._encode_read_block([self.FUNCTION_FAN_SPEED_TRESHOLD])
+        )
+        if result is None:
+            raise TimeoutError(f"No response from {self._host}")
+        return result.get(self.FUNCTION_FAN_SPEED_TRESHOLD)
 
-        block_turn_on = bytes([0xFE, 0x03, self.FUNCTION_DEVICE_ON, 0x01])
-        block_fan_speed = bytes([0xFE, 0x03, self.FUNCTION_FAN_SPEED_TRESHOLD]) + speed_byte
-        block_operation_mode = bytes([0xFE, 0x03, self.FUNCTION_OPERATION_MODE]) + mode_byte
-        payload  = block_turn_on + block_fan_speed + block_operation_mode
+    def turn_on(self, speed_treshold=1, operation_mode=1):
+        """Turn device on / wake up fron stand-by."""
+        return self.set_state(True, speed_treshold, operation_mode)
 
-        self.send_command_and_process_response(self.COMMAND_WRITETHANREAD, None, payload)
+    def set_manual_speed(self, speed: int):
+        """Turn on in manual speed mode at speed 0-255."""
+        return self.set_state(True, manual_speed=speed)
 
     def turn_off(self):
         """Turn device off / put into fron stand-by.
         *** WARNING! Please be aware that this command actually does not turn off the device. It will work in stand-by mode. In some cases (depends on jumper configuration) the device can operate with minimum power while in stand by mode.***
         """
-
-        self.send_command_and_process_response(self.COMMAND_WRITETHANREAD, self.FUNCTION_DEVICE_ON, bytes.fromhex("00"))
+        return self.set_state(power=False)
 
     def set_operation_mode(self, mode=1):
         """
         Set operation mode.
         0 - ventilation 1 - heat recovery 2 - air supply
         """
-        print("SET OPERATION MODE")
-        self.send_command_and_process_response(self.COMMAND_WRITETHANREAD, self.FUNCTION_OPERATION_MODE, int(mode).to_bytes(1, 'big'))
+        return self.set_state(operation_mode=mode)
 
     def extract_payload(self, response: bytes) -> bytes:
         """Strip the frame markers, header, and checksum."""
@@ -362,8 +1119,6 @@ class BlaubergVentoApi(object):
             # First byte in block is function ID
             if func_id is None:
                 func_id = b
-
-                _LOGGER.debug("📦 Function ID: 0x%02X", func_id)
                 continue
 
             # Special control bytes
@@ -376,19 +1131,21 @@ class BlaubergVentoApi(object):
                 high_byte = next(i, 0)
                 continue
             elif b == 0xFD:
-                # Skip unsupported parameter
-                _ = next(i, None)
+                # Unsupported parameter - report it without a value
+                param_id = (high_byte << 8) | next(i, 0)
+                yield (func_id, param_id, None)
                 continue
             elif b == 0xFC:
                 # End of current function block
-                _LOGGER.debug("🔚 End of function 0x%02X", func_id)
                 break
 
             # Combine high and low byte to make full parameter ID
             param_id = (high_byte << 8) | b
 
             # Determine parameter length
-            length = params.get(param_id, {}).get("length", param_size)
+            register = params.get(param_id)
+            length = register.length if register is not None and register.length else param_size
+            param_size = 1  # size marker only applies to the next parameter
 
             # Read parameter value
             value_bytes = bytes(next(i, 0) for _ in range(length))
@@ -396,84 +1153,163 @@ class BlaubergVentoApi(object):
             yield (func_id, param_id, value_bytes)
 
     def parse_response(self, data):
-        """Parse full response frame from fan and decode functions using FUNCTIONS mapping."""
+        """
+        Parse full response frame from fan.
+        Returns {param_id: value} as LazyValues - values are decoded on first
+        access and the decoded value is cached until the raw bytes change.
+        Unknown parameters are returned as hex, unsupported as None.
+        """
+        raw_values = {}
+        changed = {} if self._subscribers else None
+        last_raw = self._raw
+        functions = self.functions
         payload = self.extract_payload(data)
-        _LOGGER.debug("Payload: %s", payload.hex(" "))
 
         for func_block in self.parse_functions(payload):
-            _LOGGER.debug("=== Parsing function block: %s ===", func_block.hex(' '))
-
             # parsebytes yields (func_id, param, value_list)
-            for func_id, param, value_list in self.parsebytes(
-                func_block, self.FUNCTIONS
-            ):
-                # convert value_list (list of ints) to bytes for decoding
-                raw = bytes(value_list)
-
-                if param in self.FUNCTIONS:
-                    info = self.FUNCTIONS[param]
-
-                    if info["type"] == "ascii":
-                        # decode ascii, ignore undecodable bytes
-                        value = (
-                            raw[: info["length"]]
-                            .decode("ascii", errors="ignore")
-                            .rstrip("\x00")
-                        )
-                    elif info["type"] == "uint":
-                        value = int.from_bytes(raw[: info["length"]], "little")
-                    elif info["type"] == "ipv4":
-                        value = ".".join(str(b) for b in raw)
-                    elif info["type"] == "bytes":
-                        value = raw
-                    elif info["type"] == "fw_version":
-                        value = self._decode_firmware_version(raw)
-                    elif info["type"] == "machine_hours":
-                        if len(raw) != 4:
-                            _LOGGER.error("machine_hours - unexpected value length")
-
-                        minutes = raw[0]
-                        hours = raw[1]
-                        days = raw[2] + (raw[3] << 8)
-
-                        value = days * 24 * 60 + hours * 60 + minutes
-                    elif info["type"] == "time":
-                        hour = raw[2]
-                        minute = raw[1]
-                        second = raw[0]
-                        value = f"{hour:02d}:{minute:02d}:{second:02d}"
-                    elif info["type"] == "date":
-                        day = raw[0]
-                        month = raw[2]
-                        year = 2000 + raw[3]
-                        value = f"{year:04d}-{month:02d}-{day:02d}"
-                    elif info["type"] == "time_remaining":
-                        minutes = raw[0]
-                        hours = raw[1]
-                        days = raw[2]
-
-                        value = days * 24 + hours + minutes / 60
-                    else:
-                        value = raw.hex(" ")
-
-                    _LOGGER.debug("Function 0x%04X (%s): %s", param, info["type"], value)
+            for func_id, param, value_list in self.parsebytes(func_block, functions):
+                raw = None if value_list is None else bytes(value_list)
+                if changed is None:
+                    raw_values[param] = self._store_raw(param, raw)
+                else:
+                    previous = last_raw.get(param, _MISSING)
+                    raw_values[param] = stored = self._store_raw(param, raw)
+                    if stored is not previous:
+                        changed[param] = stored
+                if param == self.FUNCTION_UNIT_TYPE:
+                    functions = self.functions
 
+        if changed:
+            self._dispatch(changed)
 
-                    # --- assign dynamically if property_name is defined ---
-                    prop = info.get("property_name")
-                    if prop:
-                        setattr(self, prop, value)
-                        _LOGGER.debug("Set %s = %s", prop, value)
-                    else:
-                        _LOGGER.debug("No property mapping for 0x%04X", param)
+        return LazyValues(self, raw_values)
 
+    def subscribe(self, param_ids, callback, coalesce: bool = False):
+        """
+        Call callback when any of param_ids (None for every parameter) changes
+        in a response. Unchanged values cost nothing.
+
+        callback(param_id, value) is called per changed parameter, or with
+        coalesce=True once per response as callback({param_id: value}) with
+        all of its changed parameters. Callbacks run in the thread that made
+        the request and must not block.
+        Returns a function that cancels the subscription.
+        """
+        subscription = _Subscription(callback, coalesce)
+        keys = [None] if param_ids is None else list(set(param_ids))
+
+        with self._cache_lock:
+            # Copy on write - _dispatch iterates without the lock
+            subscribers = dict(self._subscribers)
+            for key in keys:
+                subscribers[key] = subscribers.get(key, ()) + (subscription,)
+            self._subscribers = subscribers
+
+        def unsubscribe():
+            with self._cache_lock:
+                subscribers = {}
+                for key, subscriptions in self._subscribers.items():
+                    remaining = tuple(sub for sub in subscriptions if sub is not subscription)
+                    if remaining:
+                        subscribers[key] = remaining
+                self._subscribers = subscribers
+
+        return unsubscribe
+
+    def _dispatch(self, changed: dict):
+        """Notify subscribers of {param_id: raw} that changed in one response."""
+        subscribers = self._subscribers
+        catch_all = subscribers.get(None, ())
+        batches = {}
+
+        for param, raw in changed.items():
+            for subscription in subscribers.get(param, ()) + catch_all:
+                if subscription.coalesce:
+                    batches.setdefault(subscription, {})[param] = raw
                 else:
-                    _LOGGER.debug("⚠️ Unknown function 0x%04X (func 0x%02X): %s", param, func_id, raw.hex(" "))
+                    subscription.notify(param, self.decode(param, raw))
+
+        for subscription, raw in batches.items():
+            subscription.notify(LazyValues(self, raw))
+
+    def _store_raw(self, param: int, raw: bytes | None) -> bytes | None:
+        """
+        Remember the raw bytes of a parameter. Returns the stored object - the
+        previous one if unchanged, so the decode cache still matches it.
+        """
+        previous = self._raw.get(param, _MISSING)
+        if previous == raw:
+            return previous
+
+        self._raw[param] = raw
+        register = self.functions.get(param)
+        if register is None or not register.property_name:
+            return raw
+
+        if param in self.EAGER_PARAMS:
+            # Identity registers address the unit and select its register map
+            if raw is not None:
+                setattr(self, register.property_name, register.decoder(raw))
+                if param == self.FUNCTION_UNIT_TYPE:
+                    self._decoded.clear()
+        else:
+            # Drop a stale value so attribute access falls through to __getattr__
+            self.__dict__.pop(register.property_name, None)
+        return raw
+
+    def _forget(self, param: int):
+        """Drop the known value of a parameter."""
+        self._raw.pop(param, None)
+        register = self.functions.get(param)
+        if register is not None and register.property_name:
+            self.__dict__.pop(register.property_name, None)
+
+    def export_raw(self, param_ids=None) -> dict:
+        """Known raw values as {"0x0086": "hex"}, e.g. to store in the config entry."""
+        return {
+            f"0x{param:04X}": raw.hex()
+            for param, raw in self._raw.items()
+            if raw is not None and (param_ids is None or param in param_ids)
+        }
+
+    def import_raw(self, values: dict):
+        """Restore raw values saved with export_raw() without asking the device."""
+        for key, raw in values.items():
+            self._store_raw(int(key, 16), bytes.fromhex(raw))
+
+    def decode(self, param: int, raw: bytes | None):
+        """Decoded value of a parameter, cached until its raw bytes change."""
+        cached = self._decoded.get(param)
+        if cached is not None and cached[0] is raw:
+            return cached[1]
+
+        if raw is None:
+            value = None
+        else:
+            register = self.functions.get(param)
+            value = register.decoder(raw) if register is not None else raw.hex(" ")
+        self._decoded[param] = (raw, value)
+        return value
+
+    def __getattr__(self, name):
+        """Register properties (e.g. _current_humidity) are decoded on first access."""
+        state = self.__dict__
+        if "_raw" not in state:
+            raise AttributeError(name)
+        param = property_map(state.get("_device_model_id")).get(name)
+        if param is None or param not in state["_raw"]:
+            raise AttributeError(name)
+        return self.decode(param, state["_raw"][param])
 
     @property
     def device_id(self) -> str:
         return self._device_id
 
+    @property
+    def available(self) -> bool:
+        """False while the circuit breaker is open."""
+        return self.health.available
+
     @property
     def device_model(self) -> str:
         if getattr(self, "_device_model_id", None) is None:
@@ -485,6 +1321,11 @@ class BlaubergVentoApi(object):
     def device_model_id(self) -> int:
         return self._device_model_id
 
+    @property
+    def functions(self) -> dict:
+        """Register map ({param_id: Register}) for this unit type."""
+        return register_map(self._device_model_id)
+
     @property
     def device_firmware(self) -> str:
         return self._device_firmware
@@ -506,6 +1347,7 @@ class BlaubergVentoApi(object):
         try:
             socket.inet_aton(ip)
             self._host = ip
+            self.close()
         except socket.error:
             sys.exit()
 
@@ -542,6 +1384,18 @@ class BlaubergVentoApi(object):
 
         return self.FAN_MODES[mode]
 
+    @property
+    def rtc_datetime(self) -> datetime | None:
+        """Last RTC reading from the device."""
+        date = getattr(self, "_rtc_date", None)
+        time = getattr(self, "_rtc_time", None)
+        if date is None or time is None:
+            return None
+        try:
+            return datetime.strptime(f"{date} {time}", "%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            return None
+
     @property
     def available_modes(self):
         return list(self.FAN_MODES.values())
@@ -0,0 +1,92 @@
+"""Per-device health tracking with a fast-fail circuit breaker"""
+
+import threading
+import time
+
+import logging
+_LOGGER = logging.getLogger(__name__)
+
+HEALTHY = "healthy"
+DEGRADED = "degraded"
+OPEN = "open"
+
+DEGRADED_AFTER = 1
+OPEN_AFTER = 3
+PROBE_INTERVAL = 60
+
+
+class DeviceHealth(object):
+    """
+    Health state machine driven by consecutive request failures.
+
+    healthy  - last request succeeded
+    degraded - at least DEGRADED_AFTER consecutive failures, requests still sent
+    open     - OPEN_AFTER consecutive failures; requests fail immediately except
+               for one probe every PROBE_INTERVAL seconds. A successful probe
+               closes the breaker.
+    """
+
+    def __init__(
+        self,
+        name="",
+        degraded_after=DEGRADED_AFTER,
+        open_after=OPEN_AFTER,
+        probe_interval=PROBE_INTERVAL,
+    ):
+        self._name = name
+        self._degraded_after = degraded_after
+        self._open_after = open_after
+        self._probe_interval = probe_interval
+
+        self._lock = threading.Lock()
+        self._state = HEALTHY
+        self._failures = 0
+        self._next_probe = 0.0
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    @property
+    def consecutive_failures(self) -> int:
+        return self._failures
+
+    @property
+    def available(self) -> bool:
+        return self._state != OPEN
+
+    def allow_request(self, now=None) -> bool:
+        """False while the breaker is open, except for one probe per interval."""
+        with self._lock:
+            if self._state != OPEN:
+                return True
+            if now is None:
+                now = time.monotonic()
+            if now < self._next_probe:
+                return False
+            self._next_probe = now + self._probe_interval
+            _LOGGER.debug("Probing %s", self._name)
+            return True
+
+    def record_success(self):
+        with self._lock:
+            if self._state != HEALTHY:
+                _LOGGER.info("%s is reachable again", self._name)
+            self._failures = 0
+            self._state = HEALTHY
+
+    def record_failure(self, now=None):
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self._open_after:
+                if self._state != OPEN:
+                    _LOGGER.warning(
+                        "%s failed %d requests in a row, pausing requests",
+                        self._name, self._failures,
+                    )
+                    if now is None:
+                        now = time.monotonic()
+                    self._next_probe = now + self._probe_interval
+                self._state = OPEN
+            elif self._failures >= self._degraded_after:
+                self._state = DEGRADED
@@ -0,0 +1,125 @@
+"""Local humidity boost control loop for Blauberg Vento"""
+
+import time
+
+from .fan_api import BlaubergVentoWriteError
+
+import logging
+_LOGGER = logging.getLogger(__name__)
+
+
+class HumidityBoost(object):
+    """
+    Raise the fan speed while humidity is above a threshold.
+
+    The loop is evaluated by the API right after every fresh humidity sample,
+    so the boost write goes out in the same executor job as the poll itself.
+    """
+
+    def __init__(
+        self,
+        threshold=70,
+        hysteresis=5,
+        boost_speed=3,
+        min_on_time=300,
+        cooldown=600,
+    ):
+        self._threshold = threshold
+        self._hysteresis = hysteresis
+        self._boost_speed = boost_speed
+        self._min_on_time = min_on_time
+        self._cooldown = cooldown
+
+        self._active = False
+        self._started = None
+        self._ended = None
+        self._restore = None
+
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    def evaluate(self, api, now=None):
+        """Check the latest humidity sample and start or stop the boost."""
+        humidity = getattr(api, "_current_humidity", None)
+        if humidity is None:
+            return
+
+        if now is None:
+            now = time.monotonic()
+
+        if not self._active:
+            self._maybe_start(api, humidity, now)
+        else:
+            self._maybe_stop(api, humidity, now)
+
+    def _maybe_start(self, api, humidity, now):
+        if humidity < self._threshold:
+            return
+
+        if self._ended is not None and now - self._ended < self._cooldown:
+            return
+
+        device_on = getattr(api, "_device_on", None)
+        speed = getattr(api, "_fan_speed_treshold", None)
+        mode = getattr(api, "_operation_mode", None)
+
+        if device_on == 1 and speed is not None and speed != 255 and speed >= self._boost_speed:
+            # Already running at (or above) the boost speed - nothing to do.
+            return
+
+        _LOGGER.debug(
+            "Humidity %s%% >= %s%%, boosting %s to speed %s",
+            humidity, self._threshold, api.name, self._boost_speed,
+        )
+
+        if not self._write(api.turn_on, self._boost_speed, 1 if mode is None else mode):
+            # Nothing changed, try again on the next sample
+            _LOGGER.warning("Humidity boost of %s failed", api.name)
+            return
+
+        self._restore = (device_on, speed, mode)
+        self._active = True
+        self._started = now
+
+    def _maybe_stop(self, api, humidity, now):
+        if humidity > self._threshold - self._hysteresis:
+            return
+
+        if now - self._started < self._min_on_time:
+            return
+
+        device_on, speed, mode = self._restore
+
+        _LOGGER.debug(
+            "Humidity %s%% back below %s%%, restoring %s",
+            humidity, self._threshold - self._hysteresis, api.name,
+        )
+
+        if device_on == 0:
+            restored = self._write(api.turn_off)
+        elif speed is not None:
+            restored = self._write(api.turn_on, speed, 1 if mode is None else mode)
+        else:
+            restored = True
+        if not restored:
+            # Still boosting - keep the restore state and retry on the next sample
+            _LOGGER.warning("Restoring %s after humidity boost failed", api.name)
+            return
+
+        self._active = False
+        self._restore = None
+        self._ended = now
+
+    @staticmethod
+    def _write(write, *args) -> bool:
+        """
+        Run a set_state() style write; False if the unit did not answer or did
+        not take the values. Never raises for those, so the poll that evaluated
+        the boost still returns what it read.
+        """
+        try:
+            return write(*args) == 0
+        except BlaubergVentoWriteError as err:
+            _LOGGER.debug("Humidity boost write rejected: %s", err)
+            return False
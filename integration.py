@@ -0,0 +1,220 @@
+"""Home Assistant setup of the Blauberg Vento integration"""
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.typing import ConfigType
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers import device_registry as dr
+from homeassistant.const import CONF_SCAN_INTERVAL, EVENT_HOMEASSISTANT_STOP
+import voluptuous as vol
+from .const import (
+    DOMAIN,
+    DEFAULT_PORT,
+    DEFAULT_DEVICE_ID,
+    DEFAULT_PASSWORD,
+    CONF_HUMIDITY_BOOST,
+    CONF_BOOST_THRESHOLD,
+    CONF_BOOST_HYSTERESIS,
+    CONF_BOOST_SPEED,
+    CONF_BOOST_MIN_ON_TIME,
+    CONF_BOOST_COOLDOWN,
+    DEFAULT_BOOST_THRESHOLD,
+    DEFAULT_BOOST_HYSTERESIS,
+    DEFAULT_BOOST_SPEED,
+    DEFAULT_BOOST_MIN_ON_TIME,
+    DEFAULT_BOOST_COOLDOWN,
+    CONF_RTC_SYNC_THRESHOLD,
+    DEFAULT_RTC_SYNC_THRESHOLD,
+    DEFAULT_SCAN_INTERVAL,
+    DATA_SCHEDULER,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    CONF_EXPORTER_PORT,
+    DATA_EXPORTER,
+)
+from .fan_api import BlaubergVentoApi, BlaubergVentoError
+from .humidity_boost import HumidityBoost
+from .coordinator import BlaubergVentoCoordinator
+from .scheduler import BlaubergVentoScheduler
+from .exporter import OpenMetricsExporter
+from .services import async_setup_services
+
+import logging
+_LOGGER = logging.getLogger(__name__)
+
+
+PLATFORMS = ["fan", "sensor", "button", "switch"]
+
+# Optional fleet-wide settings:
+# blauberg_vento:
+#   scan_interval: 30
+#   max_concurrent_requests: 4
+#   exporter_port: 9797   # serve OpenMetrics on http://<ha>:9797/metrics
+CONFIG_SCHEMA = vol.Schema(
+    {
+        DOMAIN: vol.Schema(
+            {
+                vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): cv.positive_int,
+                vol.Optional(CONF_MAX_CONCURRENT_REQUESTS, default=DEFAULT_MAX_CONCURRENT_REQUESTS): cv.positive_int,
+                vol.Optional(CONF_EXPORTER_PORT): cv.port,
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+async def async_setup(hass: HomeAssistant, config: ConfigType):
+    """Set up the Blauberg Vento integration, its fleet scheduler and services."""
+    conf = config.get(DOMAIN, {})
+    hass.data[DATA_SCHEDULER] = BlaubergVentoScheduler(
+        hass,
+        interval=conf.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+        max_concurrent=conf.get(CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS),
+    )
+    async_setup_services(hass)
+
+    if CONF_EXPORTER_PORT in conf:
+        # Rendered from the coordinators' cached state - scrapes cause no device traffic
+        exporter = OpenMetricsExporter(port=conf[CONF_EXPORTER_PORT])
+        try:
+            await hass.async_add_executor_job(exporter.start)
+        except OSError as err:
+            # Optional - don't take the devices down with it
+            _LOGGER.error(
+                "Could not start the metrics exporter on port %s: %s", conf[CONF_EXPORTER_PORT], err
+            )
+        else:
+            hass.data[DATA_EXPORTER] = exporter
+
+            async def _async_stop_exporter(event):
+                await hass.async_add_executor_job(exporter.stop)
+
+            hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop_exporter)
+
+    return True
+
+@callback
+def _async_update_exporter(hass: HomeAssistant):
+    """Hand the exporter thread a fresh snapshot of the configured units."""
+    exporter = hass.data.get(DATA_EXPORTER)
+    if exporter is not None:
+        exporter.set_apis(coordinator.api for coordinator in hass.data.get(DOMAIN, {}).values())
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
+    """Set up one Blauberg Vento device."""
+    data = entry.data
+    host = data["host"]
+    port = data.get("port", DEFAULT_PORT)
+    name = data.get("name")
+    device_id = data.get("device_id", DEFAULT_DEVICE_ID)
+    password = data.get("password", DEFAULT_PASSWORD)
+
+    # Create device API instance
+    api = BlaubergVentoApi(
+        host,
+        port=port,
+        name=name,
+        device_id=device_id,
+        password=password
+    )
+    api._device_model_id = data.get("device_model_id")
+
+    # Optional local humidity boost loop, evaluated on every status poll
+    options = entry.options
+    if options.get(CONF_HUMIDITY_BOOST, False):
+        api.humidity_boost = HumidityBoost(
+            threshold=options.get(CONF_BOOST_THRESHOLD, DEFAULT_BOOST_THRESHOLD),
+            hysteresis=options.get(CONF_BOOST_HYSTERESIS, DEFAULT_BOOST_HYSTERESIS),
+            boost_speed=options.get(CONF_BOOST_SPEED, DEFAULT_BOOST_SPEED),
+            min_on_time=options.get(CONF_BOOST_MIN_ON_TIME, DEFAULT_BOOST_MIN_ON_TIME),
+            cooldown=options.get(CONF_BOOST_COOLDOWN, DEFAULT_BOOST_COOLDOWN),
+        )
+
+    coordinator = BlaubergVentoCoordinator(
+        hass,
+        api,
+        entry.entry_id,
+        hass.data[DATA_SCHEDULER],
+        rtc_sync_threshold=options.get(CONF_RTC_SYNC_THRESHOLD, DEFAULT_RTC_SYNC_THRESHOLD),
+    )
+
+    coordinator.options = dict(options)
+
+    # Store instance in hass.data
+    hass.data.setdefault(DOMAIN, {})
+    hass.data[DOMAIN][entry.entry_id] = coordinator
+    _async_update_exporter(hass)
+
+    # Firmware and network settings were read by the config flow probe;
+    # entries created before that probe once here and keep the result.
+    if "probe" in data:
+        api.import_raw(data["probe"])
+        # The stored values may predate e.g. a firmware update - check in the background
+        entry.async_create_background_task(
+            hass, _async_reprobe(hass, entry, coordinator), f"{DOMAIN} probe {name}"
+        )
+    else:
+        try:
+            await coordinator.async_run(api.probe)
+        except (TimeoutError, OSError) as err:
+            _LOGGER.warning("Could not probe %s: %s", name, err)
+        else:
+            hass.config_entries.async_update_entry(
+                entry, data={**data, "probe": api.export_raw(api.PROBE_PARAMS)}
+            )
+
+     # Forward setup to supported platforms
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    # First poll once the entities (and so the set of registers to read) are known
+    await coordinator.async_refresh()
+    entry.async_on_unload(coordinator.async_setup_registry_listener())
+    entry.async_on_unload(hass.data[DATA_SCHEDULER].async_register(coordinator))
+
+    # Reload the entry when options (e.g. humidity boost) change
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
+    return True
+
+async def _async_reprobe(hass: HomeAssistant, entry: ConfigEntry, coordinator):
+    """Probe the unit again and store the result if its static registers changed."""
+    api = coordinator.api
+    try:
+        await coordinator.async_run(api.probe)
+    except (TimeoutError, OSError, BlaubergVentoError) as err:
+        _LOGGER.debug("Could not probe %s: %s", api.name, err)
+        return
+
+    probe = api.export_raw(api.PROBE_PARAMS)
+    if probe == entry.data.get("probe"):
+        return
+
+    _LOGGER.info("Firmware or network settings of %s changed, updating the entry", api.name)
+    hass.config_entries.async_update_entry(entry, data={**entry.data, "probe": probe})
+
+    # Device info is only written when the entities are added
+    device_registry = dr.async_get(hass)
+    device = device_registry.async_get_device(identifiers={(DOMAIN, api.device_id)})
+    if device is not None:
+        device_registry.async_update_device(
+            device.id, sw_version=getattr(api, "device_firmware", "unknown")
+        )
+
+async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
+    """Unload a config entry."""
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        _async_update_exporter(hass)
+        # Waits for a request still in flight, keep it off the event loop
+        await hass.async_add_executor_job(coordinator.api.close)
+    return unload_ok
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry):
+    """Reload a config entry after its options changed."""
+    coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if coordinator is not None and coordinator.options == entry.options:
+        # Data-only update, e.g. a new address found by the coordinator - already applied
+        return
+    await hass.config_entries.async_reload(entry.entry_id)
+
+#from . import device_action
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""Per-device packet trace buffer"""
+
+from collections import deque
+from datetime import datetime
+import time
+
+import logging
+_LOGGER = logging.getLogger(__name__)
+
+TRACE_SIZE = 32
+
+TX = "tx"
+RX = "rx"
+# Received, but not a reply to the outstanding request
+DISCARDED = "discarded"
+
+
+class PacketTrace(object):
+    """
+    Ring buffer of the last frames exchanged with one unit.
+
+    record() only keeps references to the frame bytes and the parsed values,
+    nothing is formatted on the request path. Debug logging is checked once
+    per frame; the hex dump and decoded fields are built by dump() (diagnostics)
+    or when debug logging is enabled for this module.
+    """
+
+    def __init__(self, name="", size=TRACE_SIZE):
+        self._name = name
+        self._frames = deque(maxlen=size)
+
+    def record(self, direction: str, frame: bytes | None, values=None):
+        """Add a frame; frame is None for a request that got no reply."""
+        self._frames.append((time.time(), direction, frame, values))
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s %s %s %s",
+                self._name,
+                direction,
+                frame.hex(" ") if frame is not None else "<timeout>",
+                _fields(values) if values is not None else "",
+            )
+
+    def clear(self):
+        self._frames.clear()
+
+    def dump(self) -> list:
+        """JSON friendly list of the buffered frames, oldest first."""
+        return [
+            {
+                "time": datetime.fromtimestamp(ts).isoformat(timespec="milliseconds"),
+                "direction": direction,
+                "frame": frame.hex(" ") if frame is not None else None,
+                "values": _fields(values) if values is not None else None,
+            }
+            for ts, direction, frame, values in list(self._frames)
+        ]
+
+    def __len__(self):
+        return len(self._frames)
+
+
+def _fields(values) -> dict:
+    return {
+        f"0x{param:04X}": value.hex(" ") if isinstance(value, bytes) else value
+        for param, value in values.items()
+    }
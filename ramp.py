@@ -0,0 +1,85 @@
+"""Rate-limited ramp toward a manual speed target"""
+
+import asyncio
+
+import logging
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_RAMP_INTERVAL = 1.0
+DEFAULT_RAMP_STEP = 25
+
+
+class SpeedRamp(object):
+    """
+    Move the unit's manual speed (0-255) toward a target in steps of at most
+    `step`, with at most one write every `interval` seconds.
+
+    set_target() only records the newest target. A single task does the
+    writes and picks up the latest target before each one, so dragging a
+    slider results in one write per interval instead of one per position.
+    """
+
+    def __init__(self, write, create_task, interval=DEFAULT_RAMP_INTERVAL, step=DEFAULT_RAMP_STEP):
+        # async write(value) - sends one manual speed to the unit
+        self._write = write
+        # create_task(coro, name) - e.g. hass.async_create_background_task
+        self._create_task = create_task
+        self._interval = interval
+        self._step = step
+
+        self._target = None
+        self._current = None
+        self._last_write = None
+        self._task = None
+
+    @property
+    def target(self):
+        return self._target
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def set_target(self, target: int, current: int | None = None):
+        """
+        Ramp toward target. current is the unit's present manual speed; it is
+        only used when no ramp is running (None writes the target directly).
+        """
+        self._target = max(0, min(255, int(target)))
+        if self.running:
+            return
+
+        self._current = current
+        self._task = self._create_task(self._run(), "blauberg_vento manual speed ramp")
+
+    def cancel(self):
+        """Stop ramping, e.g. when a preset speed or stand-by is set."""
+        if self.running:
+            self._task.cancel()
+        self._task = None
+        self._current = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        try:
+            while self._current != self._target:
+                if self._last_write is not None:
+                    wait = self._last_write + self._interval - loop.time()
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                        continue
+
+                target = self._target
+                if self._current is None:
+                    value = target
+                else:
+                    value = self._current + max(-self._step, min(self._step, target - self._current))
+
+                self._last_write = loop.time()
+                await self._write(value)
+                self._current = value
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:  # noqa: BLE001 - a failed write ends the ramp
+            _LOGGER.warning("Manual speed ramp stopped: %s", err)
+            self._current = None
@@ -0,0 +1,265 @@
+"""
+Register map for Blauberg Vento units.
+
+Registers are described in versioned JSON files in the registers/ directory:
+common.json holds the registers shared by all units and model_<id>.json
+(one per MODEL_MAP key) extends it, adding, overriding or excluding
+registers. The files are compiled once at import into plain dicts of
+{param_id: Register} so lookups in the parse loop stay O(1).
+"""
+
+from collections import namedtuple
+from datetime import date
+import json
+import os
+
+REGISTERS_DIR = os.path.join(os.path.dirname(__file__), "registers")
+REGISTER_MAP_VERSION = 1
+
+# How often a register needs to be read:
+#   status     - every poll (on/off, speed, mode, humidity, alarm)
+#   diagnostic - every poll, lower priority
+#   rtc        - device clock
+#   config     - settings, read on demand
+#   static     - read once (device ID, firmware, network settings)
+#   command    - write-only triggers
+REFRESH_CLASSES = ("status", "diagnostic", "rtc", "config", "static", "command")
+
+Register = namedtuple(
+    "Register",
+    [
+        "param_id",
+        "name",
+        "type",
+        "length",
+        "unit",
+        "refresh",
+        "property_name",
+        "decoder",
+        "encoder",
+    ],
+)
+
+
+# --- decoders: raw bytes -> value ---
+
+def decode_uint(raw: bytes) -> int:
+    return int.from_bytes(raw, "little")
+
+
+def decode_ascii(raw: bytes) -> str:
+    # decode ascii, ignore undecodable bytes
+    return raw.decode("ascii", errors="ignore").rstrip("\x00")
+
+
+def decode_ipv4(raw: bytes) -> str:
+    return ".".join(str(b) for b in raw)
+
+
+def decode_bytes(raw: bytes) -> bytes:
+    return raw
+
+
+def decode_fw_version(raw: bytes) -> str:
+    if len(raw) < 6:
+        return "Unknown"
+    major = raw[0]
+    minor = raw[1]
+    day = raw[2]
+    month = raw[3]
+    year = int.from_bytes(raw[4:6], byteorder="little")
+    return f"{major}.{minor} ({year:04d}-{month:02d}-{day:02d})"
+
+
+def decode_machine_hours(raw: bytes) -> int:
+    """Returns total minutes."""
+    minutes = raw[0]
+    hours = raw[1]
+    days = raw[2] + (raw[3] << 8)
+    return days * 24 * 60 + hours * 60 + minutes
+
+
+def decode_time(raw: bytes) -> str:
+    second = raw[0]
+    minute = raw[1]
+    hour = raw[2]
+    return f"{hour:02d}:{minute:02d}:{second:02d}"
+
+
+def decode_date(raw: bytes) -> str:
+    day = raw[0]
+    month = raw[2]
+    year = 2000 + raw[3]
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+
+def decode_time_remaining(raw: bytes) -> float:
+    """Returns hours."""
+    minutes = raw[0]
+    hours = raw[1]
+    days = raw[2]
+    return days * 24 + hours + minutes / 60
+
+
+def decode_duration(raw: bytes) -> int:
+    """Minutes + hours pair, returns minutes."""
+    return raw[0] + raw[1] * 60
+
+
+# --- encoders: value -> raw bytes (None for read-only types) ---
+
+def _encode_uint(length):
+    def encode(value) -> bytes:
+        return int(value).to_bytes(length or 1, "little")
+    return encode
+
+
+def _encode_ascii(length):
+    def encode(value) -> bytes:
+        data = str(value).encode("ascii")
+        if length:
+            data = data[:length].ljust(length, b"\x00")
+        return data
+    return encode
+
+
+def encode_ipv4(value) -> bytes:
+    return bytes(int(part) for part in str(value).split("."))
+
+
+def bytes_from_hex(value: str) -> bytes:
+    """Hex string, optionally with a 0x prefix ("0x1F00", "1f 00") -> bytes."""
+    value = value.strip()
+    if value[:2].lower() == "0x":
+        value = value[2:]
+    return bytes.fromhex(value)
+
+
+def encode_bytes(value) -> bytes:
+    if isinstance(value, str):
+        return bytes_from_hex(value)
+    return bytes(value)
+
+
+def encode_time(value) -> bytes:
+    """Accepts "HH:MM:SS" or (hours, minutes, seconds)."""
+    if isinstance(value, str):
+        value = [int(part) for part in value.split(":")]
+    hour, minute, second = value
+    return bytes([second, minute, hour])
+
+
+def encode_date(value) -> bytes:
+    """Accepts "YYYY-MM-DD" or a date."""
+    if isinstance(value, str):
+        value = date.fromisoformat(value)
+    return bytes([value.day, value.isoweekday(), value.month, value.year - 2000])
+
+
+def encode_duration(value) -> bytes:
+    """Minutes -> minutes + hours pair."""
+    value = int(value)
+    return bytes([value % 60, value // 60])
+
+
+DECODERS = {
+    "uint": decode_uint,
+    "ascii": decode_ascii,
+    "ipv4": decode_ipv4,
+    "bytes": decode_bytes,
+    "fw_version": decode_fw_version,
+    "machine_hours": decode_machine_hours,
+    "time": decode_time,
+    "date": decode_date,
+    "time_remaining": decode_time_remaining,
+    "duration": decode_duration,
+}
+
+ENCODERS = {
+    "uint": _encode_uint,
+    "ascii": _encode_ascii,
+    "ipv4": lambda length: encode_ipv4,
+    "bytes": lambda length: encode_bytes,
+    "time": lambda length: encode_time,
+    "date": lambda length: encode_date,
+    "duration": lambda length: encode_duration,
+}
+
+
+def _compile_register(key: str, spec: dict) -> Register:
+    param_id = int(key, 16)
+    reg_type = spec["type"]
+    if reg_type not in DECODERS:
+        raise ValueError(f"Register {key}: unknown type {reg_type}")
+
+    refresh = spec.get("refresh", "config")
+    if refresh not in REFRESH_CLASSES:
+        raise ValueError(f"Register {key}: unknown refresh class {refresh}")
+
+    length = spec.get("length")
+    encoder_factory = ENCODERS.get(reg_type)
+
+    return Register(
+        param_id=param_id,
+        name=spec["name"],
+        type=reg_type,
+        length=length,
+        unit=spec.get("unit"),
+        refresh=refresh,
+        property_name=spec.get("property") or None,
+        decoder=DECODERS[reg_type],
+        encoder=encoder_factory(length) if encoder_factory else None,
+    )
+
+
+def _load(name: str) -> dict:
+    """Load and compile a register file, following "extends"."""
+    with open(os.path.join(REGISTERS_DIR, f"{name}.json"), encoding="utf-8") as file:
+        spec = json.load(file)
+
+    if spec.get("version") != REGISTER_MAP_VERSION:
+        raise ValueError(f"Register map {name}: unsupported version {spec.get('version')}")
+
+    registers = dict(_load(spec["extends"])) if "extends" in spec else {}
+
+    for key in spec.get("exclude", []):
+        registers.pop(int(key, 16), None)
+
+    for key, reg_spec in spec.get("registers", {}).items():
+        register = _compile_register(key, reg_spec)
+        registers[register.param_id] = register
+
+    return registers
+
+
+def _load_models() -> dict:
+    models = {}
+    for filename in os.listdir(REGISTERS_DIR):
+        if filename.startswith("model_") and filename.endswith(".json"):
+            name = filename[:-5]
+            models[int(name[6:])] = _load(name)
+    return models
+
+
+def _property_params(registers: dict) -> dict:
+    return {
+        register.property_name: param_id
+        for param_id, register in registers.items()
+        if register.property_name
+    }
+
+
+COMMON_REGISTERS = _load("common")
+MODEL_REGISTERS = _load_models()
+COMMON_PROPERTIES = _property_params(COMMON_REGISTERS)
+MODEL_PROPERTIES = {model_id: _property_params(registers) for model_id, registers in MODEL_REGISTERS.items()}
+
+
+def register_map(model_id) -> dict:
+    """Return {param_id: Register} for the given unit type, falling back to the common map."""
+    return MODEL_REGISTERS.get(model_id, COMMON_REGISTERS)
+
+
+def property_map(model_id) -> dict:
+    """Return {property_name: param_id} for the given unit type, falling back to the common map."""
+    return MODEL_PROPERTIES.get(model_id, COMMON_PROPERTIES)
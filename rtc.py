@@ -0,0 +1,82 @@
+"""Offset-and-drift model of the Blauberg Vento real time clock"""
+
+from collections import deque
+from datetime import datetime, timedelta
+import time
+
+RTC_SAMPLE_INTERVAL = 6 * 60 * 60
+RTC_MAX_SAMPLES = 8
+
+
+class RtcDriftModel(object):
+    """
+    Predict the unit's RTC from a few samples instead of reading it every poll.
+
+    Each sample is the difference between the device clock and the local clock
+    at a given moment. A least-squares line through the samples gives the
+    current offset and the drift rate (seconds per second).
+    """
+
+    def __init__(self, sample_interval=RTC_SAMPLE_INTERVAL, max_samples=RTC_MAX_SAMPLES):
+        self._sample_interval = sample_interval
+        self._samples = deque(maxlen=max_samples)
+
+    def needs_sample(self, now=None) -> bool:
+        """True when the RTC registers should be read on this poll."""
+        if not self._samples:
+            return True
+        if now is None:
+            now = time.time()
+        return now - self._samples[-1][0] >= self._sample_interval
+
+    def add_sample(self, device_time: datetime, local_time: datetime = None, now=None):
+        """Record a device clock reading taken at local_time (defaults to now)."""
+        if local_time is None:
+            local_time = datetime.now()
+        if now is None:
+            now = time.time()
+        self._samples.append((now, (device_time - local_time).total_seconds()))
+
+    def reset(self):
+        """Forget all samples, e.g. after the clock has been set."""
+        self._samples.clear()
+
+    def _fit(self):
+        t0 = self._samples[-1][0]
+        xs = [t - t0 for t, _ in self._samples]
+        ys = [offset for _, offset in self._samples]
+        n = len(xs)
+
+        mean_x = sum(xs) / n
+        mean_y = sum(ys) / n
+        var_x = sum((x - mean_x) ** 2 for x in xs)
+        if var_x == 0:
+            return t0, mean_y, 0.0
+
+        drift = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / var_x
+        return t0, mean_y - drift * mean_x, drift
+
+    def offset(self, now=None) -> float | None:
+        """Predicted device clock minus local clock, in seconds."""
+        if not self._samples:
+            return None
+        if now is None:
+            now = time.time()
+        t0, offset, drift = self._fit()
+        return offset + drift * (now - t0)
+
+    @property
+    def drift(self) -> float | None:
+        """Drift rate in seconds per day."""
+        if not self._samples:
+            return None
+        return self._fit()[2] * 86400
+
+    def device_time(self, local_time: datetime = None, now=None) -> datetime | None:
+        """Predicted device clock at local_time (defaults to now)."""
+        offset = self.offset(now)
+        if offset is None:
+            return None
+        if local_time is None:
+            local_time = datetime.now()
+        return local_time + timedelta(seconds=offset)
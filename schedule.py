@@ -0,0 +1,102 @@
+"""Weekly schedule table of a Blauberg Vento unit"""
+
+# Schedule slots are read and written through parameter 0x0077. A read names
+# the slot (day, period); the reply and a write carry 6 bytes:
+#   day, period, speed, reserved, end minute, end hour
+SCHEDULE_PARAM = 0x0077
+
+DAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+DAY_GROUPS = {
+    "weekdays": DAYS[:5],
+    "weekends": DAYS[5:],
+    "all": DAYS,
+}
+PERIODS = (1, 2, 3, 4)
+SPEEDS = {
+    0: "standby",
+    1: "low",
+    2: "medium",
+    3: "high",
+}
+
+SLOT_SIZE = 3  # speed, end hour, end minute
+
+# Bytes per slot in a frame: size marker, parameter, value
+SLOT_READ_REQUEST_SIZE = 3 + 2
+SLOT_SIZE_ON_WIRE = 3 + 6
+
+
+def slots():
+    """All (day, period) pairs, day 0 is Monday."""
+    return [(day, period) for day in range(len(DAYS)) for period in PERIODS]
+
+
+def encode_slot_request(day: int, period: int) -> bytes:
+    return bytes([0xFE, 2, SCHEDULE_PARAM, day, period])
+
+
+def encode_slot(day: int, period: int, speed: int, hour: int, minute: int) -> bytes:
+    return bytes([0xFE, 6, SCHEDULE_PARAM, day, period, speed, 0, minute, hour])
+
+
+def decode_slot(value: bytes) -> tuple:
+    """6 value bytes -> (day, period, speed, hour, minute)"""
+    day, period, speed, _, minute, hour = value
+    return day, period, speed, hour, minute
+
+
+class ScheduleTable(object):
+    """
+    7 days x 4 periods of (speed, end hour, end minute), kept in one bytearray.
+    """
+
+    def __init__(self, data: bytes = None):
+        self._data = bytearray(data) if data is not None else bytearray(len(DAYS) * len(PERIODS) * SLOT_SIZE)
+
+    @staticmethod
+    def _offset(day: int, period: int) -> int:
+        if not 0 <= day < len(DAYS) or period not in PERIODS:
+            raise ValueError(f"invalid schedule slot {day}/{period}")
+        return (day * len(PERIODS) + period - 1) * SLOT_SIZE
+
+    def get(self, day: int, period: int) -> tuple:
+        """(speed, end hour, end minute)"""
+        offset = self._offset(day, period)
+        return tuple(self._data[offset:offset + SLOT_SIZE])
+
+    def set(self, day: int, period: int, speed: int, hour: int, minute: int):
+        offset = self._offset(day, period)
+        self._data[offset:offset + SLOT_SIZE] = bytes([speed, hour, minute])
+
+    def copy(self) -> "ScheduleTable":
+        return ScheduleTable(self._data)
+
+    def changed_slots(self, other: "ScheduleTable") -> list:
+        """(day, period) of every slot that differs in other."""
+        if self._data == other._data:
+            return []
+        return [
+            (day, period)
+            for day, period in slots()
+            if self.get(day, period) != other.get(day, period)
+        ]
+
+    def as_dict(self) -> dict:
+        """{day name: [{"period", "speed", "end"}]}"""
+        return {
+            name: [
+                {
+                    "period": period,
+                    "speed": SPEEDS.get(self.get(day, period)[0], self.get(day, period)[0]),
+                    "end": "{1:02d}:{2:02d}".format(*self.get(day, period)),
+                }
+                for period in PERIODS
+            ]
+            for day, name in enumerate(DAYS)
+        }
+
+    def __eq__(self, other):
+        return isinstance(other, ScheduleTable) and self._data == other._data
+
+    def __repr__(self):
+        return f"ScheduleTable({self._data.hex()})"
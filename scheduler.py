@@ -0,0 +1,145 @@
+"""Fleet poll scheduler for Blauberg Vento units."""
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+
+from homeassistant.core import HomeAssistant, CALLBACK_TYPE, callback
+
+from .const import DEFAULT_DEVICE_ID
+
+import logging
+_LOGGER = logging.getLogger(__name__)
+
+
+class BlaubergVentoScheduler:
+    """
+    Spread device polls evenly over the scan interval and cap in-flight requests.
+
+    Every device polls once per interval. The N registered devices are ranked
+    by device ID (config entry ID while the ID is unknown) and polled at
+    rank * interval / N, so they produce a steady trickle of requests instead
+    of a burst of N on every tick. The phases are recomputed whenever a device
+    is added or removed. All device I/O goes through async_run(), which holds
+    a global semaphore of max_concurrent slots.
+    """
+
+    def __init__(self, hass: HomeAssistant, interval: float, max_concurrent: int):
+        self.hass = hass
+        self.interval = interval
+        self.max_concurrent = max_concurrent
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._in_flight = 0
+        self._polling = {}
+        # coordinator -> rank key, and the timer of its next poll
+        self._keys = {}
+        self._handles = {}
+        self.overruns = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @staticmethod
+    def _rank_key(coordinator) -> tuple[str, str]:
+        device_id = coordinator.api.device_id
+        # Units on the default ID are ranked by their config entry instead
+        if device_id == DEFAULT_DEVICE_ID:
+            device_id = coordinator.entry_id
+        return device_id, coordinator.entry_id
+
+    def phase(self, coordinator) -> float:
+        """Offset of a registered device's poll within the interval: rank * interval / N."""
+        keys = sorted(self._keys.values())
+        return keys.index(self._keys[coordinator]) * self.interval / len(keys)
+
+    def _next_delay(self, phase: float) -> float:
+        """Delay until the device's next slot, aligned to the wall clock."""
+        now = time.time()
+        slot = math.floor((now - phase) / self.interval) + 1
+        return slot * self.interval + phase - now
+
+    async def async_run(self, job, *args):
+        """Run a blocking device request in the executor within the global cap."""
+        async with self._semaphore:
+            self._in_flight += 1
+            try:
+                return await self.hass.async_add_executor_job(job, *args)
+            finally:
+                self._in_flight -= 1
+
+    @callback
+    def async_register(self, coordinator) -> CALLBACK_TYPE:
+        """Start polling a coordinator and rebalance the phases. Returns the unregister callback."""
+        self._keys[coordinator] = self._rank_key(coordinator)
+        self._async_rebalance()
+
+        @callback
+        def _unregister():
+            self._keys.pop(coordinator, None)
+            handle = self._handles.pop(coordinator, None)
+            if handle is not None:
+                handle.cancel()
+            task = self._polling.pop(coordinator, None)
+            if task is not None:
+                task.cancel()
+            self._async_rebalance()
+
+        return _unregister
+
+    @callback
+    def _async_rebalance(self):
+        """(Re)schedule every registered device at the phase of its current rank."""
+        for coordinator in self._keys:
+            handle = self._handles.pop(coordinator, None)
+            if handle is not None:
+                handle.cancel()
+            phase = self.phase(coordinator)
+            self._async_schedule(coordinator, phase)
+            _LOGGER.debug(
+                "Polling %s every %ss at +%.1fs", coordinator.api.name, self.interval, phase
+            )
+
+    @callback
+    def _async_schedule(self, coordinator, phase: float):
+        loop = self.hass.loop
+        # Only the first slot is taken from the wall clock; later ones are kept on
+        # the loop's monotonic clock so an early wakeup or a clock step can't
+        # produce a second poll in the same slot.
+        target = loop.time() + self._next_delay(phase)
+
+        @callback
+        def _fire():
+            nonlocal target
+            target += self.interval
+            now = loop.time()
+            if target <= now:
+                # The loop was blocked for more than an interval - skip the missed slots
+                target += math.ceil((now - target) / self.interval) * self.interval
+            self._handles[coordinator] = loop.call_at(target, _fire)
+            self._async_start_poll(coordinator)
+
+        self._handles[coordinator] = loop.call_at(target, _fire)
+
+    @callback
+    def _async_start_poll(self, coordinator):
+        task = self._polling.get(coordinator)
+        if task is not None and not task.done():
+            # Previous cycle still running - skip this slot.
+            self.overruns += 1
+            coordinator.api.stats["overruns"] += 1
+            _LOGGER.warning(
+                "Poll of %s overran the %ss interval, skipping a cycle",
+                coordinator.api.name, self.interval,
+            )
+            return
+
+        self._polling[coordinator] = self.hass.async_create_background_task(
+            self._async_poll(coordinator), f"{coordinator.name} poll"
+        )
+
+    async def _async_poll(self, coordinator):
+        started = time.monotonic()
+        await coordinator.async_refresh()
+        coordinator.last_poll_duration = time.monotonic() - started
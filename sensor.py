@@ -1,351 +1,306 @@
-from homeassistant.components.sensor import SensorEntity, SensorStateClass, SensorDeviceClass
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.components.sensor import (
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+    SensorDeviceClass,
+)
 from homeassistant.helpers.entity import EntityCategory
 
 from .const import DOMAIN
+from .entity import BlaubergVentoEntity, device_info_for
+from .fan_api import BlaubergVentoApi
 
-class BlaubergVentoAlarmStatusSensor(SensorEntity):
-    """Sensor showing Blauberg Vento alarm status."""
-
-    def __init__(self, api, device_info):
-        self._api = api
-        self._attr_name = "Alarm status"
-        self._attr_unique_id = f"{device_info['device_id']}_alarm_status"
-        self._attr_entity_category = None
-        self._attr_icon = "mdi:help-circle-outline"
-        self._device_id = device_info["device_id"]
-        self._attr_native_unit_of_measurement = None
-        self._attr_state_class = None
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_info["device_id"])},
-        }
 
-    @property
-    def native_value(self):
-        alarm_status = getattr(self._api, "_alarm_status", None)
-
-        if alarm_status is None:
-            return "Unknown"
-
-        match alarm_status:
-            case 0:
-                return "OK"
-            case 1:
-                return "ALARM"
-            case 2:
-                return "Warning"
-            case _:
-                return "Unknown"
-
-    @property
-    def icon(self):
-        alarm_status = getattr(self._api, "_alarm_status", None)
-
-        if alarm_status == 0:
-            return "mdi:check-circle-outline"
-        elif alarm_status == 1:
-            return "mdi:alarm-light"
-        elif alarm_status == 2:
-            return "mdi:alert-outline"
-        else:
-            return "mdi:help-circle-outline"
+@dataclass(frozen=True, kw_only=True)
+class BlaubergVentoSensorEntityDescription(SensorEntityDescription):
+    """Sensor tied to one register of the unit's register map."""
 
-    @property
-    def available(self):
-        return True
-
-class BlaubergVentoFilterReplacementSensor(SensorEntity):
-    """Filter replacement sensor reported by the Blauberg Vento unit."""
-
-    def __init__(self, api, device_info):
-        self._api = api
-        self._attr_name = "Filter replacement"
-        self._attr_unique_id = f"{device_info['device_id']}_filter_replacement"
-        self._attr_native_unit_of_measurement = None
-        self._attr_icon = "mdi:air-filter"
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_info["device_id"])},
-        }
+    # Register the value comes from; None for values that don't need the device.
+    register: int | None
+    extra_registers: tuple[int, ...] = ()
+    value_fn: Callable[[BlaubergVentoApi], Any]
+    icon_fn: Callable[[BlaubergVentoApi], str | None] | None = None
 
-    @property
-    def native_value(self):
-        status = getattr(self._api, "_filter_replacement", None)
 
-        if status is None:
-            return None
-        elif status == 0:
+def _alarm_status(api):
+    match getattr(api, "_alarm_status", None):
+        case 0:
             return "OK"
-        elif status == 1:
-            return "Needs replacement"
+        case 1:
+            return "ALARM"
+        case 2:
+            return "Warning"
+        case _:
+            return "Unknown"
 
-        return None
 
-    @property
-    def icon(self):
-        """Return a context-aware icon."""
-        status = getattr(self._api, "_filter_replacement", None)
-        if status == 1:
-            # Red alert style
-            return "mdi:air-filter-alert"
-        elif status == 0:
-            # Clean/healthy filter
-            return "mdi:air-filter"
-        else:
-            # Indeterminate
-            return "mdi:air-filter-check"
+def _alarm_icon(api):
+    alarm_status = getattr(api, "_alarm_status", None)
 
-    @property
-    def available(self):
-        return True
-
-class BlaubergVentoFilterReplacementCountdownSensor(SensorEntity):
-    """Filter replacement sensor reported by the Blauberg Vento unit."""
-
-    def __init__(self, api, device_info):
-        self._api = api
-        self._attr_name = "Filter replacement countdown"
-        self._attr_unique_id = f"{device_info['device_id']}_filter_replacement_countdown"
-        self._attr_native_unit_of_measurement = "days"
-        self._attr_icon = "mdi:air-filter"
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_info["device_id"])},
-        }
+    if alarm_status == 0:
+        return "mdi:check-circle-outline"
+    elif alarm_status == 1:
+        return "mdi:alarm-light"
+    elif alarm_status == 2:
+        return "mdi:alert-outline"
+    else:
+        return "mdi:help-circle-outline"
 
-    @property
-    def native_value(self):
-        hrs = getattr(self._api, "_filter_replacement_countdown", None)
 
-        if hrs is None:
-            return None
+def _filter_replacement(api):
+    status = getattr(api, "_filter_replacement", None)
 
-        days = int(hrs // 24)
-        return days
+    if status == 0:
+        return "OK"
+    elif status == 1:
+        return "Needs replacement"
 
-    @property
-    def available(self):
-        return True
-
-class BlaubergVentoHumiditySensor(SensorEntity):
-    """Humidity reported by the Blauberg Vento unit."""
-
-    def __init__(self, api, device_info):
-        self._api = api
-        self._attr_name = "Humidity"
-        self._attr_unique_id = f"{device_info['device_id']}_humidity"
-        self._attr_device_class = SensorDeviceClass.HUMIDITY
-        self._attr_native_unit_of_measurement = "%"
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_icon = "mdi:water-percent"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_info["device_id"])},
-        }
+    return None
 
-    @property
-    def native_value(self):
-        return getattr(self._api, "_current_humidity", None)
 
-    @property
-    def available(self):
-        return True
-
-class BlaubergVentoDeviceIdSensor(SensorEntity):
-    """Sensor showing Blauberg Vento device ID (diagnostic)."""
-
-    def __init__(self, coordinator, device_info):
-        self._attr_name = "Device ID"
-        self._attr_unique_id = f"{device_info['device_id']}_device_id"
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
-        self._attr_icon = "mdi:identifier"
-        self._device_id = device_info["device_id"]
-        self._attr_native_unit_of_measurement = None
-        self._attr_state_class = None
-        self._attr_device_class = None
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_info["device_id"])},
-        }
+def _filter_replacement_icon(api):
+    status = getattr(api, "_filter_replacement", None)
+    if status == 1:
+        # Red alert style
+        return "mdi:air-filter-alert"
+    elif status == 0:
+        # Clean/healthy filter
+        return "mdi:air-filter"
+    else:
+        # Indeterminate
+        return "mdi:air-filter-check"
 
-    @property
-    def native_value(self):
-        return self._device_id
 
-    @property
-    def available(self):
-        return True
-
-class BlaubergVentoIPSensor(SensorEntity):
-    """Representation of the fan's IP address as a sensor."""
-
-    def __init__(self, api, device_info):
-        self._api = api
-        self._attr_name = "IP Address"
-        self._attr_unique_id = f"{device_info['device_id']}_device_ip"
-        self._attr_icon = "mdi:ip-network"
-        self._attr_native_unit_of_measurement = None
-        self._attr_state_class = None
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_info["device_id"])},
-        }
+def _filter_replacement_countdown(api):
+    hrs = getattr(api, "_filter_replacement_countdown", None)
 
-    @property
-    def native_value(self):
-        return getattr(self._api, "_device_network_ip", None)
+    if hrs is None:
+        return None
 
-    @property
-    def available(self):
-        return True
-
-class BlaubergVentoRTCBatteryVoltage(SensorEntity):
-    """Representation of the fan's RTC battery voltage."""
-
-    def __init__(self, api, device_info):
-        self._api = api
-        self._attr_name = "Batt voltage"
-        self._attr_unique_id = f"{device_info['device_id']}_rtc_batt_volage"
-        self._attr_icon = "mdi:battery"
-        self._attr_native_unit_of_measurement = "V"
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_info["device_id"])},
-        }
+    return int(hrs // 24)
 
-    @property
-    def native_value(self):
-        batt_voltage = getattr(self._api, "_battery_voltage", None)
 
-        if batt_voltage is None:
-            return None
+def _battery_voltage(api):
+    batt_voltage = getattr(api, "_battery_voltage", None)
 
-        return batt_voltage/1000
+    if batt_voltage is None:
+        return None
 
-    @property
-    def icon(self):
-        voltage = getattr(self._api, "_battery_voltage", None)
-        if voltage is None:
-            return "mdi:battery-unknown"
-
-        voltage_v = voltage / 1000
-        if voltage_v >= 3.1:
-            return "mdi:battery"
-        elif voltage_v >= 3.0:
-            return "mdi:battery-90"
-        elif voltage_v >= 2.8:
-            return "mdi:battery-70"
-        elif voltage_v >= 2.7:
-            return "mdi:battery-40"
-        elif voltage_v >= 2.5:
-            return "mdi:battery-10"
-        else:
-            return "mdi:battery-alert-variant-outline"
+    return batt_voltage / 1000
 
-    @property
-    def available(self):
-        return True
-
-class BlaubergVentoMachineHours(SensorEntity):
-    """Representation of the fan's machine hours."""
-
-    def __init__(self, api, device_info):
-        self._api = api
-        self._attr_name = "Machine hours"
-        self._attr_unique_id = f"{device_info['device_id']}_machine_hours"
-        self._attr_icon = "mdi:cog-counterclockwise"
-        self._attr_native_unit_of_measurement = "hrs"
-        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_info["device_id"])},
-        }
 
-    @property
-    def native_value(self):
-        hrs = getattr(self._api, "_machine_hours", None)
+def _battery_icon(api):
+    voltage = getattr(api, "_battery_voltage", None)
+    if voltage is None:
+        return "mdi:battery-unknown"
 
-        if hrs is None:
-            return None
+    voltage_v = voltage / 1000
+    if voltage_v >= 3.1:
+        return "mdi:battery"
+    elif voltage_v >= 3.0:
+        return "mdi:battery-90"
+    elif voltage_v >= 2.8:
+        return "mdi:battery-70"
+    elif voltage_v >= 2.7:
+        return "mdi:battery-40"
+    elif voltage_v >= 2.5:
+        return "mdi:battery-10"
+    else:
+        return "mdi:battery-alert-variant-outline"
 
-        return round(hrs / 60, 1)
 
-    @property
-    def available(self):
-        return True
-
-class BlaubergVentoRTCTime(SensorEntity):
-    """Representation of the fan's internal clock."""
-
-    def __init__(self, api, device_info):
-        self._api = api
-        self._attr_name = "RTC Time"
-        self._attr_unique_id = f"{device_info['device_id']}_rtc_datetime"
-        self._attr_icon = "mdi:clock"
-        self._attr_native_unit_of_measurement = None
-        self._attr_state_class = None
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_info["device_id"])},
-        }
+def _machine_hours(api):
+    minutes = getattr(api, "_machine_hours", None)
 
-    @property
-    def native_value(self):
-        date = getattr(self._api, "_rtc_date", None)
-        time = getattr(self._api, "_rtc_time", None)
+    if minutes is None:
+        return None
 
-        if date is None or time is None:
-            return None
+    return round(minutes / 60, 1)
 
-        return f"{date} {time}"
 
-    @property
-    def available(self):
-        return True
-
-class BlaubergVentoFan1Speed(SensorEntity):
-    """Representation of the fan's speed."""
-
-    def __init__(self, api, device_info):
-        self._api = api
-        self._attr_name = "Fan 1 Speed"
-        self._attr_unique_id = f"{device_info['device_id']}_fan1_speed"
-        self._attr_icon = "mdi:fan"
-        self._attr_native_unit_of_measurement = "rpm"
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_info["device_id"])},
-        }
+def _rtc_datetime(api):
+    # Served from the drift model, the RTC itself is only sampled now and then
+    device_time = api.rtc_model.device_time()
 
-    @property
-    def native_value(self):
-        return getattr(self._api, "_fan1_speed", None)
+    if device_time is None:
+        return None
 
-    @property
-    def available(self):
-        return True
-
-class BlaubergVentoFan2Speed(SensorEntity):
-    """Representation of the fan's speed."""
-
-    def __init__(self, api, device_info):
-        self._api = api
-        self._attr_name = "Fan 2 Speed"
-        self._attr_unique_id = f"{device_info['device_id']}_fan2_speed"
-        self._attr_icon = "mdi:fan"
-        self._attr_native_unit_of_measurement = "rpm"
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_info["device_id"])},
-        }
+    return device_time.strftime("%Y-%m-%d %H:%M:%S")
+
+
+SENSORS: tuple[BlaubergVentoSensorEntityDescription, ...] = (
+    BlaubergVentoSensorEntityDescription(
+        key="alarm_status",
+        name="Alarm status",
+        register=BlaubergVentoApi.FUNCTION_ALARM_STATUS,
+        value_fn=_alarm_status,
+        icon_fn=_alarm_icon,
+    ),
+    BlaubergVentoSensorEntityDescription(
+        key="humidity",
+        name="Humidity",
+        register=BlaubergVentoApi.FUNCTION_CURRENT_HUMIDITY,
+        device_class=SensorDeviceClass.HUMIDITY,
+        native_unit_of_measurement="%",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:water-percent",
+        value_fn=lambda api: getattr(api, "_current_humidity", None),
+    ),
+    BlaubergVentoSensorEntityDescription(
+        key="device_id",
+        name="Device ID",
+        register=None,
+        icon="mdi:identifier",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda api: api.device_id,
+    ),
+    BlaubergVentoSensorEntityDescription(
+        key="device_ip",
+        name="IP Address",
+        register=BlaubergVentoApi.FUNCTION_NET_DEVICE_IP,
+        icon="mdi:ip-network",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda api: getattr(api, "_device_network_ip", None),
+    ),
+    BlaubergVentoSensorEntityDescription(
+        key="rtc_batt_volage",
+        name="Batt voltage",
+        register=BlaubergVentoApi.FUNCTION_BATTERY_VOLTAGE,
+        native_unit_of_measurement="V",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=_battery_voltage,
+        icon_fn=_battery_icon,
+    ),
+    BlaubergVentoSensorEntityDescription(
+        key="machine_hours",
+        name="Machine hours",
+        register=BlaubergVentoApi.FUNCTION_MACHINE_HOURS,
+        icon="mdi:cog-counterclockwise",
+        native_unit_of_measurement="hrs",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=_machine_hours,
+    ),
+    BlaubergVentoSensorEntityDescription(
+        key="filter_replacement",
+        name="Filter replacement",
+        register=BlaubergVentoApi.FUNCTION_FILTER_REPLACEMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=_filter_replacement,
+        icon_fn=_filter_replacement_icon,
+    ),
+    BlaubergVentoSensorEntityDescription(
+        key="filter_replacement_countdown",
+        name="Filter replacement countdown",
+        register=BlaubergVentoApi.FUNCTION_FILTER_REPLACEMENT_COUNTDOWN,
+        icon="mdi:air-filter",
+        native_unit_of_measurement="days",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=_filter_replacement_countdown,
+    ),
+    BlaubergVentoSensorEntityDescription(
+        key="rtc_datetime",
+        name="RTC Time",
+        register=BlaubergVentoApi.FUNCTION_RTC_TIME,
+        extra_registers=(BlaubergVentoApi.FUNCTION_RTC_DATE,),
+        icon="mdi:clock",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=_rtc_datetime,
+    ),
+    BlaubergVentoSensorEntityDescription(
+        key="fan1_speed",
+        name="Fan 1 Speed",
+        register=BlaubergVentoApi.FUNCTION_FAN1_SPEED,
+        icon="mdi:fan",
+        native_unit_of_measurement="rpm",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda api: getattr(api, "_fan1_speed", None),
+    ),
+    BlaubergVentoSensorEntityDescription(
+        key="fan2_speed",
+        name="Fan 2 Speed",
+        register=BlaubergVentoApi.FUNCTION_FAN2_SPEED,
+        icon="mdi:fan",
+        native_unit_of_measurement="rpm",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda api: getattr(api, "_fan2_speed", None),
+    ),
+)
+
+# Registers represented by other entities (fan, sensors above) or by the
+# RTC sensor's second half - no generic sensor for these.
+COVERED_REGISTERS = {
+    BlaubergVentoApi.FUNCTION_DEVICE_ON,
+    BlaubergVentoApi.FUNCTION_FAN_SPEED_TRESHOLD,
+    BlaubergVentoApi.FUNCTION_OPERATION_MODE,
+    BlaubergVentoApi.FUNCTION_DEVICE_ID,
+    BlaubergVentoApi.FUNCTION_RTC_DATE,
+} | {description.register for description in SENSORS}
+
+
+def _generic_description(register) -> BlaubergVentoSensorEntityDescription:
+    """Description for a register without a hand-written sensor."""
+    prop = register.property_name
+    return BlaubergVentoSensorEntityDescription(
+        key=register.name,
+        name=register.name.replace("_", " ").capitalize(),
+        register=register.param_id,
+        native_unit_of_measurement=register.unit,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda api: getattr(api, prop, None),
+    )
+
+
+def sensor_descriptions(api) -> list[BlaubergVentoSensorEntityDescription]:
+    """Descriptions for every sensor the unit's register map supports."""
+    functions = api.functions
+    descriptions = [
+        description
+        for description in SENSORS
+        if description.register is None or description.register in functions
+    ]
+    descriptions.extend(
+        _generic_description(register)
+        for param_id, register in sorted(functions.items())
+        if param_id not in COVERED_REGISTERS
+        and register.property_name
+        and register.refresh != "command"
+    )
+    return descriptions
+
+
+class BlaubergVentoSensor(BlaubergVentoEntity, SensorEntity):
+    """Sensor reading one value from the Blauberg Vento unit."""
+
+    entity_description: BlaubergVentoSensorEntityDescription
+
+    def __init__(self, coordinator, device_info, device_id, description):
+        registers = description.extra_registers
+        if description.register is not None:
+            registers += (description.register,)
+        super().__init__(coordinator, device_info, registers)
+        self.entity_description = description
+        self._attr_unique_id = f"{device_id}_{description.key}"
 
     @property
     def native_value(self):
-        return getattr(self._api, "_fan2_speed", None)
+        return self.entity_description.value_fn(self._api)
 
     @property
-    def available(self):
-        return True
+    def icon(self):
+        if self.entity_description.icon_fn is not None:
+            return self.entity_description.icon_fn(self._api)
+        return super().icon
 
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
@@ -357,20 +312,11 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ):
     """Set up Blauberg Vento sensors."""
-    api = hass.data[DOMAIN][entry.entry_id]
+    coordinator = hass.data[DOMAIN][entry.entry_id]
     device_id = entry.data.get("device_id", "unknown")
+    device_info = device_info_for(device_id)
 
-    # Add your device ID sensor (and others in the future)
     async_add_entities([
-        BlaubergVentoAlarmStatusSensor(api, {"device_id": device_id}),
-        BlaubergVentoHumiditySensor(api, {"device_id": device_id}),
-        BlaubergVentoDeviceIdSensor(None, {"device_id": device_id}),
-        BlaubergVentoIPSensor(api, {"device_id": device_id}),
-        BlaubergVentoRTCBatteryVoltage(api, {"device_id": device_id}),
-        BlaubergVentoMachineHours(api, {"device_id": device_id}),
-        BlaubergVentoFilterReplacementSensor(api, {"device_id": device_id}),
-        BlaubergVentoFilterReplacementCountdownSensor(api, {"device_id": device_id}),
-        BlaubergVentoRTCTime(api, {"device_id": device_id}),
-        BlaubergVentoFan1Speed(api, {"device_id": device_id}),
-        BlaubergVentoFan2Speed(api, {"device_id": device_id}),
-    ], True)
\ No newline at end of file
+        BlaubergVentoSensor(coordinator, device_info, device_id, description)
+        for description in sensor_descriptions(coordinator.api)
+    ])
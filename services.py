@@ -0,0 +1,293 @@
+"""Services for the Blauberg Vento integration."""
+from __future__ import annotations
+
+import asyncio
+import time
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.service import async_extract_config_entry_ids
+
+from .const import (
+    DOMAIN,
+    SERVICE_SET_GROUP,
+    SERVICE_READ_PARAMETERS,
+    SERVICE_WRITE_PARAMETERS,
+    SERVICE_SET_SCHEDULE,
+    GROUP_MAX_PARALLEL,
+)
+from .fan_api import BlaubergVentoApi
+from . import schedule
+
+import logging
+_LOGGER = logging.getLogger(__name__)
+
+SPEED_KEYS = {
+    name: key
+    for key, name in BlaubergVentoApi.FAN_SPEEDS.items()
+    if BlaubergVentoApi.FAN_SPEED_RANGE[0] <= key <= BlaubergVentoApi.FAN_SPEED_RANGE[1]
+}
+MODE_KEYS = {name: key for key, name in BlaubergVentoApi.FAN_MODES.items()}
+
+SET_GROUP_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional("power"): cv.boolean,
+            vol.Optional("speed"): vol.In(list(SPEED_KEYS)),
+            vol.Optional("mode"): vol.In(list(MODE_KEYS)),
+        },
+        extra=vol.ALLOW_EXTRA,
+    ),
+    cv.has_at_least_one_key("power", "speed", "mode"),
+)
+
+
+def _param_id(value) -> int:
+    """Accept parameter IDs as int or as decimal/hex string (e.g. "0x0025")."""
+    if isinstance(value, str):
+        value = int(value, 0)
+    value = vol.Coerce(int)(value)
+    if not 0 <= value <= 0xFFFF:
+        raise vol.Invalid(f"parameter ID out of range: {value}")
+    return value
+
+
+READ_PARAMETERS_SCHEMA = vol.Schema(
+    {
+        vol.Required("parameters"): vol.All(cv.ensure_list, [_param_id]),
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+WRITE_PARAMETERS_SCHEMA = vol.Schema(
+    {
+        vol.Required("values"): vol.All(
+            dict,
+            vol.Length(min=1),
+            {_param_id: vol.Any(int, str)},
+        ),
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+
+SCHEDULE_SPEED_KEYS = {name: key for key, name in schedule.SPEEDS.items()}
+
+
+def _days(value) -> list:
+    """Day names and groups (weekdays, weekends, all) -> sorted day numbers."""
+    days = set()
+    for name in cv.ensure_list(value):
+        name = vol.In([*schedule.DAYS, *schedule.DAY_GROUPS])(str(name).lower())
+        for day in schedule.DAY_GROUPS.get(name, (name,)):
+            days.add(schedule.DAYS.index(day))
+    return sorted(days)
+
+
+SET_SCHEDULE_SCHEMA = vol.Schema(
+    {
+        vol.Required("days"): _days,
+        vol.Required("period"): vol.All(vol.Coerce(int), vol.In(schedule.PERIODS)),
+        vol.Required("speed"): vol.In(list(SCHEDULE_SPEED_KEYS)),
+        vol.Required("end"): cv.time,
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+
+def _format_values(values: dict) -> dict:
+    """Make decoded register values JSON friendly for service responses."""
+    return {
+        f"0x{param:04X}": value.hex(" ") if isinstance(value, bytes) else value
+        for param, value in sorted(values.items())
+    }
+
+
+async def _async_coordinators_for_call(hass: HomeAssistant, call: ServiceCall) -> list:
+    """Resolve the service target (devices, entities, areas) to device coordinators."""
+    entry_ids = await async_extract_config_entry_ids(hass, call)
+    coordinators = [
+        hass.data[DOMAIN][entry_id]
+        for entry_id in entry_ids
+        if entry_id in hass.data.get(DOMAIN, {})
+    ]
+    if not coordinators:
+        raise HomeAssistantError("No Blauberg Vento devices found for the given target")
+    return coordinators
+
+
+async def _async_fan_out(hass: HomeAssistant, coordinators: list, service: str, job, capped=True) -> list:
+    """
+    Run job(api) in the executor for every device, at most GROUP_MAX_PARALLEL at a time.
+    Jobs go through the fleet-wide request cap unless capped is False (single
+    frame writes that should reach all devices within one round trip).
+    Returns one result dict per device with success, latency and the job's result.
+    Entities are updated from whatever the devices echoed back.
+    """
+    semaphore = asyncio.Semaphore(GROUP_MAX_PARALLEL)
+
+    async def _run(coordinator):
+        api = coordinator.api
+        async with semaphore:
+            started = time.monotonic()
+            result = None
+            try:
+                if capped:
+                    result = await coordinator.async_run(job, api)
+                else:
+                    result = await hass.async_add_executor_job(job, api)
+                error = None
+            except Exception as err:  # noqa: BLE001 - report per device
+                _LOGGER.warning("%s failed for %s: %s", service, api.name, err)
+                error = str(err) or type(err).__name__
+
+            coordinator.async_update_listeners()
+
+            return {
+                "device_id": api.device_id,
+                "name": api.name,
+                "success": error is None,
+                "latency_ms": round((time.monotonic() - started) * 1000, 1),
+                "error": error,
+                "result": result,
+            }
+
+    return list(await asyncio.gather(*(_run(coordinator) for coordinator in coordinators)))
+
+
+async def _async_handle_set_group(hass: HomeAssistant, call: ServiceCall):
+    """Apply power/speed/mode to many devices at once, one frame per device."""
+    coordinators = await _async_coordinators_for_call(hass, call)
+
+    power = call.data.get("power")
+    speed = SPEED_KEYS.get(call.data.get("speed"))
+    mode = MODE_KEYS.get(call.data.get("mode"))
+
+    def _apply(api):
+        if api.set_state(power, speed, mode) != 0:
+            raise TimeoutError("no response")
+
+    # One frame per device - not held back by the poll cap (max_concurrent_requests)
+    results = await _async_fan_out(hass, coordinators, SERVICE_SET_GROUP, _apply, capped=False)
+    for result in results:
+        result.pop("result")
+
+    return {"devices": results}
+
+
+async def _async_handle_read_parameters(hass: HomeAssistant, call: ServiceCall):
+    """Read arbitrary parameters from the target devices."""
+    coordinators = await _async_coordinators_for_call(hass, call)
+    params = call.data["parameters"]
+
+    def _read(api):
+        return _format_values(api.read_parameters(params))
+
+    results = await _async_fan_out(hass, coordinators, SERVICE_READ_PARAMETERS, _read)
+    for result in results:
+        result["values"] = result.pop("result")
+
+    return {"devices": results}
+
+
+def _encode_values(api: BlaubergVentoApi, values: dict) -> dict:
+    """Encode values with the device's register map, before anything is sent."""
+    encoded = {}
+    for param, value in values.items():
+        try:
+            encoded[param] = api.encode_value(param, value)
+        except (ValueError, TypeError, OverflowError) as err:
+            raise HomeAssistantError(
+                f"Invalid value {value!r} for parameter 0x{param:04X} of {api.name}: {err}"
+            ) from err
+    return encoded
+
+
+async def _async_handle_write_parameters(hass: HomeAssistant, call: ServiceCall):
+    """Write arbitrary parameters to the target devices."""
+    coordinators = await _async_coordinators_for_call(hass, call)
+    # Register maps differ by model, so encode per device - but for all of them up front
+    encoded = {
+        coordinator.api: _encode_values(coordinator.api, call.data["values"])
+        for coordinator in coordinators
+    }
+
+    def _write(api):
+        return _format_values(api.write_parameters(encoded[api]))
+
+    results = await _async_fan_out(hass, coordinators, SERVICE_WRITE_PARAMETERS, _write)
+    for result in results:
+        result["values"] = result.pop("result")
+
+    return {"devices": results}
+
+
+async def _async_handle_set_schedule(hass: HomeAssistant, call: ServiceCall):
+    """Set a schedule period on the target devices, writing only what changed."""
+    coordinators = await _async_coordinators_for_call(hass, call)
+    speed = SCHEDULE_SPEED_KEYS[call.data["speed"]]
+    end = call.data["end"]
+    slots = {
+        (day, call.data["period"]): (speed, end.hour, end.minute)
+        for day in call.data["days"]
+    }
+
+    def _set(api):
+        return api.set_schedule(slots)
+
+    results = await _async_fan_out(hass, coordinators, SERVICE_SET_SCHEDULE, _set)
+    for result in results:
+        result["slots_written"] = result.pop("result")
+
+    return {"devices": results}
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register integration services."""
+
+    async def handle_set_group(call: ServiceCall):
+        return await _async_handle_set_group(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_GROUP,
+        handle_set_group,
+        schema=SET_GROUP_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def handle_read_parameters(call: ServiceCall):
+        return await _async_handle_read_parameters(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_READ_PARAMETERS,
+        handle_read_parameters,
+        schema=READ_PARAMETERS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def handle_write_parameters(call: ServiceCall):
+        return await _async_handle_write_parameters(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_WRITE_PARAMETERS,
+        handle_write_parameters,
+        schema=WRITE_PARAMETERS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def handle_set_schedule(call: ServiceCall):
+        return await _async_handle_set_schedule(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_SCHEDULE,
+        handle_set_schedule,
+        schema=SET_SCHEDULE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
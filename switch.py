@@ -42,7 +42,10 @@ class BlaubergVentoFan(FanEntity):
 
     async def async_update(self):
         """Fetch the latest state from the device."""
-        await self.hass.async_add_executor_job(self._api.update_status)
+        await self.hass.async_add_executor_job(
+            self._api.read_parameters,
+            [self._api.FUNCTION_DEVICE_ON, self._api.FUNCTION_FAN_SPEED_TRESHOLD],
+        )
 
         self._attr_is_on = self._api._device_on
         self._attr_percentage = self._api._fan_speed_treshold
@@ -77,7 +80,7 @@ async def async_setup_entry(hass: HomeAssistant,
 ):
 
     """Set up Blauberg Vento control pane."""
-    api = hass.data[DOMAIN][entry.entry_id]
+    api = hass.data[DOMAIN][entry.entry_id].api
     device_id = entry.data.get("device_id", "unknown")
 
     async_add_entities([
@@ -0,0 +1,191 @@
+"""
+Shared fixtures: the integration package and a fake Blauberg Vento unit.
+
+The repository is the integration package itself (custom_components/
+blauberg_vento), so it is registered as blauberg_vento here. Only the protocol
+modules are tested; none of them needs Home Assistant.
+"""
+
+import importlib.util
+from pathlib import Path
+import socket
+import sys
+import threading
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+if "blauberg_vento" not in sys.modules:
+    _spec = importlib.util.spec_from_file_location(
+        "blauberg_vento", ROOT / "__init__.py", submodule_search_locations=[str(ROOT)]
+    )
+    _package = importlib.util.module_from_spec(_spec)
+    sys.modules["blauberg_vento"] = _package
+    _spec.loader.exec_module(_package)
+
+from blauberg_vento.fan_api import BlaubergVentoApi  # noqa: E402
+from blauberg_vento import schedule  # noqa: E402
+
+DEVICE_ID = "ABCDEFGHIJKLMNOP"
+PASSWORD = "1111"
+
+
+def build_frame(block: bytes, command=BlaubergVentoApi.CONTROLLER_RESPONSE, device_id=DEVICE_ID) -> bytes:
+    """A complete frame as sent by a unit: header, command, data block, checksum."""
+    body = (
+        b"\x02\x10"
+        + device_id.encode("ascii")
+        + bytes([len(PASSWORD)])
+        + PASSWORD.encode("ascii")
+        + bytes([command])
+        + block
+    )
+    checksum = sum(body) & 0xFFFF
+    return BlaubergVentoApi.PACKET_BEGIN + body + checksum.to_bytes(2, "little")
+
+
+def encode_block(values) -> bytes:
+    """
+    {param_id: bytes or None (unsupported)}, or a list of such pairs -> data
+    block with page and size markers.
+    """
+    block = b""
+    page = 0x00
+    for param, value in values.items() if isinstance(values, dict) else values:
+        if param >> 8 != page:
+            page = param >> 8
+            block += bytes([0xFF, page])
+        if value is None:
+            block += bytes([0xFD, param & 0xFF])
+        elif len(value) != 1:
+            block += bytes([0xFE, len(value), param & 0xFF]) + value
+        else:
+            block += bytes([param & 0xFF]) + value
+    return block
+
+
+def decode_request(block: bytes, with_values: bool) -> dict:
+    """Data block of a request -> {param_id: bytes} (None values for reads)."""
+    return dict(decode_pairs(block, with_values))
+
+
+def decode_pairs(block: bytes, with_values: bool) -> list:
+    """
+    Data block of a request -> [(param_id, bytes)]. Reads carry no values,
+    except after a size marker (e.g. the slot of a schedule read).
+    """
+    values = []
+    page = 0x00
+    size = None
+    i = 0
+    while i < len(block):
+        b = block[i]
+        if b == 0xFF:
+            page = block[i + 1]
+            i += 2
+        elif b == 0xFE:
+            size = block[i + 1]
+            i += 2
+        else:
+            param = (page << 8) | b
+            i += 1
+            if with_values or size is not None:
+                size = size or 1
+                values.append((param, block[i:i + size]))
+                i += size
+            else:
+                values.append((param, None))
+            size = None
+    return values
+
+
+class FakeUnit(object):
+    """
+    A unit answering on a localhost UDP port.
+
+    registers holds {param_id: bytes}; parameters missing from it are answered
+    as unsupported. Writes to a parameter in `stuck` are acknowledged but not
+    applied. Datagrams in `before_reply` are sent ahead of the next reply;
+    a `silent` unit sends nothing else. The weekly schedule is kept in
+    `schedule`, a schedule.ScheduleTable; written slots are listed in
+    `schedule_writes`.
+    """
+
+    def __init__(self, registers=None):
+        self.registers = dict(registers or {})
+        self.schedule = schedule.ScheduleTable()
+        self.schedule_writes = []
+        self.stuck = set()
+        self.before_reply = []
+        self.silent = False
+        self.requests = []
+
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.bind(("127.0.0.1", 0))
+        self._socket.settimeout(0.1)
+        self.port = self._socket.getsockname()[1]
+        self._running = True
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def api(self, **kwargs) -> BlaubergVentoApi:
+        api = BlaubergVentoApi("127.0.0.1", port=self.port, device_id=DEVICE_ID, password=PASSWORD, **kwargs)
+        api.timeout = 0.5
+        return api
+
+    def stop(self):
+        self._running = False
+        self._thread.join()
+        self._socket.close()
+
+    def _serve(self):
+        while self._running:
+            try:
+                packet, address = self._socket.recvfrom(BlaubergVentoApi.MAX_PACKET_SIZE)
+            except socket.timeout:
+                continue
+
+            id_len = packet[3]
+            command_pos = 5 + id_len + packet[4 + id_len]
+            command = packet[command_pos]
+            block = packet[command_pos + 1:-2]
+            writes = command in (BlaubergVentoApi.COMMAND_WRITE, BlaubergVentoApi.COMMAND_WRITETHANREAD)
+            pairs = decode_pairs(block, with_values=writes)
+            self.requests.append((command, dict(pairs)))
+
+            reply = []
+            for param, value in pairs:
+                if param == schedule.SCHEDULE_PARAM:
+                    reply.append((param, self._schedule_slot(value, writes)))
+                    continue
+                if writes and param in self.registers and param not in self.stuck:
+                    self.registers[param] = value
+                reply.append((param, self.registers.get(param)))
+
+            for datagram in self.before_reply:
+                self._socket.sendto(datagram, address)
+            self.before_reply = []
+            if not self.silent:
+                self._socket.sendto(build_frame(encode_block(reply)), address)
+
+    def _schedule_slot(self, value: bytes, write: bool) -> bytes:
+        day, period = value[0], value[1]
+        if write:
+            _, _, speed, hour, minute = schedule.decode_slot(value)
+            self.schedule.set(day, period, speed, hour, minute)
+            self.schedule_writes.append((day, period))
+        speed, hour, minute = self.schedule.get(day, period)
+        return schedule.encode_slot(day, period, speed, hour, minute)[3:]
+
+
+@pytest.fixture
+def unit():
+    fake = FakeUnit({
+        BlaubergVentoApi.FUNCTION_DEVICE_ON: b"\x01",
+        BlaubergVentoApi.FUNCTION_FAN_SPEED_TRESHOLD: b"\x01",
+        BlaubergVentoApi.FUNCTION_OPERATION_MODE: b"\x00",
+        BlaubergVentoApi.FUNCTION_CURRENT_HUMIDITY: b"\x28",
+    })
+    yield fake
+    fake.stop()
@@ -0,0 +1,129 @@
+"""Protocol tests for BlaubergVentoApi against a fake unit."""
+
+import pytest
+
+from blauberg_vento.fan_api import BlaubergVentoApi, BlaubergVentoWriteError
+
+SPEED = BlaubergVentoApi.FUNCTION_FAN_SPEED_TRESHOLD
+MODE = BlaubergVentoApi.FUNCTION_OPERATION_MODE
+HUMIDITY = BlaubergVentoApi.FUNCTION_CURRENT_HUMIDITY
+HUMIDITY_THRESHOLD = 0x0019
+NIGHT_TIMER = 0x0302
+
+
+def test_read_parameters(unit):
+    api = unit.api()
+    values = api.read_parameters([SPEED, HUMIDITY])
+    assert dict(values) == {SPEED: 1, HUMIDITY: 40}
+
+
+def test_write_many_returns_echo(unit):
+    api = unit.api()
+    echoed = api.write_many({SPEED: 3, MODE: 2})
+
+    assert dict(echoed) == {SPEED: 3, MODE: 2}
+    assert len(unit.requests) == 1
+
+
+def test_write_many_retransmits_only_mismatched(unit):
+    api = unit.api()
+    unit.stuck.add(MODE)
+
+    with pytest.raises(BlaubergVentoWriteError) as excinfo:
+        api.write_many({SPEED: 3, MODE: 2})
+
+    assert excinfo.value.mismatched == {MODE: (b"\x02", b"\x00")}
+    # First frame carries both, every retransmission only the mismatched one
+    assert len(unit.requests) == 1 + api.WRITE_RETRIES
+    assert set(unit.requests[0][1]) == {SPEED, MODE}
+    for _, request in unit.requests[1:]:
+        assert request == {MODE: b"\x02"}
+    assert unit.registers[SPEED] == b"\x03"
+
+
+def test_write_many_recovers_after_retransmission(unit):
+    api = unit.api()
+    requests = unit.requests
+
+    # The unit only takes the value on the retransmission
+    class Unstick(set):
+        def __contains__(self, param):
+            return len(requests) < 2 and set.__contains__(self, param)
+
+    unit.stuck = Unstick({MODE})
+    echoed = api.write_many({SPEED: 3, MODE: 2})
+
+    assert dict(echoed) == {SPEED: 3, MODE: 2}
+    assert len(unit.requests) == 2
+    assert unit.requests[1][1] == {MODE: b"\x02"}
+
+
+def test_write_many_unsupported_parameter_is_not_retransmitted(unit):
+    api = unit.api()
+
+    with pytest.raises(BlaubergVentoWriteError) as excinfo:
+        api.write_many({SPEED: 2, HUMIDITY_THRESHOLD: 60})
+
+    assert excinfo.value.mismatched == {HUMIDITY_THRESHOLD: (bytes([60]), None)}
+    assert len(unit.requests) == 1
+
+
+def test_probe_timeout_is_per_request_and_spares_health(unit):
+    api = unit.api()
+    unit.silent = True
+
+    with pytest.raises(TimeoutError):
+        api.probe(timeout=0.1, attempts=2)
+
+    assert api.timeout == 0.5
+    assert api.stats["timeouts"] == 2
+    assert api.health.consecutive_failures == 0
+    assert api.health.available
+
+
+def test_encode_write_block_adds_page_and_size_markers(unit):
+    api = unit.api()
+    block = api._encode_write_block({NIGHT_TIMER: b"\x0f\x02", SPEED: b"\x02", 0x0304: b"\x01"})
+
+    assert block == bytes([0x02, 0x02, 0xFF, 0x03, 0xFE, 0x02, 0x02, 0x0F, 0x02, 0x04, 0x01])
+
+
+def test_write_many_encodes_by_register_type(unit):
+    api = unit.api()
+    unit.registers[NIGHT_TIMER] = b"\x00\x00"
+
+    echoed = api.write_many({SPEED: 2, NIGHT_TIMER: 135, 0x0025: b"\x30"})
+
+    assert len(unit.requests) == 1
+    assert unit.requests[0][1] == {SPEED: b"\x02", HUMIDITY: b"\x30", NIGHT_TIMER: bytes([15, 2])}
+    assert echoed[NIGHT_TIMER] == 135
+    assert echoed[SPEED] == 2
+
+
+@pytest.mark.parametrize("value", ["soon", -1, 256])
+def test_write_many_rejects_values_that_do_not_fit(unit, value):
+    api = unit.api()
+
+    with pytest.raises((ValueError, TypeError, OverflowError)):
+        api.write_many({SPEED: value})
+    assert unit.requests == []
+
+
+def test_write_many_rejects_oversized_frame(unit):
+    api = unit.api()
+
+    with pytest.raises(ValueError):
+        api.write_many({param: b"\x00" * 8 for param in range(1, 40)})
+    assert unit.requests == []
+
+
+def test_write_parameters_splits_frames(unit):
+    api = unit.api()
+    # Parameters unknown to the register map take any size
+    values = {0x0A00 + index: b"\x00" * 8 for index in range(40)}
+    unit.registers.update(values)
+
+    echoed = api.write_parameters(values)
+
+    assert len(unit.requests) > 1
+    assert set(echoed.raw) == set(values)
@@ -0,0 +1,83 @@
+"""Tests for the per-device health state machine."""
+
+import time
+
+import pytest
+
+from blauberg_vento.fan_api import BlaubergVentoApi, BlaubergVentoUnavailableError
+from blauberg_vento.health import DEGRADED, HEALTHY, OPEN, DeviceHealth
+
+
+def test_starts_healthy():
+    health = DeviceHealth()
+    assert health.state == HEALTHY
+    assert health.available
+    assert health.allow_request(now=0)
+
+
+def test_failures_degrade_then_open():
+    health = DeviceHealth(degraded_after=1, open_after=3, probe_interval=60)
+
+    health.record_failure(now=0)
+    assert health.state == DEGRADED
+    assert health.allow_request(now=0)
+
+    health.record_failure(now=1)
+    assert health.state == DEGRADED
+
+    health.record_failure(now=2)
+    assert health.state == OPEN
+    assert not health.available
+    assert health.consecutive_failures == 3
+
+
+def test_open_breaker_allows_one_probe_per_interval():
+    health = DeviceHealth(open_after=1, probe_interval=60)
+    health.record_failure(now=0)
+
+    assert not health.allow_request(now=59)
+    assert health.allow_request(now=60)
+    assert not health.allow_request(now=61)
+    assert health.allow_request(now=120)
+
+
+def test_failed_probe_keeps_breaker_open():
+    health = DeviceHealth(open_after=1, probe_interval=60)
+    health.record_failure(now=0)
+
+    assert health.allow_request(now=60)
+    health.record_failure(now=60)
+    assert health.state == OPEN
+    assert not health.allow_request(now=100)
+
+
+def test_success_closes_breaker():
+    health = DeviceHealth(open_after=1, probe_interval=60)
+    health.record_failure(now=0)
+    health.record_success()
+
+    assert health.state == HEALTHY
+    assert health.consecutive_failures == 0
+    assert health.allow_request(now=1)
+
+
+def test_open_breaker_fails_requests_without_sending(unit):
+    api = unit.api()
+    api.timeout = 0.1
+    api.health = DeviceHealth(open_after=3, probe_interval=0.3)
+    block = api._encode_read_block([BlaubergVentoApi.FUNCTION_DEVICE_ON])
+    unit.silent = True
+
+    for _ in range(3):
+        assert api.request(api.COMMAND_READ, None, block) is None
+    assert api.health.state == OPEN
+
+    with pytest.raises(BlaubergVentoUnavailableError):
+        api.request(api.COMMAND_READ, None, block)
+    assert len(unit.requests) == 3
+
+    # The first request after the probe interval goes out and closes the breaker
+    unit.silent = False
+    time.sleep(0.3)
+    assert api.request(api.COMMAND_READ, None, block) is not None
+    assert api.health.state == HEALTHY
@@ -0,0 +1,40 @@
+"""Tests for the humidity boost loop run by BlaubergVentoApi.poll()."""
+
+from blauberg_vento.fan_api import BlaubergVentoApi
+from blauberg_vento.humidity_boost import HumidityBoost
+
+STATUS = [
+    BlaubergVentoApi.FUNCTION_DEVICE_ON,
+    BlaubergVentoApi.FUNCTION_FAN_SPEED_TRESHOLD,
+    BlaubergVentoApi.FUNCTION_OPERATION_MODE,
+    BlaubergVentoApi.FUNCTION_CURRENT_HUMIDITY,
+]
+
+
+def test_boost_starts_and_restores(unit):
+    api = unit.api()
+    api.humidity_boost = HumidityBoost(threshold=60, boost_speed=3, min_on_time=0)
+    unit.registers[BlaubergVentoApi.FUNCTION_CURRENT_HUMIDITY] = b"\x50"
+
+    api.poll(STATUS)
+    assert api.humidity_boost.active
+    assert unit.registers[BlaubergVentoApi.FUNCTION_FAN_SPEED_TRESHOLD] == b"\x03"
+
+    unit.registers[BlaubergVentoApi.FUNCTION_CURRENT_HUMIDITY] = b"\x28"
+    api.poll(STATUS)
+    assert not api.humidity_boost.active
+    assert unit.registers[BlaubergVentoApi.FUNCTION_FAN_SPEED_TRESHOLD] == b"\x01"
+
+
+def test_rejected_boost_write_does_not_fail_the_poll(unit):
+    api = unit.api()
+    api.humidity_boost = HumidityBoost(threshold=60)
+    unit.registers[BlaubergVentoApi.FUNCTION_CURRENT_HUMIDITY] = b"\x50"
+    unit.stuck.add(BlaubergVentoApi.FUNCTION_FAN_SPEED_TRESHOLD)
+
+    values = api.poll(STATUS)
+
+    assert values[BlaubergVentoApi.FUNCTION_CURRENT_HUMIDITY] == 0x50
+    assert not api.humidity_boost.active
+    # The read, then the write and its retransmissions
+    assert len(unit.requests) == 1 + 1 + api.WRITE_RETRIES
@@ -0,0 +1,68 @@
+"""Tests for lazy decoding and the per-raw-value decode cache."""
+
+import pytest
+
+from blauberg_vento import registers
+from blauberg_vento.fan_api import BlaubergVentoApi, LazyValues
+
+HUMIDITY = BlaubergVentoApi.FUNCTION_CURRENT_HUMIDITY
+SPEED = BlaubergVentoApi.FUNCTION_FAN_SPEED_TRESHOLD
+
+
+@pytest.fixture
+def decoded(monkeypatch):
+    """Raw values the humidity register has decoded, in order."""
+    calls = []
+    register = registers.COMMON_REGISTERS[HUMIDITY]
+
+    def decoder(raw):
+        calls.append(raw)
+        return register.decoder(raw)
+
+    monkeypatch.setitem(registers.COMMON_REGISTERS, HUMIDITY, register._replace(decoder=decoder))
+    return calls
+
+
+def test_values_are_decoded_on_lookup(unit, decoded):
+    api = unit.api()
+    values = api.read_parameters([SPEED, HUMIDITY], max_age=0)
+
+    assert isinstance(values, LazyValues)
+    assert values.raw == {SPEED: b"\x01", HUMIDITY: b"\x28"}
+    assert decoded == []
+
+    assert values[HUMIDITY] == 40
+    assert values[HUMIDITY] == 40
+    assert api._current_humidity == 40
+    assert decoded == [b"\x28"]
+
+
+def test_unchanged_value_keeps_its_decoding(unit, decoded):
+    api = unit.api()
+    api.read_parameters([HUMIDITY], max_age=0)[HUMIDITY]
+
+    values = api.read_parameters([HUMIDITY], max_age=0)
+
+    assert values[HUMIDITY] == 40
+    assert decoded == [b"\x28"]
+
+
+def test_changed_value_is_decoded_again(unit, decoded):
+    api = unit.api()
+    assert api.read_parameters([HUMIDITY], max_age=0)[HUMIDITY] == 40
+
+    unit.registers[HUMIDITY] = b"\x3c"
+    api.read_parameters([HUMIDITY], max_age=0)
+
+    assert api._current_humidity == 60
+    assert decoded == [b"\x28", b"\x3c"]
+
+
+def test_unsupported_and_unknown_parameters(unit):
+    api = unit.api()
+    unit.registers[0x0A01] = b"\x12\x34"
+
+    values = api.read_parameters([0x0019, 0x0A01], max_age=0)
+
+    assert values[0x0019] is None
+    assert values[0x0A01] == "12 34"
@@ -0,0 +1,73 @@
+"""Tests for the poll latency budget."""
+
+import time
+
+import pytest
+
+from blauberg_vento.fan_api import BlaubergVentoApi
+
+SPEED = BlaubergVentoApi.FUNCTION_FAN_SPEED_TRESHOLD
+HUMIDITY = BlaubergVentoApi.FUNCTION_CURRENT_HUMIDITY
+BATTERY = 0x0024
+FAN1 = 0x004A
+NIGHT_TIMER = 0x0302
+PARAMS = [SPEED, HUMIDITY, BATTERY, FAN1, NIGHT_TIMER]
+
+
+@pytest.fixture
+def api(unit):
+    unit.registers.update({BATTERY: b"\x10\x0e", FAN1: b"\xe8\x03", NIGHT_TIMER: b"\x00\x01"})
+    api = unit.api()
+    # Room for the two priority registers, one two-byte register per further frame
+    api.MAX_PACKET_SIZE = api._frame_overhead() + 7
+    return api
+
+
+def estimates(api, *values):
+    """Make the frame estimates return values in turn (the last one repeats)."""
+    values = list(values)
+    api._frame_estimate = lambda: values.pop(0) if len(values) > 1 else values[0]
+
+
+def test_plentiful_budget_is_one_packed_read(unit):
+    api = unit.api()
+
+    values = api.poll(PARAMS, deadline=time.monotonic() + 10)
+
+    assert len(unit.requests) == 1
+    assert set(unit.requests[0][1]) == set(PARAMS)
+    assert set(values) == set(PARAMS)
+    assert api.last_deferred == []
+
+
+def test_spent_budget_reads_priority_registers_only(unit, api):
+    estimates(api, 1.0)
+
+    values = api.poll(PARAMS, deadline=time.monotonic() + 0.5)
+
+    assert [request for _, request in unit.requests] == [{SPEED: None, HUMIDITY: None}]
+    assert set(values) == {SPEED, HUMIDITY}
+    assert sorted(api.last_deferred) == [BATTERY, FAN1, NIGHT_TIMER]
+    assert api.stats["deferred"] == 3
+
+
+def test_stalest_frames_are_read_first(unit, api):
+    api.read_parameters([FAN1], max_age=0)
+    api.read_parameters([NIGHT_TIMER], max_age=0)
+    del unit.requests[:]
+
+    # Too slow for everything, room for one frame besides the priority one
+    estimates(api, 1.0, 0.0, 10.0)
+    values = api.poll(PARAMS, deadline=time.monotonic() + 1.0)
+
+    # The battery voltage was never read, the night timer is the freshest
+    assert [set(request) for _, request in unit.requests] == [{SPEED, HUMIDITY}, {BATTERY}]
+    assert set(values) == {SPEED, HUMIDITY, BATTERY}
+    assert api.last_deferred == [FAN1, NIGHT_TIMER]
+
+    # The next poll catches up on what was deferred
+    estimates(api, 1.0, 0.0, 10.0)
+    api.poll(PARAMS, deadline=time.monotonic() + 1.0)
+    assert set(unit.requests[-1][1]) == {FAN1}
+    assert api.last_deferred == [NIGHT_TIMER, BATTERY]
+    assert api.stats["deferred"] == 4
@@ -0,0 +1,94 @@
+"""Tests for the rate-limited manual speed ramp."""
+
+import asyncio
+
+from blauberg_vento.ramp import SpeedRamp
+
+
+def create_task(coro, name):
+    return asyncio.get_running_loop().create_task(coro, name=name)
+
+
+class Writes(list):
+    """Records (loop time, value) of every write."""
+
+    async def __call__(self, value):
+        self.append((asyncio.get_running_loop().time(), value))
+
+
+async def finish(ramp):
+    while ramp.running:
+        await asyncio.sleep(0.01)
+
+
+def test_steps_toward_target_at_most_once_per_interval():
+    async def run():
+        writes = Writes()
+        ramp = SpeedRamp(writes, create_task, interval=0.05, step=25)
+        ramp.set_target(100, current=30)
+        await finish(ramp)
+        return writes
+
+    writes = asyncio.run(run())
+
+    assert [value for _, value in writes] == [55, 80, 100]
+    times = [time for time, _ in writes]
+    assert all(later - earlier >= 0.05 for earlier, later in zip(times, times[1:]))
+
+
+def test_unknown_current_speed_writes_target_directly():
+    async def run():
+        writes = Writes()
+        ramp = SpeedRamp(writes, create_task, interval=0.05, step=25)
+        ramp.set_target(300)
+        await finish(ramp)
+        return writes
+
+    assert [value for _, value in asyncio.run(run())] == [255]
+
+
+def test_newest_target_wins():
+    async def run():
+        writes = Writes()
+        ramp = SpeedRamp(writes, create_task, interval=0.05, step=25)
+        ramp.set_target(200, current=0)
+        await asyncio.sleep(0)
+        # Slider dragged on - intermediate targets are never written
+        for target in (150, 100, 40):
+            ramp.set_target(target, current=0)
+        await finish(ramp)
+        return writes
+
+    assert [value for _, value in asyncio.run(run())] == [25, 40]
+
+
+def test_cancel_stops_the_ramp():
+    async def run():
+        writes = Writes()
+        ramp = SpeedRamp(writes, create_task, interval=0.1, step=25)
+        ramp.set_target(255, current=0)
+        await asyncio.sleep(0.15)
+        ramp.cancel()
+        await asyncio.sleep(0.2)
+        return ramp, writes
+
+    ramp, writes = asyncio.run(run())
+
+    assert not ramp.running
+    assert [value for _, value in writes] == [25, 50]
+
+
+def test_failed_write_ends_the_ramp():
+    async def run():
+        async def write(value):
+            raise TimeoutError("No response")
+
+        ramp = SpeedRamp(write, create_task, interval=0.05, step=25)
+        ramp.set_target(100, current=0)
+        await finish(ramp)
+        return ramp
+
+    ramp = asyncio.run(run())
+
+    assert not ramp.running
+    assert ramp.target == 100
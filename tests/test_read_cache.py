@@ -0,0 +1,121 @@
+"""Tests for the read cache and single-flight reads."""
+
+import threading
+
+from blauberg_vento.fan_api import BlaubergVentoApi
+
+HUMIDITY = BlaubergVentoApi.FUNCTION_CURRENT_HUMIDITY
+SPEED = BlaubergVentoApi.FUNCTION_FAN_SPEED_TRESHOLD
+MODE = BlaubergVentoApi.FUNCTION_OPERATION_MODE
+
+
+def test_fresh_values_are_served_from_the_cache(unit):
+    api = unit.api(cache_ttl=60)
+    api.read_parameters([SPEED, HUMIDITY])
+
+    values = api.read_parameters([SPEED, HUMIDITY])
+
+    assert dict(values) == {SPEED: 1, HUMIDITY: 40}
+    assert len(unit.requests) == 1
+
+
+def test_only_stale_values_are_read(unit):
+    api = unit.api(cache_ttl=60)
+    api.read_parameters([SPEED])
+
+    api.read_parameters([SPEED, HUMIDITY])
+
+    assert len(unit.requests) == 2
+    assert unit.requests[1][1] == {HUMIDITY: None}
+
+
+def test_max_age_zero_bypasses_the_cache(unit):
+    api = unit.api(cache_ttl=60)
+    api.read_parameters([HUMIDITY])
+
+    api.read_parameters([HUMIDITY], max_age=0)
+
+    assert len(unit.requests) == 2
+
+
+def test_write_expires_the_cache(unit):
+    api = unit.api(cache_ttl=60)
+    api.read_parameters([SPEED, HUMIDITY])
+
+    api.write_many({MODE: 1})
+    api.read_parameters([SPEED, HUMIDITY])
+
+    assert len(unit.requests) == 3
+
+
+def test_reply_to_a_read_overtaken_by_a_write_is_not_cached(unit):
+    api = unit.api(cache_ttl=60)
+
+    original_receive = api.receive
+
+    def receive(timeout=None):
+        # A write goes out while the read waits for its reply
+        with api._cache_lock:
+            api._generation += 1
+        return original_receive(timeout)
+
+    api.receive = receive
+    values = api.read_parameters([HUMIDITY])
+    api.receive = original_receive
+
+    assert values[HUMIDITY] == 40
+    api.read_parameters([HUMIDITY])
+    assert len(unit.requests) == 2
+
+
+def test_concurrent_reads_share_one_request(unit):
+    api = unit.api(cache_ttl=60)
+    started = threading.Event()
+    release = threading.Event()
+    original_receive = api.receive
+
+    def receive(timeout=None):
+        started.set()
+        release.wait(2)
+        return original_receive(timeout)
+
+    api.receive = receive
+    results = {}
+    first = threading.Thread(target=lambda: results.setdefault("first", api.read_parameters([HUMIDITY], max_age=0)))
+    first.start()
+    assert started.wait(2)
+
+    # Joins the read in flight instead of sending its own
+    second = threading.Thread(target=lambda: results.setdefault("second", api.read_parameters([HUMIDITY], max_age=0)))
+    second.start()
+    second.join(0.2)
+    assert second.is_alive()
+
+    release.set()
+    first.join(2)
+    second.join(2)
+
+    assert len(unit.requests) == 1
+    assert results["first"][HUMIDITY] == results["second"][HUMIDITY] == 40
+
+
+def test_joined_read_reports_the_timeout(unit):
+    api = unit.api(cache_ttl=60)
+    unit.silent = True
+    api.timeout = 0.3
+    errors = []
+
+    def read():
+        try:
+            api.read_parameters([HUMIDITY])
+        except TimeoutError as err:
+            errors.append(err)
+
+    threads = [threading.Thread(target=read) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(2)
+
+    assert len(errors) == 2
+    assert len(unit.requests) == 1
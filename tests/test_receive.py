@@ -0,0 +1,72 @@
+"""Tests for reply validation on the receive path."""
+
+import pytest
+
+from blauberg_vento.fan_api import BlaubergVentoApi
+
+from conftest import DEVICE_ID, build_frame, encode_block
+
+SPEED = BlaubergVentoApi.FUNCTION_FAN_SPEED_TRESHOLD
+HUMIDITY = BlaubergVentoApi.FUNCTION_CURRENT_HUMIDITY
+
+
+def test_stale_and_foreign_replies_are_discarded(unit):
+    api = unit.api()
+    unit.before_reply = [
+        # Late reply to an earlier humidity read
+        build_frame(encode_block({HUMIDITY: b"\x10"})),
+        # Right parameter, another unit
+        build_frame(encode_block({SPEED: b"\x03"}), device_id="ZZZZZZZZZZZZZZZZ"),
+        # Corrupt checksum
+        build_frame(encode_block({SPEED: b"\x03"}))[:-1] + b"\x00",
+    ]
+
+    assert dict(api.read_parameters([SPEED])) == {SPEED: 1}
+    assert api.stats["discarded"] == 3
+    assert api.stats["timeouts"] == 0
+
+
+def test_stale_reply_is_not_taken_for_a_missing_one(unit):
+    api = unit.api()
+    unit.silent = True
+    unit.before_reply = [build_frame(encode_block({HUMIDITY: b"\x10"}))]
+
+    assert api.request(api.COMMAND_READ, None, api._encode_read_block([SPEED])) is None
+    assert api.stats["discarded"] == 1
+    assert api.stats["timeouts"] == 1
+
+
+@pytest.mark.parametrize(
+    "block, expected",
+    [
+        (bytes([0x25]), 0x0025),
+        (bytes([0xFF, 0x03, 0x02]), 0x0302),
+        (bytes([0xFE, 0x02, 0x77, 0x00, 0x01]), 0x0077),
+        (bytes([0xFD, 0x19]), 0x0019),
+        (bytes([0xFF, 0x03, 0xFE, 0x02, 0x02, 0x10, 0x00]), 0x0302),
+        (b"", None),
+        (bytes([0xFC]), None),
+    ],
+)
+def test_first_param(block, expected):
+    assert BlaubergVentoApi._first_param(block) == expected
+
+
+def test_is_reply():
+    api = BlaubergVentoApi("127.0.0.1", device_id=DEVICE_ID, password="1111")
+    api._outstanding = SPEED
+    reply = build_frame(encode_block({SPEED: b"\x01"}))
+
+    assert api._is_reply(reply)
+    assert not api._is_reply(reply[:-1] + bytes([reply[-1] ^ 1]))
+    assert not api._is_reply(build_frame(encode_block({HUMIDITY: b"\x01"})))
+    assert not api._is_reply(build_frame(encode_block({SPEED: b"\x01"}), device_id="ZZZZZZZZZZZZZZZZ"))
+    assert not api._is_reply(build_frame(encode_block({SPEED: b"\x01"}), command=api.COMMAND_READ))
+    assert not api._is_reply(b"\xfd\xfd\x02")
+    assert not api._is_reply(b"garbage")
+
+
+def test_is_reply_accepts_any_unit_with_default_device_id():
+    api = BlaubergVentoApi("127.0.0.1", password="1111")
+    api._outstanding = SPEED
+    assert api._is_reply(build_frame(encode_block({SPEED: b"\x01"}), device_id="ZZZZZZZZZZZZZZZZ"))
@@ -0,0 +1,108 @@
+"""Tests for the register map files and value codecs."""
+
+import json
+
+import pytest
+
+from blauberg_vento import registers
+
+
+def _write(directory, name, spec):
+    (directory / f"{name}.json").write_text(json.dumps(spec), encoding="utf-8")
+
+
+@pytest.fixture
+def register_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(registers, "REGISTERS_DIR", str(tmp_path))
+    _write(tmp_path, "base", {
+        "version": 1,
+        "registers": {
+            "0x0001": {"name": "device_on", "type": "uint", "length": 1, "property": "_device_on", "refresh": "status"},
+            "0x0025": {"name": "current_humidity", "type": "uint", "length": 1, "refresh": "status"},
+            "0x004B": {"name": "fan2_speed", "type": "uint", "length": 2, "refresh": "diagnostic"},
+        },
+    })
+    return tmp_path
+
+
+def test_shipped_model_maps_extend_common():
+    common = registers.COMMON_REGISTERS
+    model_27 = registers.register_map(27)
+
+    assert 0x004B in common
+    assert 0x004B not in model_27
+    assert model_27[0x0001] is not None
+    assert set(model_27) == set(common) - {0x004B}
+
+
+def test_unknown_model_falls_back_to_common():
+    assert registers.register_map(None) is registers.COMMON_REGISTERS
+    assert registers.property_map(12345) is registers.COMMON_PROPERTIES
+    assert registers.COMMON_PROPERTIES["_device_on"] == 0x0001
+
+
+def test_load_compiles_registers(register_dir):
+    loaded = registers._load("base")
+
+    register = loaded[0x0001]
+    assert register.name == "device_on"
+    assert register.property_name == "_device_on"
+    assert register.refresh == "status"
+    assert register.decoder(b"\x01") == 1
+    assert register.encoder(1) == b"\x01"
+    # refresh defaults to config
+    assert loaded[0x004B].refresh == "diagnostic"
+
+
+def test_extends_exclude_and_override(register_dir):
+    _write(register_dir, "child", {
+        "version": 1,
+        "extends": "base",
+        "exclude": ["0x004B"],
+        "registers": {
+            "0x0025": {"name": "humidity", "type": "uint", "length": 1, "refresh": "diagnostic"},
+            "0x0302": {"name": "night_mode_timer", "type": "duration", "length": 2},
+        },
+    })
+
+    loaded = registers._load("child")
+
+    assert set(loaded) == {0x0001, 0x0025, 0x0302}
+    assert loaded[0x0025].name == "humidity"
+    assert loaded[0x0302].refresh == "config"
+    # The parent map is not modified
+    assert 0x004B in registers._load("base")
+
+
+@pytest.mark.parametrize(
+    "spec, message",
+    [
+        ({"version": 2, "registers": {}}, "unsupported version"),
+        ({"version": 1, "registers": {"0x0001": {"name": "x", "type": "float"}}}, "unknown type"),
+        ({"version": 1, "registers": {"0x0001": {"name": "x", "type": "uint", "refresh": "hourly"}}}, "unknown refresh"),
+    ],
+)
+def test_invalid_register_files(register_dir, spec, message):
+    _write(register_dir, "broken", spec)
+    with pytest.raises(ValueError, match=message):
+        registers._load("broken")
+
+
+@pytest.mark.parametrize(
+    "reg_type, length, value, raw",
+    [
+        ("uint", 2, 300, b"\x2c\x01"),
+        ("ascii", 4, "ab", b"ab\x00\x00"),
+        ("ipv4", 4, "192.168.1.10", bytes([192, 168, 1, 10])),
+        ("duration", 2, 135, bytes([15, 2])),
+    ],
+)
+def test_codecs_round_trip(reg_type, length, value, raw):
+    encoded = registers.ENCODERS[reg_type](length)(value)
+    assert encoded == raw
+    assert registers.DECODERS[reg_type](encoded) == value
+
+
+def test_bytes_from_hex():
+    assert registers.bytes_from_hex("0x1F00") == b"\x1f\x00"
+    assert registers.bytes_from_hex(" 1f 00 ") == b"\x1f\x00"
@@ -0,0 +1,72 @@
+"""Tests for the RTC offset and drift model."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from blauberg_vento.fan_api import BlaubergVentoApi
+from blauberg_vento.registers import encode_date, encode_time
+from blauberg_vento.rtc import RtcDriftModel
+
+RTC_TIME = BlaubergVentoApi.FUNCTION_RTC_TIME
+RTC_DATE = BlaubergVentoApi.FUNCTION_RTC_DATE
+
+LOCAL = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def test_needs_sample():
+    model = RtcDriftModel(sample_interval=100)
+    assert model.needs_sample(now=0)
+
+    model.add_sample(LOCAL, LOCAL, now=0)
+    assert not model.needs_sample(now=99)
+    assert model.needs_sample(now=100)
+
+
+def test_empty_model():
+    model = RtcDriftModel()
+    assert model.offset(now=0) is None
+    assert model.drift is None
+    assert model.device_time(LOCAL, now=0) is None
+
+
+def test_constant_offset():
+    model = RtcDriftModel()
+    model.add_sample(LOCAL + timedelta(seconds=30), LOCAL, now=0)
+    assert model.offset(now=1000) == pytest.approx(30)
+    assert model.drift == 0
+    assert model.device_time(LOCAL, now=1000) == LOCAL + timedelta(seconds=30)
+
+
+def test_drift_is_extrapolated():
+    model = RtcDriftModel()
+    # Device clock gains 1 s per day
+    for day in range(4):
+        now = day * 86400
+        model.add_sample(LOCAL + timedelta(seconds=10 + day), LOCAL, now=now)
+
+    assert model.drift == pytest.approx(1)
+    assert model.offset(now=5 * 86400) == pytest.approx(15)
+
+
+def test_reset():
+    model = RtcDriftModel()
+    model.add_sample(LOCAL, LOCAL, now=0)
+    model.reset()
+    assert model.offset(now=0) is None
+    assert model.needs_sample(now=0)
+
+
+def test_poll_samples_the_rtc_and_sync_resets_the_model(unit):
+    api = unit.api()
+    device = (datetime.now() + timedelta(hours=1)).replace(microsecond=0)
+    unit.registers[RTC_TIME] = encode_time((device.hour, device.minute, device.second))
+    unit.registers[RTC_DATE] = encode_date(device.date())
+
+    api.poll([RTC_TIME, RTC_DATE])
+    assert api.rtc_model.offset() == pytest.approx(3600, abs=2)
+    assert not api.rtc_model.needs_sample()
+
+    assert api.sync_time() == 0
+    assert api.rtc_model.offset() is None
+    assert unit.registers[RTC_DATE][3] == datetime.now().year - 2000
@@ -0,0 +1,93 @@
+"""Tests for the weekly schedule table and slot encoding."""
+
+import pytest
+
+from blauberg_vento import schedule
+from blauberg_vento.schedule import ScheduleTable
+
+
+def test_slots_cover_the_week():
+    slots = schedule.slots()
+    assert len(slots) == len(schedule.DAYS) * len(schedule.PERIODS)
+    assert slots[0] == (0, 1)
+    assert slots[-1] == (6, 4)
+
+
+def test_encode_slot_request():
+    assert schedule.encode_slot_request(2, 3) == bytes([0xFE, 2, schedule.SCHEDULE_PARAM, 2, 3])
+
+
+def test_encode_decode_slot_round_trip():
+    encoded = schedule.encode_slot(4, 2, 3, 22, 15)
+    assert len(encoded) == schedule.SLOT_SIZE_ON_WIRE
+    assert encoded[:3] == bytes([0xFE, 6, schedule.SCHEDULE_PARAM])
+    assert schedule.decode_slot(encoded[3:]) == (4, 2, 3, 22, 15)
+
+
+def test_table_get_set():
+    table = ScheduleTable()
+    table.set(0, 1, 2, 7, 30)
+    assert table.get(0, 1) == (2, 7, 30)
+    assert table.get(0, 2) == (0, 0, 0)
+
+
+@pytest.mark.parametrize("day, period", [(-1, 1), (7, 1), (0, 0), (0, 5)])
+def test_table_rejects_invalid_slots(day, period):
+    with pytest.raises(ValueError):
+        ScheduleTable().get(day, period)
+
+
+def test_changed_slots():
+    table = ScheduleTable()
+    other = table.copy()
+    assert table.changed_slots(other) == []
+
+    other.set(1, 2, 3, 8, 0)
+    other.set(6, 4, 1, 23, 59)
+    assert table.changed_slots(other) == [(1, 2), (6, 4)]
+    # copy() is independent of the original
+    assert table.get(1, 2) == (0, 0, 0)
+
+
+def test_as_dict():
+    table = ScheduleTable()
+    table.set(5, 1, 1, 9, 5)
+    saturday = table.as_dict()["saturday"]
+    assert saturday[0] == {"period": 1, "speed": "low", "end": "09:05"}
+    assert saturday[1] == {"period": 2, "speed": "standby", "end": "00:00"}
+
+
+def test_read_schedule(unit):
+    api = unit.api()
+    unit.schedule.set(3, 2, 1, 18, 45)
+
+    table = api.read_schedule()
+
+    assert table == unit.schedule
+    assert api.schedule is table
+    # 28 slots in as few frames as the reply size allows
+    assert len(unit.requests) == 2
+
+
+def test_set_schedule_writes_only_changed_slots(unit):
+    api = unit.api()
+    api.read_schedule()
+    # Changed on the unit's panel after the table was cached
+    unit.schedule.set(0, 1, 2, 7, 30)
+    unit.requests.clear()
+
+    written = api.set_schedule({(0, 1): (2, 7, 30), (1, 1): (2, 7, 30)})
+
+    assert written == 1
+    assert unit.schedule_writes == [(1, 1)]
+    assert api.schedule == unit.schedule
+    # Read back of the target slots, then one write frame
+    assert len(unit.requests) == 2
+
+
+def test_set_schedule_without_changes_sends_no_write(unit):
+    api = unit.api()
+    unit.schedule.set(2, 3, 3, 12, 0)
+
+    assert api.set_schedule({(2, 3): (3, 12, 0)}) == 0
+    assert unit.schedule_writes == []
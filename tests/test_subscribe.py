@@ -0,0 +1,76 @@
+"""Tests for change subscriptions."""
+
+from blauberg_vento.fan_api import BlaubergVentoApi
+
+SPEED = BlaubergVentoApi.FUNCTION_FAN_SPEED_TRESHOLD
+MODE = BlaubergVentoApi.FUNCTION_OPERATION_MODE
+HUMIDITY = BlaubergVentoApi.FUNCTION_CURRENT_HUMIDITY
+
+
+def test_callback_per_changed_parameter(unit):
+    api = unit.api()
+    calls = []
+    api.subscribe([SPEED, HUMIDITY], lambda param, value: calls.append((param, value)))
+
+    api.read_parameters([SPEED, MODE, HUMIDITY], max_age=0)
+    assert sorted(calls) == [(SPEED, 1), (HUMIDITY, 40)]
+
+    # Unchanged values are not reported again
+    del calls[:]
+    unit.registers[HUMIDITY] = b"\x3c"
+    unit.registers[MODE] = b"\x01"
+    api.read_parameters([SPEED, MODE, HUMIDITY], max_age=0)
+    assert calls == [(HUMIDITY, 60)]
+
+
+def test_coalesced_callback_once_per_response(unit):
+    api = unit.api()
+    batches = []
+    api.subscribe([SPEED, MODE], lambda values: batches.append(dict(values)), coalesce=True)
+
+    api.write_many({SPEED: 3, MODE: 2})
+
+    assert batches == [{SPEED: 3, MODE: 2}]
+
+
+def test_subscribe_to_every_parameter(unit):
+    api = unit.api()
+    batches = []
+    api.subscribe(None, lambda values: batches.append(dict(values)), coalesce=True)
+
+    api.read_parameters([SPEED, HUMIDITY], max_age=0)
+    api.read_parameters([SPEED, HUMIDITY], max_age=0)
+
+    assert batches == [{SPEED: 1, HUMIDITY: 40}]
+
+
+def test_unsubscribe(unit):
+    api = unit.api()
+    kept = []
+    dropped = []
+    api.subscribe([SPEED], lambda param, value: kept.append(value))
+    unsubscribe = api.subscribe([SPEED], lambda param, value: dropped.append(value))
+
+    api.read_parameters([SPEED], max_age=0)
+    unsubscribe()
+    unit.registers[SPEED] = b"\x02"
+    api.read_parameters([SPEED], max_age=0)
+
+    assert kept == [1, 2]
+    assert dropped == [1]
+
+
+def test_failing_callback_does_not_break_others(unit):
+    api = unit.api()
+    calls = []
+
+    def fail(param, value):
+        raise RuntimeError("subscriber bug")
+
+    api.subscribe([SPEED], fail)
+    api.subscribe([SPEED], lambda param, value: calls.append(value))
+
+    values = api.read_parameters([SPEED], max_age=0)
+
+    assert values[SPEED] == 1
+    assert calls == [1]